@@ -1,12 +1,10 @@
 import streamlit as st
 import streamlit_lottie
-import requests
-import json
 import pandas as pd
-import time
 from datetime import datetime
 import os
 import sys
+import logging
 
 # Add the project root to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -19,13 +17,21 @@ from ui.components import (
     render_personality_quiz,
     render_weekly_tracker,
     render_voice_chat,
-    render_resume_builder
+    render_resume_builder,
+    render_career_plan_download,
+    add_chat_turn,
+    reset_chat_pages,
+    get_career_database
 )
-from ui.animations import load_lottie_animation
-from database.career_db import CareerDatabase
+from ui.animations import load_lottie_animation, get_animation_url
 from utils.nlp_utils import preprocess_text
 from utils.sentiment import analyze_sentiment
-from utils.pdf_generator import generate_career_plan_pdf
+from utils.rasa_client import RasaClient, RasaUnavailableError, RasaResponseError
+from utils.latency import LatencyRecorder
+from utils.response_cache import ResponseCache, conversation_state, custom_payload
+from utils.local_responder import local_responses
+
+logger = logging.getLogger(__name__)
 
 # Page configuration
 st.set_page_config(
@@ -50,20 +56,32 @@ if 'current_view' not in st.session_state:
 if 'selected_career' not in st.session_state:
     st.session_state.selected_career = None
 
-# Initialize database connection
+# Database shared with the UI components and the recommender
+db = get_career_database()
+
+# Rasa client with a keep-alive connection pool, shared across sessions
+@st.cache_resource
+def get_rasa_client():
+    return RasaClient()
+
+# Rasa replies to repeated messages, shared across sessions
 @st.cache_resource
-def init_database():
-    return CareerDatabase()
+def get_response_cache():
+    return ResponseCache()
 
-db = init_database()
+# Chat turn latencies (time to first chunk and total), shared across sessions
+@st.cache_resource
+def get_latency_recorder():
+    return LatencyRecorder()
 
 # Sidebar navigation
 with st.sidebar:
     st.title("🧠 AI Career Counselor")
     
     # Load and display animation
-    lottie_animation = load_lottie_animation("https://assets5.lottiefiles.com/packages/lf20_khzniaya.json")
-    streamlit_lottie.st_lottie(lottie_animation, height=200)
+    lottie_animation = load_lottie_animation(get_animation_url("welcome"))
+    if lottie_animation:
+        streamlit_lottie.st_lottie(lottie_animation, height=200)
     
     st.markdown("### Navigation")
     nav_option = st.radio(
@@ -92,6 +110,8 @@ with st.sidebar:
         # Reset button
         if st.button("Reset Session"):
             st.session_state.messages = []
+            st.session_state.chat_has_older = False
+            reset_chat_pages()
             st.session_state.user_profile = {
                 'name': '',
                 'interests': [],
@@ -149,7 +169,7 @@ def render_chat_view():
     # Accept user input outside of columns
     if prompt := st.chat_input("What's on your mind about your career?"):
         # Add user message to chat history
-        st.session_state.messages.append({"role": "user", "content": prompt})
+        add_chat_turn("user", prompt)
 
         # Display user message in chat message container
         with st.chat_message("user"):
@@ -160,45 +180,59 @@ def render_chat_view():
             message_placeholder = st.empty()
             full_response = ""
 
-            # Simulate stream of response with a typing indicator
-            # In production, this would be replaced with the actual response from Rasa
-            # response = send_message_to_rasa(prompt)
-
-            # For now, we'll use a placeholder response
-            response = "I understand you're interested in exploring career options. Could you tell me more about your interests and skills? This will help me provide more personalized guidance."
-
-            # Simulate typing
-            for chunk in response.split():
-                full_response += chunk + " "
-                time.sleep(0.05)
+            # Render the reply as each Rasa message arrives
+            timer = get_latency_recorder().start_turn()
+            for chunk in stream_rasa_response(prompt):
+                timer.mark_chunk()
+                full_response += chunk
                 message_placeholder.markdown(full_response + "▌")
-
+            latency = timer.finish()
             message_placeholder.markdown(full_response)
 
         # Add assistant response to chat history
-        st.session_state.messages.append({"role": "assistant", "content": full_response})
+        add_chat_turn("assistant", full_response, latency=latency)
 
 def set_selected_career(career_title):
     st.session_state.selected_career = career_title
     st.experimental_rerun()
 
 def download_career_plan(career_title):
-    career = db.get_career_by_title(career_title)
-    pdf_path = generate_career_plan_pdf(career, st.session_state.user_profile)
-    
-    with open(pdf_path, "rb") as file:
-        btn = st.download_button(
-            label="Download Career Plan",
-            data=file,
-            file_name=f"{career_title.replace(' ', '_')}_career_plan.pdf",
-            mime="application/pdf"
-        )
-    
-    # Remove the temporary file
-    os.remove(pdf_path)
+    render_career_plan_download(career_title, st.session_state.user_profile)
 
-def send_message_to_rasa(message_text):
-    """Send a message to the Rasa server and get the response"""
+def apply_rasa_custom_payload(response):
+    """Update the user profile from a Rasa custom payload (career suggestions, interests, name)"""
+    # Rasa sends custom payloads as objects; older actions sent JSON strings
+    custom_data = custom_payload(response)
+    if "careers" in custom_data:
+        st.session_state.user_profile['suggested_careers'] = custom_data["careers"]
+    if "interests" in custom_data:
+        st.session_state.user_profile['interests'] = custom_data["interests"]
+    if "name" in custom_data:
+        st.session_state.user_profile['name'] = custom_data["name"]
+
+def stream_with_local_fallback(processed_text, message_text, sentiment, answered_locally):
+    """
+    Yield Rasa's bot responses as they arrive, or the local responder's if
+    Rasa is unavailable before replying (True is then appended to answered_locally)
+    """
+    replied = False
+    try:
+        for resp in get_rasa_client().stream_message(processed_text):
+            replied = True
+            yield resp
+    except RasaUnavailableError as e:
+        if replied:
+            raise
+        logger.warning(f"Rasa unavailable, answering locally: {str(e)}")
+        answered_locally.append(True)
+        yield from local_responses(message_text, sentiment, st.session_state.user_profile['interests'])
+
+def stream_rasa_response(message_text):
+    """
+    Send a message to the Rasa server and yield the reply text as each bot message arrives.
+    
+    If Rasa is unavailable before it has replied, the local responder answers instead.
+    """
     try:
         # Preprocess the text
         processed_text = preprocess_text(message_text)
@@ -207,38 +241,44 @@ def send_message_to_rasa(message_text):
         sentiment = analyze_sentiment(message_text)
         st.session_state.user_profile['sentiment'] = sentiment
         
-        # Send to Rasa
-        rasa_url = "http://localhost:5005/webhooks/rest/webhook"
-        response = requests.post(
-            rasa_url,
-            json={"sender": "user", "message": processed_text}
-        )
-        
-        if response.status_code == 200:
-            rasa_responses = response.json()
-            if rasa_responses:
-                # Extract the text responses
-                texts = [resp.get("text", "") for resp in rasa_responses if "text" in resp]
-                
-                # Check for any custom payloads (like career suggestions)
-                for resp in rasa_responses:
-                    if "custom" in resp:
-                        custom_data = json.loads(resp["custom"])
-                        if "careers" in custom_data:
-                            st.session_state.user_profile['suggested_careers'] = custom_data["careers"]
-                        if "interests" in custom_data:
-                            st.session_state.user_profile['interests'] = custom_data["interests"]
-                        if "name" in custom_data:
-                            st.session_state.user_profile['name'] = custom_data["name"]
-                
-                return " ".join(texts)
-            return "I'm sorry, I didn't get a response. Could you try again?"
+        # Serve repeated messages from the cache, otherwise stream from Rasa
+        response_cache = get_response_cache()
+        state = conversation_state(st.session_state.user_profile)
+        cached_responses = response_cache.get(processed_text, state)
+        answered_locally = []
+        if cached_responses is not None:
+            rasa_responses = cached_responses
         else:
-            return f"Error: Received status code {response.status_code} from Rasa server. Make sure the Rasa server is running."
-    except requests.exceptions.ConnectionError:
-        return "Error: Could not connect to the Rasa server. Make sure it's running at http://localhost:5005."
+            rasa_responses = stream_with_local_fallback(processed_text, message_text, sentiment, answered_locally)
+        
+        # Separate consecutive bot messages with a space
+        received = []
+        received_text = False
+        for resp in rasa_responses:
+            received.append(resp)
+            # Check for any custom payloads (like career suggestions)
+            if "custom" in resp:
+                apply_rasa_custom_payload(resp)
+            if resp.get("text"):
+                yield (" " if received_text else "") + resp["text"]
+                received_text = True
+        
+        # Local answers are not cached, so Rasa answers again once it is back
+        if cached_responses is None and not answered_locally:
+            response_cache.put(processed_text, state, received)
+        
+        if not received_text:
+            yield "I'm sorry, I didn't get a response. Could you try again?"
+    except RasaUnavailableError:
+        yield f"Error: Lost the connection to the Rasa server at {get_rasa_client().webhook_url}."
+    except RasaResponseError as e:
+        yield f"Error: Received an invalid response from the Rasa server ({str(e)})."
     except Exception as e:
-        return f"An error occurred: {str(e)}"
+        yield f"An error occurred: {str(e)}"
+
+def send_message_to_rasa(message_text):
+    """Send a message to the Rasa server and get the complete response"""
+    return "".join(stream_rasa_response(message_text))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,65 @@
+"""
+Time to first chunk and total turn time of a chat reply.
+
+Compares the old chat view path (wait for the whole Rasa reply, then
+"type" it out with a 50 ms sleep per word) with streaming the reply from
+the stub webhook and rendering each bot message as it arrives.
+
+Usage:
+    python benchmarks/chat_stream_benchmark.py --turns 5 --latency-ms 50 --chunk-delay-ms 150
+"""
+import os
+import sys
+import time
+import argparse
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.rasa_client import RasaClient
+from utils.latency import LatencyRecorder
+from rasa_stub_server import start_stub_server
+
+# Per-word delay of the old simulated typing effect
+TYPING_DELAY = 0.05
+
+MESSAGE = "i am confused about my career"
+
+def report(label, recorder):
+    summary = recorder.summary()
+    print(f"{label:<22} first chunk p50 {summary['first_chunk_p50_ms']:8.1f} ms   "
+          f"total p50 {summary['total_p50_ms']:8.1f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark chat reply streaming")
+    parser.add_argument("--turns", type=int, default=5, help="Chat turns per scenario")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Delay before Rasa's first message")
+    parser.add_argument("--chunk-delay-ms", type=float, default=150.0, help="Delay between Rasa's messages")
+    args = parser.parse_args()
+
+    server, url = start_stub_server(latency=args.latency_ms / 1000, chunk_delay=args.chunk_delay_ms / 1000)
+    client = RasaClient(url)
+
+    recorder = LatencyRecorder()
+    for _ in range(args.turns):
+        timer = recorder.start_turn()
+        reply = " ".join(response["text"] for response in client.send_message(MESSAGE))
+        for _ in reply.split():
+            time.sleep(TYPING_DELAY)
+            timer.mark_chunk()
+        timer.finish()
+    report("blocking + typing", recorder)
+
+    recorder = LatencyRecorder()
+    for _ in range(args.turns):
+        timer = recorder.start_turn()
+        for _ in client.stream_message(MESSAGE):
+            timer.mark_chunk()
+        timer.finish()
+    report("streamed", recorder)
+
+    server.shutdown()
+    server.server_close()
+
+if __name__ == "__main__":
+    main()
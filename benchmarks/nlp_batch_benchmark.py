@@ -0,0 +1,72 @@
+"""
+Throughput benchmark for the batch NLP API.
+
+Compares the scalar functions in utils.nlp_utils / utils.sentiment with their
+*_batch counterparts on a synthetic chat archive and checks that the results
+are identical.
+
+Usage:
+    python benchmarks/nlp_batch_benchmark.py --messages 20000 --workers 1 2 4
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.nlp_utils import extract_keywords, detect_intent, extract_keywords_batch, detect_intent_batch
+from utils.sentiment import analyze_sentiment, analyze_sentiment_batch
+
+SAMPLE_MESSAGES = [
+    "Hi, I am confused about my career and not sure what to do next",
+    "I love programming and I'm really excited about machine learning",
+    "My dream job is to become a UX designer working on mobile apps",
+    "I want to become a nurse, what steps should I take?",
+    "I'm worried that I won't find a job in digital marketing",
+    "Teaching students at a university has always been my passion",
+    "How to move from accounting into data science and analytics?",
+    "I enjoy graphic design, photography and video editing",
+    "I feel lost and overwhelmed by all the options",
+    "What is the roadmap to a career in cybersecurity?"
+]
+
+def make_messages(count: int, seed: int = 42):
+    """Build a synthetic chat archive by sampling and lightly varying templates"""
+    rng = random.Random(seed)
+    return [f"{rng.choice(SAMPLE_MESSAGES)} ({i})" for i in range(count)]
+
+def time_call(func, *args, **kwargs):
+    """Run func once and return (result, elapsed seconds)"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batch NLP throughput")
+    parser.add_argument("--messages", type=int, default=20000, help="Number of messages to analyze")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker counts to try")
+    parser.add_argument("--chunk-size", type=int, default=256, help="Messages per worker task")
+    args = parser.parse_args()
+
+    messages = make_messages(args.messages)
+    benchmarks = [
+        ("extract_keywords", extract_keywords, extract_keywords_batch),
+        ("detect_intent", detect_intent, detect_intent_batch),
+        ("analyze_sentiment", analyze_sentiment, analyze_sentiment_batch)
+    ]
+
+    for name, scalar, batch in benchmarks:
+        expected, scalar_time = time_call(lambda: [scalar(message) for message in messages])
+        print(f"{name:<18} scalar      {len(messages) / scalar_time:>10,.0f} msgs/sec")
+
+        for workers in args.workers:
+            result, batch_time = time_call(batch, messages, workers=workers, chunk_size=args.chunk_size)
+            status = "ok" if result == expected else "MISMATCH"
+            print(f"{name:<18} workers={workers:<3} {len(messages) / batch_time:>10,.0f} msgs/sec "
+                  f"({scalar_time / batch_time:.1f}x) {status}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Career plan PDF generation throughput.
+
+Renders career plans for the sample careers in a loop, alternating user
+names so consecutive documents differ, and reports PDFs per second and the
+time spent constructing CareerPlanPDF (font setup) per document, for the
+temp-file path, the in-memory render_career_plan_pdf_bytes path, and
+plans served from the on-disk CareerPlanCache.
+
+Usage:
+    python benchmarks/pdf_benchmark.py --pdfs 50 [--no-font-pickles]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+import fpdf
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.career_db import CareerDatabase
+from utils.pdf_generator import (CareerPlanPDF, FONT_CACHE, generate_career_plan_pdf,
+                                 render_career_plan_pdf_bytes)
+from utils.pdf_cache import CareerPlanCache
+
+NAMES = ["Ann", "Bilal", "Chen", "Dolores", "Émile", "Farah"]
+
+def clear_font_subsets():
+    FONT_CACHE.subsets.clear()
+    FONT_CACHE.widths.clear()
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark career plan PDF generation")
+    parser.add_argument("--pdfs", type=int, default=50, help="PDFs to generate")
+    parser.add_argument("--no-font-pickles", action="store_true",
+                        help="Stop fpdf caching font metrics as .pkl files next to the fonts, "
+                             "as happens when the font directory is read-only")
+    args = parser.parse_args()
+    if args.no_font_pickles:
+        fpdf.set_global("FPDF_CACHE_MODE", 1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = CareerDatabase(os.path.join(tmp, "bench.db"))
+        _, traits = db.get_career_traits()
+        careers = db.get_careers_by_ids([career_id for career_id, *_ in traits])
+
+        start = time.perf_counter()
+        for _ in range(args.pdfs):
+            CareerPlanPDF()
+        setup = (time.perf_counter() - start) / args.pdfs
+
+        # Each path starts with empty subset caches, so neither reuses the other's work
+        clear_font_subsets()
+        start = time.perf_counter()
+        for i in range(args.pdfs):
+            path = generate_career_plan_pdf(careers[i % len(careers)], {'name': NAMES[i % len(NAMES)]})
+            with open(path, "rb") as f:
+                f.read()
+            os.remove(path)
+        file_elapsed = time.perf_counter() - start
+
+        clear_font_subsets()
+        start = time.perf_counter()
+        for i in range(args.pdfs):
+            render_career_plan_pdf_bytes(careers[i % len(careers)], {'name': NAMES[i % len(NAMES)]})
+        bytes_elapsed = time.perf_counter() - start
+
+        # Fill the PDF cache, then time lookups that all hit
+        cache = CareerPlanCache(os.path.join(tmp, "pdf"))
+        for i in range(args.pdfs):
+            cache.get_or_render(careers[i % len(careers)], {'name': NAMES[i % len(NAMES)]})
+        start = time.perf_counter()
+        for i in range(args.pdfs):
+            cache.get_or_render(careers[i % len(careers)], {'name': NAMES[i % len(NAMES)]})
+        cached_elapsed = time.perf_counter() - start
+
+    print(f"{'CareerPlanPDF() setup':<30} {setup * 1e3:8.2f} ms")
+    for label, elapsed in (("temp file + read + remove", file_elapsed),
+                           ("render_career_plan_pdf_bytes", bytes_elapsed),
+                           ("CareerPlanCache hit", cached_elapsed)):
+        print(f"{label:<30} {elapsed / args.pdfs * 1e3:8.2f} ms   {args.pdfs / elapsed:8.1f} PDFs/sec")
+
+if __name__ == "__main__":
+    main()
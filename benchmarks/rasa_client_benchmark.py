@@ -0,0 +1,87 @@
+"""
+Round-trip latency of the Rasa client against the stub webhook.
+
+Compares a bare requests.post per message (a new TCP connection each time)
+with the pooled RasaClient, runs concurrent turns through AsyncRasaClient,
+and shows the circuit breaker failing fast once the server is down.
+
+Usage:
+    python benchmarks/rasa_client_benchmark.py --requests 500 --latency-ms 5
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+
+import requests
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.rasa_client import RasaClient, AsyncRasaClient, RasaUnavailableError, WEBHOOK_PATH
+from rasa_stub_server import start_stub_server
+
+def percentile(latencies, fraction):
+    """Latency at a fraction (0-1) of the sorted list"""
+    ordered = sorted(latencies)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+def report(label, latencies):
+    print(f"{label:<26} p50 {percentile(latencies, 0.5) * 1e3:7.2f} ms   "
+          f"p99 {percentile(latencies, 0.99) * 1e3:7.2f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Rasa client")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per scenario")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Stub server latency")
+    parser.add_argument("--concurrency", type=int, default=10, help="Concurrent async turns")
+    args = parser.parse_args()
+
+    server, url = start_stub_server(latency=args.latency_ms / 1000)
+    message = {"sender": "bench", "message": "hi"}
+
+    latencies = []
+    for _ in range(args.requests):
+        start = time.perf_counter()
+        requests.post(url + WEBHOOK_PATH, json=message).json()
+        latencies.append(time.perf_counter() - start)
+    report("requests.post", latencies)
+
+    client = RasaClient(url)
+    latencies = []
+    for _ in range(args.requests):
+        start = time.perf_counter()
+        client.send_message("hi", sender="bench")
+        latencies.append(time.perf_counter() - start)
+    report("RasaClient (keep-alive)", latencies)
+
+    async def run_async():
+        async_client = AsyncRasaClient(RasaClient(url), max_workers=args.concurrency)
+        start = time.perf_counter()
+        await asyncio.gather(*(async_client.send_message("hi", sender=f"bench-{i}")
+                               for i in range(args.requests)))
+        elapsed = time.perf_counter() - start
+        async_client.close()
+        return elapsed
+    elapsed = asyncio.run(run_async())
+    print(f"{'AsyncRasaClient':<26} {args.requests / elapsed:,.0f} turns/sec "
+          f"at concurrency {args.concurrency}")
+
+    # Stop the server and show the breaker opening
+    server.shutdown()
+    server.server_close()
+    client = RasaClient(url, max_retries=1, backoff_base=0.01, failure_threshold=3)
+    latencies = []
+    for _ in range(10):
+        start = time.perf_counter()
+        try:
+            client.send_message("hi")
+        except RasaUnavailableError:
+            pass
+        latencies.append(time.perf_counter() - start)
+    print(f"{'server down':<26} first call {latencies[0] * 1e3:.2f} ms, "
+          f"after breaker opens {latencies[-1] * 1e3:.3f} ms  {client.stats()}")
+
+if __name__ == "__main__":
+    main()
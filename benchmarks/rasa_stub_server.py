@@ -0,0 +1,150 @@
+"""
+Local stand-in for the Rasa REST webhook.
+
+Answers POST /webhooks/rest/webhook with canned bot responses after an
+optional delay, and can fail a fraction of requests with 503, so the Rasa
+client and chat view can be exercised and benchmarked without a trained
+Rasa model. With ?stream=true the responses are written one JSON line at a
+time, like Rasa's streaming REST channel, optionally spaced by a delay.
+
+Usage:
+    python benchmarks/rasa_stub_server.py --port 5005 --latency-ms 20 --chunk-delay-ms 200 --failure-rate 0.1
+
+or, from Python:
+    server, url = start_stub_server(latency=0.02)
+    ...
+    server.shutdown()
+"""
+import json
+import time
+import random
+import argparse
+import threading
+from urllib.parse import parse_qs, urlsplit
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Tuple
+
+WEBHOOK_PATH = "/webhooks/rest/webhook"
+
+# Canned replies keyed by a word that triggers them, checked in order
+CANNED_REPLIES = [
+    ("confused", "It's completely normal to feel unsure. Let's start with what you enjoy doing. "
+                 "Which school subjects or hobbies have you liked most?"),
+    ("programming", "Programming opens up many paths! Software Developer and Data Scientist are "
+                    "great matches for you."),
+    ("design", "Design careers such as UX Designer or Graphic Designer could suit your creative side."),
+    ("hi", "Hi! I'm your AI career counselor. What would you like to explore today?"),
+]
+DEFAULT_REPLY = ("I understand you're interested in exploring career options. Could you tell me more "
+                 "about your interests and skills? This will help me provide more personalized guidance.")
+
+def reply_for(message: str) -> List[Dict[str, Any]]:
+    """Pick the canned bot responses for a message, one per sentence like separate utterances"""
+    words = set(message.lower().split())
+    reply = next((text for trigger, text in CANNED_REPLIES if trigger in words), DEFAULT_REPLY)
+    sentences = [sentence.strip() for sentence in reply.replace("? ", "?\n").replace(". ", ".\n").split("\n")]
+    return [{"recipient_id": "user", "text": sentence} for sentence in sentences if sentence]
+
+class StubWebhookHandler(BaseHTTPRequestHandler):
+    """Request handler for the stub webhook; settings live on the server object"""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY,
+    # keep-alive clients stall on delayed ACKs
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+
+        url = urlsplit(self.path)
+        if url.path != WEBHOOK_PATH:
+            self._send(404, {"error": "not found"})
+            return
+
+        if self.server.latency > 0:
+            time.sleep(self.server.latency)
+        if self.server.failure_rate > 0 and random.random() < self.server.failure_rate:
+            self._send(503, {"error": "stub failure"})
+            return
+
+        try:
+            message = json.loads(body).get("message", "")
+        except ValueError:
+            self._send(400, {"error": "invalid JSON"})
+            return
+        self.server.requests_served += 1
+        if parse_qs(url.query).get("stream") == ["true"]:
+            self._send_stream(reply_for(message))
+        else:
+            self._send(200, reply_for(message))
+
+    def _send(self, status: int, payload: Any) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_stream(self, messages: List[Dict[str, Any]]) -> None:
+        """Write each message as a chunked JSON line, waiting chunk_delay between them"""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for i, message in enumerate(messages):
+            if i and self.server.chunk_delay > 0:
+                time.sleep(self.server.chunk_delay)
+            data = (json.dumps(message) + "\n").encode("utf-8")
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, format, *args):
+        # Keep benchmark output clean
+        pass
+
+def start_stub_server(host: str = "127.0.0.1", port: int = 0, latency: float = 0.0,
+                      failure_rate: float = 0.0, chunk_delay: float = 0.0) -> Tuple[ThreadingHTTPServer, str]:
+    """
+    Start the stub webhook on a background thread
+
+    Args:
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+        latency: Seconds to wait before answering each request
+        failure_rate: Fraction of requests answered with 503
+        chunk_delay: Seconds between streamed responses
+
+    Returns:
+        Tuple of (server, base URL); call server.shutdown() to stop it
+    """
+    server = ThreadingHTTPServer((host, port), StubWebhookHandler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.failure_rate = failure_rate
+    server.chunk_delay = chunk_delay
+    server.requests_served = 0
+    threading.Thread(target=server.serve_forever, name="rasa-stub", daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a stub Rasa REST webhook")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=5005, help="Port to bind")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay before each response")
+    parser.add_argument("--chunk-delay-ms", type=float, default=0.0, help="Delay between streamed responses")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    args = parser.parse_args()
+
+    server, url = start_stub_server(args.host, args.port, args.latency_ms / 1000, args.failure_rate,
+                                    args.chunk_delay_ms / 1000)
+    print(f"Stub Rasa webhook listening on {url}{WEBHOOK_PATH}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
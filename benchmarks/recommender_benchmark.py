@@ -0,0 +1,88 @@
+"""
+Latency benchmark for the TF-IDF career recommender.
+
+Builds a synthetic catalog of the requested size in a temporary database,
+then reports model build time, disk cache load time and per-query latency.
+
+Usage:
+    python benchmarks/recommender_benchmark.py --careers 50000 --queries 2000
+"""
+import os
+import csv
+import sys
+import time
+import json
+import random
+import argparse
+import tempfile
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.career_db import CareerDatabase
+from utils.recommender import CareerRecommender
+
+FIELDS = ["Technology", "Design", "Marketing", "Business", "Finance", "Healthcare", "Education",
+          "Engineering", "Science", "Law", "Media", "Hospitality"]
+WORDS = ("analysis data software design patient teaching research marketing finance cloud security "
+         "network mobile web product brand content video audio legal contract clinical nursing "
+         "curriculum student budget audit tax sales customer support operations logistics supply "
+         "energy climate robotics hardware embedded quality testing automation strategy policy "
+         "statistics modelling visualization writing editing photography animation games music").split()
+
+def write_catalog(path: str, careers: int, seed: int = 7) -> None:
+    """Write a synthetic catalog CSV with the career_data.csv columns"""
+    rng = random.Random(seed)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["title", "field", "description", "salary", "growth_rate",
+                         "education_level", "skills", "roadmap"])
+        for i in range(careers):
+            words = rng.sample(WORDS, 12)
+            writer.writerow([
+                f"{words[0].title()} {words[1].title()} Specialist {i}",
+                rng.choice(FIELDS),
+                "Works on " + ", ".join(words[:8]) + " projects.",
+                rng.randint(40000, 180000),
+                round(rng.uniform(0.0, 0.3), 2),
+                "Bachelor's",
+                ", ".join(word.title() for word in words[4:12]),
+                json.dumps([])
+            ])
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the career recommender")
+    parser.add_argument("--careers", type=int, default=50000, help="Synthetic catalog size")
+    parser.add_argument("--queries", type=int, default=2000, help="Number of timed queries")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "catalog.csv")
+        write_catalog(csv_path, args.careers)
+        db = CareerDatabase(os.path.join(tmp, "bench.db"), synchronous_writes=True)
+        db.import_catalog(csv_path)
+        cache_dir = os.path.join(tmp, "cache")
+
+        start = time.perf_counter()
+        CareerRecommender(db, cache_dir=cache_dir).recommend(["data"])
+        print(f"build model       {time.perf_counter() - start:8.2f} s")
+
+        recommender = CareerRecommender(db, cache_dir=cache_dir)
+        start = time.perf_counter()
+        recommender.recommend(["data"])
+        print(f"load from cache   {time.perf_counter() - start:8.2f} s")
+
+        rng = random.Random(11)
+        queries = [rng.sample(WORDS, rng.randint(1, 4)) for _ in range(args.queries)]
+        latencies = []
+        for query in queries:
+            start = time.perf_counter()
+            recommender.recommend(query, limit=3)
+            latencies.append(time.perf_counter() - start)
+        latencies.sort()
+        print(f"query p50         {latencies[len(latencies) // 2] * 1e3:8.3f} ms")
+        print(f"query p99         {latencies[int(len(latencies) * 0.99)] * 1e3:8.3f} ms")
+        db.close()
+
+if __name__ == "__main__":
+    main()
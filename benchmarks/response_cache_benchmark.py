@@ -0,0 +1,67 @@
+"""
+Latency of a chat turn served from the response cache versus a Rasa round trip.
+
+Replays a stream of common openers against the stub webhook, preprocessing
+each message and looking it up in the ResponseCache before calling Rasa,
+and reports the hit rate and per-turn latency of hits and misses.
+
+Usage:
+    python benchmarks/response_cache_benchmark.py --turns 2000 --latency-ms 20
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.nlp_utils import preprocess_text
+from utils.rasa_client import RasaClient
+from utils.response_cache import ResponseCache, conversation_state
+from rasa_stub_server import start_stub_server
+
+MESSAGES = [
+    "hi", "Hi!", "hello", "I am confused about my career", "i'm confused about my career...",
+    "What should I do?", "what should i do", "help me choose a career", "Yes", "My name is Sam",
+    "I love programming", "what careers are there in design", "How much does a data scientist earn?"
+]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Rasa response cache")
+    parser.add_argument("--turns", type=int, default=2000, help="Messages to replay")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Stub server latency")
+    args = parser.parse_args()
+
+    server, url = start_stub_server(latency=args.latency_ms / 1000)
+    client = RasaClient(url)
+    cache = ResponseCache()
+    state = conversation_state({'name': '', 'interests': []})
+
+    random.seed(0)
+    hits, misses = [], []
+    for _ in range(args.turns):
+        message = random.choice(MESSAGES)
+        start = time.perf_counter()
+        processed_text = preprocess_text(message)
+        responses = cache.get(processed_text, state)
+        if responses is None:
+            responses = client.send_message(processed_text)
+            cache.put(processed_text, state, responses)
+            misses.append(time.perf_counter() - start)
+        else:
+            hits.append(time.perf_counter() - start)
+
+    server.shutdown()
+    server.server_close()
+
+    def mean_us(latencies):
+        return sum(latencies) / len(latencies) * 1e6 if latencies else 0.0
+
+    print(f"hits   {len(hits):6d}  mean {mean_us(hits):10.1f} us")
+    print(f"misses {len(misses):6d}  mean {mean_us(misses):10.1f} us")
+    print(cache.stats())
+
+if __name__ == "__main__":
+    main()
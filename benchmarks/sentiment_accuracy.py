@@ -0,0 +1,77 @@
+"""
+Accuracy and speed of the sentiment backends.
+
+Scores the labelled messages in benchmarks/fixtures/sentiment_labelled.csv
+with every backend in utils.sentiment, reporting accuracy against the
+labels, agreement with the TextBlob backend and per-message latency.
+
+Usage:
+    python benchmarks/sentiment_accuracy.py --repeat 50
+"""
+import os
+import csv
+import sys
+import time
+import argparse
+from collections import Counter
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.sentiment import SENTIMENT_BACKENDS, analyze_sentiment, analyze_sentiment_batch, clear_sentiment_cache
+
+FIXTURE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "sentiment_labelled.csv")
+
+def load_fixture(path: str):
+    """Read (text, label) pairs from a labelled CSV"""
+    with open(path, newline="", encoding="utf-8") as f:
+        return [(row["text"], row["label"]) for row in csv.DictReader(f)]
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare sentiment backends on a labelled fixture set")
+    parser.add_argument("--fixture", default=FIXTURE_PATH, help="CSV with text and label columns")
+    parser.add_argument("--repeat", type=int, default=20, help="Passes over the fixture for timing")
+    parser.add_argument("--show-errors", action="store_true", help="Print misclassified messages")
+    args = parser.parse_args()
+
+    samples = load_fixture(args.fixture)
+    texts = [text for text, _ in samples]
+    labels = [label for _, label in samples]
+    print(f"{len(samples)} labelled messages: {dict(Counter(labels))}")
+
+    predictions = {}
+    for backend in SENTIMENT_BACKENDS:
+        # Results are memoized per message, so time cold passes only
+        scalar_time = batch_time = 0.0
+        for _ in range(args.repeat):
+            clear_sentiment_cache()
+            start = time.perf_counter()
+            predicted = [analyze_sentiment(text, backend=backend) for text in texts]
+            scalar_time += time.perf_counter() - start
+
+            clear_sentiment_cache()
+            start = time.perf_counter()
+            batched = analyze_sentiment_batch(texts, workers=1, backend=backend)
+            batch_time += time.perf_counter() - start
+        scalar_time /= args.repeat * len(texts)
+        batch_time /= args.repeat * len(texts)
+
+        predictions[backend] = predicted
+        correct = sum(p == label for p, label in zip(predicted, labels))
+        status = "ok" if batched == predicted else "MISMATCH"
+        print(f"{backend:<9} accuracy {correct / len(labels):6.1%}  "
+              f"scalar {scalar_time * 1e6:8.1f} us/msg  batch {batch_time * 1e6:8.1f} us/msg  {status}")
+
+        if args.show_errors:
+            for text, p, label in zip(texts, predicted, labels):
+                if p != label:
+                    print(f"    expected {label:<8} got {p:<8} {text}")
+
+    baseline = predictions['textblob']
+    for backend in SENTIMENT_BACKENDS:
+        if backend != 'textblob':
+            agreement = sum(a == b for a, b in zip(predictions[backend], baseline)) / len(baseline)
+            print(f"{backend} agrees with textblob on {agreement:.1%} of messages")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Per-message cost of utils.nlp_utils.tokenize_text.
+
+Compares the punkt path with the regex fast path on short chat messages and
+reports the lemma cache hit rate.
+
+Usage:
+    python benchmarks/tokenizer_benchmark.py --messages 20000
+"""
+import os
+import sys
+import time
+import argparse
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.nlp_utils import tokenize_text, preprocess_text, get_lemma_cache_stats
+from nlp_batch_benchmark import make_messages
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark tokenize_text per-message cost")
+    parser.add_argument("--messages", type=int, default=20000, help="Number of messages to tokenize")
+    args = parser.parse_args()
+
+    messages = [preprocess_text(message) for message in make_messages(args.messages)]
+
+    for label, fast in (("punkt", False), ("fast path", True)):
+        start = time.perf_counter()
+        for message in messages:
+            tokenize_text(message, fast=fast)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<10} {elapsed / len(messages) * 1e6:8.1f} us/message")
+
+    stats = get_lemma_cache_stats()
+    print(f"lemma cache: {stats['size']} entries, hit rate {stats['hit_rate']:.1%}")
+
+if __name__ == "__main__":
+    main()
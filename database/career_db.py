@@ -1,141 +1,269 @@
 import sqlite3
 import os
-import json
-import pandas as pd
-from typing import List, Dict, Any, Optional, Union
+import re
+import sys
+import threading
+from typing import List, Dict, Any, Optional, Tuple, Union
 import logging
 
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.catalog_loader import load_catalog_csv, TRAIT_COLUMNS
+from database.connection_pool import ConnectionPool
+from database.write_queue import WriteBehindQueue
+from utils.cache import LRUCache
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Maximum number of bound parameters per IN (...) list, kept well under
+# SQLite's default SQLITE_MAX_VARIABLE_NUMBER of 999
+SQL_IN_CHUNK_SIZE = 500
+
+# bm25 column weights for the career_search FTS5 table, in column order:
+# title, description, field_name, skills
+SEARCH_COLUMN_WEIGHTS = (10.0, 1.0, 4.0, 5.0)
+
+# Numbered schema migrations (NNNN_description.sql), applied in order and
+# tracked with PRAGMA user_version
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+
 class CareerDatabase:
     """Class to handle all database operations for the AI Career Counselor"""
     
-    def __init__(self, db_path: str = "database/career_counselor.db"):
+    def __init__(self, db_path: str = "database/career_counselor.db", cache_size: int = 512,
+                 max_readers: int = 8, synchronous_writes: bool = False):
         """
-        Initialize the database connection
+        Initialize the database connection pool
         
         Args:
             db_path: Path to the SQLite database file
+            cache_size: Maximum number of entries in the career detail cache
+            max_readers: Maximum number of concurrent read connections
+            synchronous_writes: Commit user activity writes immediately instead
+                of batching them on a background thread (useful for tests)
         """
         # Ensure the database directory exists
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         
         self.db_path = db_path
-        self.conn = None
+        
+        # Pooled read connections plus one serialized writer, safe to share
+        # between Streamlit session threads
+        self._pool = ConnectionPool(db_path, max_readers=max_readers)
+        
+        # Read-through cache of hydrated careers, keyed by ("id", id) and
+        # ("title", title). Cached records are shared and must not be mutated.
+        self._career_cache = LRUCache(cache_size)
+        self._cache_lock = threading.Lock()
+        # Last PRAGMA data_version seen on each pooled reader connection
+        self._cache_data_versions = {}
+        self._cache_catalog_version = None
+        
+        # Random id of this database's catalog, read on first use
+        self._catalog_id: Optional[str] = None
+        
+        # Set to False when SQLite was built without FTS5; search then falls
+        # back to LIKE scans
+        self.fts_enabled = False
         
         # Initialize the database
         self._initialize_db()
+        
+        # User activity inserts are group-committed in the background unless
+        # synchronous writes were requested
+        self._write_queue = None if synchronous_writes else WriteBehindQueue(self._pool)
+    
+    def close(self) -> None:
+        """Flush queued writes and close all database connections"""
+        if self._write_queue is not None:
+            self._write_queue.close()
+        self._pool.close()
     
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get a connection to the database"""
-        if self.conn is None:
-            self.conn = sqlite3.connect(self.db_path)
-            # Enable foreign keys
-            self.conn.execute("PRAGMA foreign_keys = ON")
-            # Configure connection to return rows as dictionaries
-            self.conn.row_factory = sqlite3.Row
-        return self.conn
+    def flush_writes(self) -> None:
+        """Block until the user activity writes queued before this call are committed"""
+        if self._write_queue is not None:
+            self._write_queue.flush()
+    
+    def get_write_stats(self) -> Dict[str, int]:
+        """
+        Get statistics for the background writer
+        
+        Returns:
+            Dictionary with pending writes, batches and row counts
+        """
+        if self._write_queue is None:
+            return {'pending': 0, 'batches_written': 0, 'rows_written': 0, 'rows_failed': 0}
+        return self._write_queue.stats()
+    
+    def _write(self, sql: str, params: Tuple[Any, ...]) -> None:
+        """
+        Queue a user activity write, or commit it immediately in synchronous mode
+        
+        Args:
+            sql: Parameterized INSERT statement
+            params: Statement parameters
+            
+        Raises:
+            RuntimeError: If the write could not be queued
+        """
+        if self._write_queue is None:
+            with self._pool.writer() as conn:
+                conn.execute(sql, params)
+        elif not self._write_queue.submit(sql, params):
+            raise RuntimeError("write queue is full or closed")
         
     def _initialize_db(self) -> None:
         """Initialize the database with schema and sample data"""
         try:
-            conn = self._get_connection()
-            
-            # Check if the database is already initialized
-            cursor = conn.cursor()
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='careers'")
-            if cursor.fetchone() is not None:
-                logger.info("Database already initialized")
-                return
-            
-            # Execute schema.sql to create tables
-            with open(os.path.join(os.path.dirname(__file__), "schema.sql"), "r") as f:
-                schema_sql = f.read()
-                conn.executescript(schema_sql)
-            
-            # Load sample data from CSV
-            self._load_sample_data()
+            with self._pool.writer() as conn:
+                # Check if the database is already initialized
+                cursor = conn.cursor()
+                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='careers'")
+                already_initialized = cursor.fetchone() is not None
+                
+                # Execute schema.sql to create tables. Every statement is idempotent,
+                # so this also adds objects introduced after the database was created.
+                with open(os.path.join(os.path.dirname(__file__), "schema.sql"), "r") as f:
+                    schema_sql = f.read()
+                    conn.executescript(schema_sql)
+                
+                # Bring the schema up to date
+                self._run_migrations(conn)
+                
+                self.fts_enabled = self._initialize_search_index(conn)
+                
+                if already_initialized:
+                    if self.fts_enabled:
+                        self._sync_search_index(conn)
+                    logger.info("Database already initialized")
+                    return
+                
+                # Load sample data from CSV
+                self._load_sample_data(conn)
             
             logger.info("Database initialized successfully")
         except Exception as e:
             logger.error(f"Error initializing database: {str(e)}")
             raise
             
-    def _load_sample_data(self) -> None:
-        """Load sample career data from CSV file"""
-        try:
-            # Read the CSV file
-            csv_path = os.path.join(os.path.dirname(__file__), "career_data.csv")
-            career_data = pd.read_csv(csv_path)
+    def _run_migrations(self, conn: sqlite3.Connection) -> int:
+        """
+        Apply pending migrations from MIGRATIONS_DIR.
+        
+        Each migration runs in its own transaction together with the
+        PRAGMA user_version bump, so a failed migration leaves the database
+        at the previous version.
+        
+        Args:
+            conn: Database connection
+            
+        Returns:
+            Schema version after migrating
+        """
+        current_version = conn.execute("PRAGMA user_version").fetchone()[0]
+        
+        migrations = []
+        for filename in os.listdir(MIGRATIONS_DIR):
+            match = re.match(r"^(\d+)_.*\.sql$", filename)
+            if match:
+                migrations.append((int(match.group(1)), filename))
+        
+        for version, filename in sorted(migrations):
+            if version <= current_version:
+                continue
             
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with open(os.path.join(MIGRATIONS_DIR, filename), "r") as f:
+                migration_sql = f.read()
             
-            # Insert career fields
-            unique_fields = career_data["field"].unique()
-            for field in unique_fields:
-                cursor.execute(
-                    "INSERT INTO career_fields (name, description) VALUES (?, ?)",
-                    (field, f"Career field related to {field}")
+            try:
+                conn.executescript(
+                    f"BEGIN;\n{migration_sql}\nPRAGMA user_version = {version};\nCOMMIT;"
                 )
+            except Exception as e:
+                if conn.in_transaction:
+                    conn.rollback()
+                logger.error(f"Error applying migration {filename}: {str(e)}")
+                raise
             
-            # Insert careers and related data
-            for _, row in career_data.iterrows():
-                # Get the field_id
-                cursor.execute("SELECT id FROM career_fields WHERE name = ?", (row["field"],))
-                field_id = cursor.fetchone()[0]
-                
-                # Insert career
-                cursor.execute(
-                    """
-                    INSERT INTO careers (title, field_id, description, salary, growth_rate, education_level)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    (row["title"], field_id, row["description"], row["salary"], 
-                     row["growth_rate"], row["education_level"])
-                )
-                career_id = cursor.lastrowid
-                
-                # Insert skills
-                skills = row["skills"].split(",")
-                for i, skill in enumerate(skills):
-                    cursor.execute(
-                        "INSERT INTO career_skills (career_id, skill, importance) VALUES (?, ?, ?)",
-                        (career_id, skill.strip(), 10 - i)  # Higher importance for earlier skills
-                    )
-                
-                # Insert roadmap steps
-                roadmap = json.loads(row["roadmap"])
-                for i, step in enumerate(roadmap):
-                    cursor.execute(
-                        """
-                        INSERT INTO roadmap_steps (career_id, step_order, title, description, duration)
-                        VALUES (?, ?, ?, ?, ?)
-                        """,
-                        (career_id, i+1, step["title"], step["description"], step["duration"])
-                    )
-                    step_id = cursor.lastrowid
-                    
-                    # Insert resources for this step
-                    if "resources" in step:
-                        for resource in step["resources"]:
-                            cursor.execute(
-                                """
-                                INSERT INTO learning_resources 
-                                (step_id, title, url, resource_type, is_free)
-                                VALUES (?, ?, ?, ?, ?)
-                                """,
-                                (step_id, resource["title"], resource["url"], 
-                                 resource["type"], resource["is_free"])
-                            )
-            
-            conn.commit()
-            logger.info("Sample data loaded successfully")
+            current_version = version
+            logger.info(f"Applied migration {filename}")
+        
+        return current_version
+    
+    def _initialize_search_index(self, conn: sqlite3.Connection) -> bool:
+        """
+        Create the career_search FTS5 table and its sync triggers
+        
+        Args:
+            conn: Database connection
+            
+        Returns:
+            True if full-text search is available, False otherwise
+        """
+        try:
+            with open(os.path.join(os.path.dirname(__file__), "search_schema.sql"), "r") as f:
+                conn.executescript(f.read())
+            return True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Full-text search unavailable, falling back to LIKE search: {str(e)}")
+            return False
+    
+    def _sync_search_index(self, conn: sqlite3.Connection) -> None:
+        """Rebuild the career_search index if it does not cover every career"""
+        indexed = conn.execute("SELECT COUNT(*) FROM career_search").fetchone()[0]
+        total = conn.execute("SELECT COUNT(*) FROM careers").fetchone()[0]
+        if indexed == total:
+            return
+        
+        logger.info(f"Rebuilding career search index ({indexed} of {total} careers indexed)")
+        conn.execute("DELETE FROM career_search")
+        conn.execute("""
+            INSERT INTO career_search (rowid, title, description, field_name, skills)
+            SELECT c.id, c.title, c.description, cf.name,
+                   (SELECT group_concat(cs.skill, ', ') FROM career_skills cs WHERE cs.career_id = c.id)
+            FROM careers c
+            LEFT JOIN career_fields cf ON c.field_id = cf.id
+        """)
+        conn.commit()
+    
+    def _load_sample_data(self, conn: sqlite3.Connection) -> None:
+        """
+        Load sample career data from CSV file
+        
+        Args:
+            conn: Writer connection
+        """
+        try:
+            csv_path = os.path.join(os.path.dirname(__file__), "career_data.csv")
+            stats = load_catalog_csv(conn, csv_path)
+            self.clear_career_cache()
+            logger.info(f"Sample data loaded successfully ({stats['rows_per_sec']:,.0f} rows/sec)")
         except Exception as e:
             logger.error(f"Error loading sample data: {str(e)}")
             raise
+    
+    def import_catalog(self, csv_path: str, chunk_size: int = 10000) -> Dict[str, Any]:
+        """
+        Bulk import careers from a catalog CSV
+        
+        Args:
+            csv_path: Path to a CSV with the same columns as career_data.csv
+            chunk_size: Number of CSV rows parsed per chunk
+            
+        Returns:
+            Dictionary with row counts per table, elapsed seconds and rows per second
+        """
+        with self._pool.writer() as conn:
+            stats = load_catalog_csv(conn, csv_path, chunk_size=chunk_size)
+        self.clear_career_cache()
+        logger.info(
+            f"Imported {stats['careers']} careers from {csv_path} in {stats['seconds']:.2f}s "
+            f"({stats['rows_per_sec']:,.0f} rows/sec)"
+        )
+        return stats
             
     def get_career_by_title(self, title: str) -> Optional[Dict[str, Any]]:
         """
@@ -147,65 +275,446 @@ class CareerDatabase:
         Returns:
             Dictionary with career details or None if not found
         """
+        careers = self.get_careers_by_titles([title])
+        return careers[0] if careers else None
+    
+    def get_careers_by_titles(self, titles: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get full career details for several careers at once
+        
+        Args:
+            titles: Career titles to look up
+            
+        Returns:
+            List of career dictionaries in the order of the given titles,
+            skipping titles that are not in the database
+        """
+        return self._get_careers_by_column("title", titles)
+    
+    def get_careers_by_ids(self, career_ids: List[int]) -> List[Dict[str, Any]]:
+        """
+        Get full career details for several careers at once
+        
+        Args:
+            career_ids: Career IDs to look up
+            
+        Returns:
+            List of career dictionaries in the order of the given IDs,
+            skipping IDs that are not in the database
+        """
+        return self._get_careers_by_column("id", career_ids)
+    
+    def get_catalog_version(self) -> int:
+        """
+        Get the catalog version, which changes on every catalog edit
+        
+        Returns:
+            Current catalog version, or 0 if it could not be read
+        """
+        try:
+            with self._pool.reader() as conn:
+                row = conn.execute("SELECT version FROM catalog_version WHERE id = 1").fetchone()
+                return row[0] if row else 0
+        except Exception as e:
+            logger.error(f"Error getting catalog version: {str(e)}")
+            return 0
+    
+    def get_catalog_id(self) -> str:
+        """
+        Get the random id of this database's catalog
+        
+        Catalog versions start again from 0 when a database is recreated, so
+        caches that outlive the process key on this id as well as the version.
+        
+        Returns:
+            Hex catalog id, or an empty string if it could not be read
+        """
+        if self._catalog_id is None:
+            try:
+                with self._pool.reader() as conn:
+                    row = conn.execute("SELECT catalog_id FROM catalog_version WHERE id = 1").fetchone()
+                if row and row[0]:
+                    self._catalog_id = row[0]
+            except Exception as e:
+                logger.error(f"Error getting catalog id: {str(e)}")
+        return self._catalog_id or ""
+    
+    def get_career_titles_by_id(self) -> Dict[int, str]:
+        """
+        Get the title of every career
+        
+        Returns:
+            Dictionary of career ID to title
+        """
+        try:
+            with self._pool.reader() as conn:
+                return dict(conn.execute("SELECT id, title FROM careers").fetchall())
+        except Exception as e:
+            logger.error(f"Error getting career titles: {str(e)}")
+            return {}
+    
+    def get_catalog_documents(self) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Get the text of every career for building search and recommendation models
+        
+        Both queries run in one read transaction, so the version always
+        matches the documents.
+        
+        Returns:
+            Tuple of (catalog version, list of dictionaries with id, title,
+            field_name, description and skills as (skill, importance) pairs
+            ordered by importance), in career id order
+        """
+        try:
+            with self._pool.reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute("BEGIN")
+                
+                row = cursor.execute("SELECT version FROM catalog_version WHERE id = 1").fetchone()
+                catalog_version = row[0] if row else 0
+                
+                cursor.execute("""
+                    SELECT c.id, c.title, cf.name AS field_name, c.description
+                    FROM careers c
+                    LEFT JOIN career_fields cf ON c.field_id = cf.id
+                    ORDER BY c.id
+                """)
+                documents = []
+                documents_by_id = {}
+                for row in cursor.fetchall():
+                    document = dict(row)
+                    document["skills"] = []
+                    documents.append(document)
+                    documents_by_id[document["id"]] = document
+                
+                cursor.execute("""
+                    SELECT career_id, skill, importance FROM career_skills
+                    ORDER BY career_id, importance DESC
+                """)
+                for career_id, skill, importance in cursor.fetchall():
+                    document = documents_by_id.get(career_id)
+                    if document is not None:
+                        document["skills"].append((skill, importance))
+                
+                conn.commit()
+                return catalog_version, documents
+        except Exception as e:
+            logger.error(f"Error getting catalog documents: {str(e)}")
+            return 0, []
+    
+    def get_career_traits(self) -> Tuple[int, List[Tuple[Any, ...]]]:
+        """
+        Get the trait profile of every career that has one
+        
+        Both queries run in one read transaction, so the version always
+        matches the profiles.
+        
+        Returns:
+            Tuple of (catalog version, list of (career_id, title, *traits)
+            tuples with traits in TRAIT_COLUMNS order), in career id order
+        """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            # Get basic career info
-            cursor.execute("""
-                SELECT c.*, cf.name as field_name
-                FROM careers c
-                JOIN career_fields cf ON c.field_id = cf.id
-                WHERE c.title = ?
-            """, (title,))
-            
-            career_row = cursor.fetchone()
-            if not career_row:
-                return None
+            with self._pool.reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute("BEGIN")
                 
-            # Convert to dictionary
-            career = dict(career_row)
-            
-            # Get skills
-            cursor.execute("""
-                SELECT skill FROM career_skills
-                WHERE career_id = ?
-                ORDER BY importance DESC
-            """, (career["id"],))
-            
-            career["skills"] = [row["skill"] for row in cursor.fetchall()]
-            
-            # Get roadmap steps
-            cursor.execute("""
-                SELECT rs.*, 
-                       (SELECT json_group_array(json_object(
-                           'title', lr.title,
-                           'url', lr.url,
-                           'type', lr.resource_type,
-                           'is_free', lr.is_free
-                       ))
-                       FROM learning_resources lr
-                       WHERE lr.step_id = rs.id) as resources
-                FROM roadmap_steps rs
-                WHERE rs.career_id = ?
-                ORDER BY rs.step_order
-            """, (career["id"],))
-            
-            roadmap_steps = []
-            for step in cursor.fetchall():
-                step_dict = dict(step)
-                if step_dict["resources"]:
-                    step_dict["resources"] = json.loads(step_dict["resources"])
-                else:
-                    step_dict["resources"] = []
-                roadmap_steps.append(step_dict)
+                row = cursor.execute("SELECT version FROM catalog_version WHERE id = 1").fetchone()
+                catalog_version = row[0] if row else 0
                 
-            career["roadmap"] = roadmap_steps
+                trait_columns = ", ".join(f"t.{column}" for column in TRAIT_COLUMNS)
+                cursor.execute(f"""
+                    SELECT c.id, c.title, {trait_columns}
+                    FROM career_traits t
+                    JOIN careers c ON c.id = t.career_id
+                    ORDER BY c.id
+                """)
+                profiles = [tuple(row) for row in cursor.fetchall()]
+                
+                conn.commit()
+                return catalog_version, profiles
+        except Exception as e:
+            logger.error(f"Error getting career traits: {str(e)}")
+            return 0, []
+    
+    def get_user_career_suggestions(self, user_ids: Optional[List[int]] = None,
+                                    per_user: int = 3) -> List[Dict[str, Any]]:
+        """
+        Get each user's top suggested careers
+        
+        A career suggested to a user more than once counts once, with its
+        best relevance score; ties go to the most recent suggestion.
+        
+        Args:
+            user_ids: Users to include (defaults to every user with suggestions)
+            per_user: Maximum number of careers per user
             
-            return career
+        Returns:
+            List of dictionaries with user_id, name and career_ids (best
+            first), in user id order
+        """
+        user_filter = ""
+        params: List[Any] = []
+        if user_ids is not None:
+            if not user_ids:
+                return []
+            user_filter = f"WHERE user_id IN ({', '.join('?' * len(user_ids))})"
+            params.extend(user_ids)
+        params.append(per_user)
+        
+        try:
+            with self._pool.reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute(f"""
+                    WITH best AS (
+                        SELECT user_id, career_id, MAX(relevance_score) AS relevance_score,
+                               MAX(id) AS latest_id
+                        FROM user_career_suggestions
+                        {user_filter}
+                        GROUP BY user_id, career_id
+                    ), ranked AS (
+                        SELECT user_id, career_id,
+                               ROW_NUMBER() OVER (PARTITION BY user_id
+                                                  ORDER BY relevance_score DESC, latest_id DESC) AS rank
+                        FROM best
+                    )
+                    SELECT r.user_id, u.name, r.career_id
+                    FROM ranked r
+                    JOIN users u ON u.id = r.user_id
+                    WHERE r.rank <= ?
+                    ORDER BY r.user_id, r.rank
+                """, params)
+                
+                users: List[Dict[str, Any]] = []
+                for user_id, name, career_id in cursor.fetchall():
+                    if not users or users[-1]["user_id"] != user_id:
+                        users.append({"user_id": user_id, "name": name, "career_ids": []})
+                    users[-1]["career_ids"].append(career_id)
+                return users
         except Exception as e:
-            logger.error(f"Error getting career by title: {str(e)}")
-            return None
+            logger.error(f"Error getting user career suggestions: {str(e)}")
+            return []
+    
+    def get_chat_history_page(self, user_id: int, before_id: Optional[int] = None, limit: int = 20,
+                              skip: int = 0) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Get one page of a user's chat history, walking back from the newest message
+        
+        Pages are keyed by message id, so each page is a range scan of the
+        (user_id, id) index no matter how long the conversation is. Queued
+        writes are not visible until flush_writes.
+        
+        Args:
+            user_id: User ID
+            before_id: Cursor from the previous page (defaults to the newest message)
+            limit: Maximum number of messages in the page
+            skip: Number of newest messages before the cursor to leave out
+            
+        Returns:
+            Tuple of (messages as dictionaries with id, role, content and
+            timestamp, oldest first; cursor for the next older page, or None
+            if there are no older messages)
+        """
+        cursor_filter = ""
+        params: List[Any] = [user_id]
+        if before_id is not None:
+            cursor_filter = "AND id < ?"
+            params.append(before_id)
+        params.extend([limit + 1, skip])
+        
+        try:
+            with self._pool.reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute(f"""
+                    SELECT id, role, message, timestamp
+                    FROM chat_history
+                    WHERE user_id = ? {cursor_filter}
+                    ORDER BY id DESC
+                    LIMIT ? OFFSET ?
+                """, params)
+                rows = cursor.fetchall()
+        except Exception as e:
+            logger.error(f"Error getting chat history: {str(e)}")
+            return [], None
+        
+        # One extra row is fetched to tell whether an older page exists
+        has_older = len(rows) > limit
+        rows = rows[:limit]
+        messages = [
+            {'id': message_id, 'role': role, 'content': message, 'timestamp': timestamp}
+            for message_id, role, message, timestamp in reversed(rows)
+        ]
+        return messages, rows[-1][0] if has_older else None
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics for the career detail cache
+        
+        Returns:
+            Dictionary with size, hits, misses, evictions and hit rate
+        """
+        return self._career_cache.stats()
+    
+    def clear_career_cache(self) -> None:
+        """Drop all cached career records"""
+        with self._cache_lock:
+            self._career_cache.clear()
+            self._cache_catalog_version = None
+    
+    def _validate_career_cache(self, conn: sqlite3.Connection) -> None:
+        """
+        Clear the career cache if the catalog changed since it was filled.
+        
+        PRAGMA data_version changes whenever another connection (including our
+        own writer) commits, so the common case costs no table read. When it
+        does change, the catalog version row (maintained by triggers) tells
+        catalog edits apart from unrelated writes such as chat history.
+        
+        Args:
+            conn: Pooled reader connection
+        """
+        data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        with self._cache_lock:
+            if (self._cache_data_versions.get(id(conn)) == data_version
+                    and self._cache_catalog_version is not None):
+                return
+            
+            row = conn.execute("SELECT version FROM catalog_version WHERE id = 1").fetchone()
+            catalog_version = row[0] if row else 0
+            if catalog_version != self._cache_catalog_version:
+                self._career_cache.clear()
+                self._cache_catalog_version = catalog_version
+            self._cache_data_versions[id(conn)] = data_version
+    
+    def _get_careers_by_column(self, column: str, values: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Get careers matching a key column, serving cached records where possible.
+        
+        Args:
+            column: Key column on the careers table ('id' or 'title')
+            values: Key values to look up
+            
+        Returns:
+            List of career dictionaries in the order of the given values
+        """
+        try:
+            with self._pool.reader() as conn:
+                self._validate_career_cache(conn)
+        except Exception as e:
+            logger.error(f"Error validating career cache: {str(e)}")
+            self.clear_career_cache()
+        
+        # Deduplicate while keeping the caller's order
+        keys = list(dict.fromkeys(values))
+        careers_by_key = {}
+        missing = []
+        for key in keys:
+            career = self._career_cache.get((column, key))
+            if career is None:
+                missing.append(key)
+            else:
+                careers_by_key[key] = career
+        
+        if missing:
+            for key, career in self._fetch_careers(column, missing).items():
+                careers_by_key[key] = career
+                self._career_cache.put(("id", career["id"]), career)
+                self._career_cache.put(("title", career["title"]), career)
+        
+        return [careers_by_key[key] for key in keys if key in careers_by_key]
+    
+    def _fetch_careers(self, column: str, keys: List[Any]) -> Dict[Any, Dict[str, Any]]:
+        """
+        Hydrate careers matching a key column with skills, roadmap steps and resources.
+        
+        Each chunk of keys costs four queries regardless of how many careers it
+        contains (careers, skills, roadmap steps, learning resources).
+        
+        Args:
+            column: Key column on the careers table ('id' or 'title')
+            keys: Distinct key values to look up
+            
+        Returns:
+            Dictionary mapping each found key to its career dictionary
+        """
+        try:
+            with self._pool.reader() as conn:
+                cursor = conn.cursor()
+                careers_by_key = {}
+                
+                for start in range(0, len(keys), SQL_IN_CHUNK_SIZE):
+                    chunk = keys[start:start + SQL_IN_CHUNK_SIZE]
+                    placeholders = ", ".join("?" * len(chunk))
+                    
+                    # Get basic career info
+                    cursor.execute(f"""
+                        SELECT c.*, cf.name as field_name
+                        FROM careers c
+                        JOIN career_fields cf ON c.field_id = cf.id
+                        WHERE c.{column} IN ({placeholders})
+                    """, chunk)
+                    
+                    careers_by_id = {}
+                    for row in cursor.fetchall():
+                        career = dict(row)
+                        career["skills"] = []
+                        career["roadmap"] = []
+                        careers_by_id[career["id"]] = career
+                        careers_by_key[career[column]] = career
+                    
+                    if not careers_by_id:
+                        continue
+                    
+                    career_ids = list(careers_by_id)
+                    id_placeholders = ", ".join("?" * len(career_ids))
+                    
+                    # Get skills
+                    cursor.execute(f"""
+                        SELECT career_id, skill FROM career_skills
+                        WHERE career_id IN ({id_placeholders})
+                        ORDER BY career_id, importance DESC
+                    """, career_ids)
+                    
+                    for row in cursor.fetchall():
+                        careers_by_id[row["career_id"]]["skills"].append(row["skill"])
+                    
+                    # Get roadmap steps
+                    cursor.execute(f"""
+                        SELECT * FROM roadmap_steps
+                        WHERE career_id IN ({id_placeholders})
+                        ORDER BY career_id, step_order
+                    """, career_ids)
+                    
+                    steps_by_id = {}
+                    for row in cursor.fetchall():
+                        step = dict(row)
+                        step["resources"] = []
+                        steps_by_id[step["id"]] = step
+                        careers_by_id[step["career_id"]]["roadmap"].append(step)
+                    
+                    if not steps_by_id:
+                        continue
+                    
+                    # Get learning resources for all of those steps
+                    cursor.execute(f"""
+                        SELECT lr.step_id, lr.title, lr.url, lr.resource_type, lr.is_free
+                        FROM learning_resources lr
+                        JOIN roadmap_steps rs ON lr.step_id = rs.id
+                        WHERE rs.career_id IN ({id_placeholders})
+                        ORDER BY lr.step_id, lr.id
+                    """, career_ids)
+                    
+                    for row in cursor.fetchall():
+                        steps_by_id[row["step_id"]]["resources"].append({
+                            "title": row["title"],
+                            "url": row["url"],
+                            "type": row["resource_type"],
+                            "is_free": row["is_free"]
+                        })
+                
+                return careers_by_key
+        except Exception as e:
+            logger.error(f"Error getting careers by {column}: {str(e)}")
+            return {}
             
     def search_careers(self, keywords: List[str], limit: int = 3) -> List[Dict[str, Any]]:
         """
@@ -216,48 +725,117 @@ class CareerDatabase:
             limit: Maximum number of results to return
             
         Returns:
-            List of career dictionaries
+            List of career dictionaries, best match first
         """
+        if self.fts_enabled:
+            career_ids = [career_id for career_id, _ in self.rank_careers(keywords, limit)]
+        else:
+            career_ids = self._search_career_ids_like(keywords, limit)
+        
+        # Get the full career details in one batch
+        return self.get_careers_by_ids(career_ids)
+    
+    def rank_careers(self, keywords: List[str], limit: int = 3) -> List[Tuple[int, float]]:
+        """
+        Rank careers against keywords with the career_search full-text index.
+        
+        Each keyword is matched as a prefix phrase against title, description,
+        field name and skills; results are scored with bm25 using
+        SEARCH_COLUMN_WEIGHTS.
+        
+        Args:
+            keywords: List of keywords to search for
+            limit: Maximum number of results to return
+            
+        Returns:
+            List of (career_id, score) tuples, highest score first
+        """
+        match_query = self._build_match_query(keywords)
+        if not match_query:
+            return []
+        
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            # Build the query with multiple LIKE conditions
-            query_conditions = []
-            query_params = []
-            
-            for keyword in keywords:
-                keyword_param = f"%{keyword}%"
-                query_conditions.append("""
-                    (c.title LIKE ? OR 
-                     c.description LIKE ? OR 
-                     cf.name LIKE ? OR 
-                     EXISTS (SELECT 1 FROM career_skills cs WHERE cs.career_id = c.id AND cs.skill LIKE ?))
-                """)
-                query_params.extend([keyword_param, keyword_param, keyword_param, keyword_param])
-            
-            query = f"""
-                SELECT c.title, c.salary, cf.name as field_name, c.description
-                FROM careers c
-                JOIN career_fields cf ON c.field_id = cf.id
-                WHERE {" OR ".join(query_conditions)}
-                GROUP BY c.id
-                ORDER BY COUNT(*) DESC
-                LIMIT ?
-            """
-            query_params.append(limit)
-            
-            cursor.execute(query, query_params)
-            
-            careers = []
-            for row in cursor.fetchall():
-                career = dict(row)
-                # Get the full career details
-                full_career = self.get_career_by_title(career["title"])
-                if full_career:
-                    careers.append(full_career)
-            
-            return careers
+            with self._pool.reader() as conn:
+                cursor = conn.cursor()
+                
+                weights = ", ".join(str(weight) for weight in SEARCH_COLUMN_WEIGHTS)
+                cursor.execute(f"""
+                    SELECT rowid AS id, bm25(career_search, {weights}) AS rank
+                    FROM career_search
+                    WHERE career_search MATCH ?
+                    ORDER BY rank
+                    LIMIT ?
+                """, (match_query, limit))
+                
+                # bm25 returns lower-is-better negative values
+                return [(row["id"], -row["rank"]) for row in cursor.fetchall()]
+        except Exception as e:
+            logger.error(f"Error ranking careers: {str(e)}")
+            return []
+    
+    @staticmethod
+    def _build_match_query(keywords: List[str]) -> str:
+        """
+        Build an FTS5 MATCH expression OR-ing each keyword as a prefix phrase
+        
+        Args:
+            keywords: List of keywords
+            
+        Returns:
+            MATCH expression, or an empty string if there is nothing to match
+        """
+        phrases = []
+        for keyword in keywords:
+            terms = re.findall(r"\w+", keyword or "")
+            if terms:
+                phrases.append('"' + " ".join(terms) + '"*')
+        return " OR ".join(phrases)
+    
+    def _search_career_ids_like(self, keywords: List[str], limit: int) -> List[int]:
+        """
+        Search careers with LIKE scans, used when FTS5 is unavailable
+        
+        Args:
+            keywords: List of keywords to search for
+            limit: Maximum number of results to return
+            
+        Returns:
+            List of matching career IDs
+        """
+        if not keywords:
+            return []
+        
+        try:
+            with self._pool.reader() as conn:
+                cursor = conn.cursor()
+                
+                # Build the query with multiple LIKE conditions
+                query_conditions = []
+                query_params = []
+                
+                for keyword in keywords:
+                    keyword_param = f"%{keyword}%"
+                    query_conditions.append("""
+                        (c.title LIKE ? OR 
+                         c.description LIKE ? OR 
+                         cf.name LIKE ? OR 
+                         EXISTS (SELECT 1 FROM career_skills cs WHERE cs.career_id = c.id AND cs.skill LIKE ?))
+                    """)
+                    query_params.extend([keyword_param, keyword_param, keyword_param, keyword_param])
+                
+                query = f"""
+                    SELECT c.id
+                    FROM careers c
+                    JOIN career_fields cf ON c.field_id = cf.id
+                    WHERE {" OR ".join(query_conditions)}
+                    GROUP BY c.id
+                    ORDER BY COUNT(*) DESC
+                    LIMIT ?
+                """
+                query_params.append(limit)
+                
+                cursor.execute(query, query_params)
+                return [row["id"] for row in cursor.fetchall()]
         except Exception as e:
             logger.error(f"Error searching careers: {str(e)}")
             return []
@@ -274,15 +852,13 @@ class CareerDatabase:
             User ID if successful, None otherwise
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute(
-                "INSERT INTO users (name, email) VALUES (?, ?)",
-                (name, email)
-            )
-            
-            conn.commit()
+            with self._pool.writer() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute(
+                    "INSERT INTO users (name, email) VALUES (?, ?)",
+                    (name, email)
+                )
             return cursor.lastrowid
         except Exception as e:
             logger.error(f"Error adding user: {str(e)}")
@@ -297,18 +873,13 @@ class CareerDatabase:
             interest: Interest to add
             
         Returns:
-            True if successful, False otherwise
+            True if the write was accepted, False otherwise
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute(
+            self._write(
                 "INSERT INTO user_interests (user_id, interest) VALUES (?, ?)",
                 (user_id, interest)
             )
-            
-            conn.commit()
             return True
         except Exception as e:
             logger.error(f"Error adding user interest: {str(e)}")
@@ -323,18 +894,13 @@ class CareerDatabase:
             sentiment: Sentiment value (positive, neutral, negative)
             
         Returns:
-            True if successful, False otherwise
+            True if the write was accepted, False otherwise
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute(
+            self._write(
                 "INSERT INTO user_sentiment (user_id, sentiment) VALUES (?, ?)",
                 (user_id, sentiment)
             )
-            
-            conn.commit()
             return True
         except Exception as e:
             logger.error(f"Error adding user sentiment: {str(e)}")
@@ -350,18 +916,13 @@ class CareerDatabase:
             role: 'user' or 'assistant'
             
         Returns:
-            True if successful, False otherwise
+            True if the write was accepted, False otherwise
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute(
+            self._write(
                 "INSERT INTO chat_history (user_id, message, role) VALUES (?, ?, ?)",
                 (user_id, message, role)
             )
-            
-            conn.commit()
             return True
         except Exception as e:
             logger.error(f"Error adding chat message: {str(e)}")
@@ -377,18 +938,13 @@ class CareerDatabase:
             relevance_score: Relevance score (0-1)
             
         Returns:
-            True if successful, False otherwise
+            True if the write was accepted, False otherwise
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute(
+            self._write(
                 "INSERT INTO user_career_suggestions (user_id, career_id, relevance_score) VALUES (?, ?, ?)",
                 (user_id, career_id, relevance_score)
             )
-            
-            conn.commit()
             return True
         except Exception as e:
             logger.error(f"Error adding career suggestion: {str(e)}")
@@ -407,13 +963,10 @@ class CareerDatabase:
             deadline: Goal deadline (YYYY-MM-DD)
             
         Returns:
-            True if successful, False otherwise
+            True if the write was accepted, False otherwise
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute(
+            self._write(
                 """
                 INSERT INTO learning_goals 
                 (user_id, title, description, category, deadline) 
@@ -421,13 +974,148 @@ class CareerDatabase:
                 """,
                 (user_id, title, description, category, deadline)
             )
-            
-            conn.commit()
             return True
         except Exception as e:
             logger.error(f"Error adding learning goal: {str(e)}")
             return False
             
+    def get_learning_goals(self, user_id: int, completed: Optional[bool] = None,
+                           due_before: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get a user's learning goals, earliest deadline first
+        
+        Queued writes (such as goals just added with add_learning_goal) are
+        not visible until flush_writes.
+        
+        Args:
+            user_id: User ID
+            completed: Only completed (True) or in-progress (False) goals
+                (defaults to both)
+            due_before: Only goals due on or before this date (YYYY-MM-DD)
+            
+        Returns:
+            List of goal dictionaries with id, title, description, category,
+            deadline, completed, created_at and completed_at
+        """
+        conditions = ["user_id = ?"]
+        params: List[Any] = [user_id]
+        if completed is not None:
+            conditions.append("completed = ?")
+            params.append(int(completed))
+        if due_before is not None:
+            conditions.append("deadline <= ?")
+            params.append(due_before)
+        
+        try:
+            with self._pool.reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute(f"""
+                    SELECT id, title, description, category, deadline, completed, created_at, completed_at
+                    FROM learning_goals
+                    WHERE {' AND '.join(conditions)}
+                    ORDER BY deadline, id
+                """, params)
+                return [
+                    {
+                        'id': goal_id,
+                        'title': title,
+                        'description': description,
+                        'category': category,
+                        'deadline': deadline,
+                        'completed': bool(is_completed),
+                        'created_at': created_at,
+                        'completed_at': completed_at
+                    }
+                    for goal_id, title, description, category, deadline, is_completed, created_at, completed_at
+                    in cursor.fetchall()
+                ]
+        except Exception as e:
+            logger.error(f"Error getting learning goals: {str(e)}")
+            return []
+            
+    def update_learning_goal(self, user_id: int, goal_id: int, title: Optional[str] = None,
+                             description: Optional[str] = None, category: Optional[str] = None,
+                             deadline: Optional[str] = None) -> bool:
+        """
+        Update the given fields of one of a user's learning goals
+        
+        Args:
+            user_id: User ID of the goal's owner
+            goal_id: Goal ID
+            title: New goal title
+            description: New goal description
+            category: New goal category
+            deadline: New goal deadline (YYYY-MM-DD)
+            
+        Returns:
+            True if the goal was updated, False otherwise
+        """
+        fields = {'title': title, 'description': description, 'category': category, 'deadline': deadline}
+        changes = {column: value for column, value in fields.items() if value is not None}
+        if not changes:
+            return False
+        
+        try:
+            with self._pool.writer() as conn:
+                cursor = conn.execute(
+                    f"UPDATE learning_goals SET {', '.join(f'{column} = ?' for column in changes)} "
+                    "WHERE id = ? AND user_id = ?",
+                    (*changes.values(), goal_id, user_id)
+                )
+            return cursor.rowcount > 0
+        except Exception as e:
+            logger.error(f"Error updating learning goal: {str(e)}")
+            return False
+            
+    def complete_learning_goal(self, user_id: int, goal_id: int, completed: bool = True) -> bool:
+        """
+        Mark one of a user's learning goals as completed, or as in progress again
+        
+        Args:
+            user_id: User ID of the goal's owner
+            goal_id: Goal ID
+            completed: New completion status
+            
+        Returns:
+            True if the goal was updated, False otherwise
+        """
+        try:
+            with self._pool.writer() as conn:
+                cursor = conn.execute(
+                    """
+                    UPDATE learning_goals
+                    SET completed = ?,
+                        completed_at = CASE WHEN ? THEN CURRENT_TIMESTAMP END
+                    WHERE id = ? AND user_id = ?
+                    """,
+                    (int(completed), int(completed), goal_id, user_id)
+                )
+            return cursor.rowcount > 0
+        except Exception as e:
+            logger.error(f"Error completing learning goal: {str(e)}")
+            return False
+            
+    def delete_learning_goal(self, user_id: int, goal_id: int) -> bool:
+        """
+        Delete one of a user's learning goals
+        
+        Args:
+            user_id: User ID of the goal's owner
+            goal_id: Goal ID
+            
+        Returns:
+            True if the goal was deleted, False otherwise
+        """
+        try:
+            with self._pool.writer() as conn:
+                cursor = conn.execute(
+                    "DELETE FROM learning_goals WHERE id = ? AND user_id = ?", (goal_id, user_id)
+                )
+            return cursor.rowcount > 0
+        except Exception as e:
+            logger.error(f"Error deleting learning goal: {str(e)}")
+            return False
+            
     def add_personality_result(self, user_id: int, technical_score: int, creative_score: int,
                               people_score: int, analytical_score: int, leadership_score: int,
                               detail_oriented_score: int) -> bool:
@@ -444,13 +1132,10 @@ class CareerDatabase:
             detail_oriented_score: Detail orientation score
             
         Returns:
-            True if successful, False otherwise
+            True if the write was accepted, False otherwise
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute(
+            self._write(
                 """
                 INSERT INTO personality_results 
                 (user_id, technical_score, creative_score, people_score, 
@@ -460,9 +1145,24 @@ class CareerDatabase:
                 (user_id, technical_score, creative_score, people_score, 
                 analytical_score, leadership_score, detail_oriented_score)
             )
-            
-            conn.commit()
             return True
         except Exception as e:
             logger.error(f"Error adding personality results: {str(e)}")
-            return False
\ No newline at end of file
+            return False
+
+
+_default_database: Optional[CareerDatabase] = None
+_default_database_lock = threading.Lock()
+
+def get_default_database() -> CareerDatabase:
+    """
+    Get the process-wide database at the default path
+    
+    Every part of the app shares this instance, so there is one reader pool,
+    one writer connection, one write-behind queue and one career cache.
+    """
+    global _default_database
+    with _default_database_lock:
+        if _default_database is None:
+            _default_database = CareerDatabase()
+        return _default_database
@@ -0,0 +1,215 @@
+import os
+import sys
+import json
+import time
+import sqlite3
+import argparse
+import logging
+from typing import Any, Dict, List
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Columns expected in a catalog CSV
+CATALOG_COLUMNS = ["title", "field", "description", "salary", "growth_rate",
+                   "education_level", "skills", "roadmap"]
+
+# Optional trait profile columns (1-10), loaded into career_traits when present
+TRAIT_COLUMNS = ["technical", "creative", "people", "analytical", "leadership", "detail_oriented"]
+
+# Tables whose row-level triggers (catalog version, search index) are
+# suspended during a bulk load and replaced by one set-based update
+CATALOG_TABLES = ("career_fields", "careers", "career_skills", "roadmap_steps", "learning_resources",
+                  "career_traits")
+
+def load_catalog_csv(conn: sqlite3.Connection, csv_path: str, chunk_size: int = 10000) -> Dict[str, Any]:
+    """
+    Bulk load a career catalog CSV in a single transaction.
+
+    The CSV is read in chunks. Field ids come from an in-memory map, career
+    and roadmap step ids are assigned up front so no per-row lastrowid round
+    trip is needed, and every table is filled with one executemany per chunk.
+    Row-level catalog triggers are dropped for the duration of the
+    transaction and recreated before commit; the search index and catalog
+    version are then updated once for the whole load.
+
+    Args:
+        conn: Writer connection; any open transaction is committed first
+        csv_path: Path to a CSV with CATALOG_COLUMNS, and optionally TRAIT_COLUMNS
+        chunk_size: Number of CSV rows parsed per chunk
+
+    Returns:
+        Dictionary with row counts per table, elapsed seconds and rows per second
+    """
+    start_time = time.perf_counter()
+    counts = {"careers": 0, "skills": 0, "roadmap_steps": 0, "resources": 0, "traits": 0}
+    
+    # Trait profiles are loaded only if the CSV has every trait column
+    header = pd.read_csv(csv_path, nrows=0).columns
+    has_traits = all(column in header for column in TRAIT_COLUMNS)
+    columns = CATALOG_COLUMNS + TRAIT_COLUMNS if has_traits else CATALOG_COLUMNS
+
+    try:
+        if conn.in_transaction:
+            conn.commit()
+        cursor = conn.cursor()
+        cursor.execute("BEGIN")
+        
+        # DDL is transactional, so other connections never see the catalog
+        # without its triggers
+        placeholders = ", ".join("?" * len(CATALOG_TABLES))
+        triggers = cursor.execute(f"""
+            SELECT name, sql FROM sqlite_master
+            WHERE type = 'trigger' AND tbl_name IN ({placeholders})
+        """, CATALOG_TABLES).fetchall()
+        for name, _ in triggers:
+            cursor.execute(f'DROP TRIGGER "{name}"')
+
+        field_ids = {name: field_id for field_id, name in
+                     cursor.execute("SELECT id, name FROM career_fields")}
+        first_career_id = cursor.execute("SELECT COALESCE(MAX(id), 0) FROM careers").fetchone()[0] + 1
+        next_career_id = first_career_id
+        next_step_id = cursor.execute("SELECT COALESCE(MAX(id), 0) FROM roadmap_steps").fetchone()[0] + 1
+
+        for chunk in pd.read_csv(csv_path, usecols=columns, chunksize=chunk_size):
+            # Plain Python values (None instead of NaN) so sqlite3 can bind them
+            chunk = chunk.astype(object).where(chunk.notna(), None)
+
+            # Resolve field ids, inserting fields we have not seen yet
+            for field in chunk["field"].unique():
+                if field not in field_ids:
+                    cursor.execute(
+                        "INSERT INTO career_fields (name, description) VALUES (?, ?)",
+                        (field, f"Career field related to {field}")
+                    )
+                    field_ids[field] = cursor.lastrowid
+
+            career_rows: List[tuple] = []
+            skill_rows: List[tuple] = []
+            step_rows: List[tuple] = []
+            resource_rows: List[tuple] = []
+            trait_rows: List[tuple] = []
+
+            for row in zip(*(chunk[column].tolist() for column in columns)):
+                (title, field, description, salary, growth_rate,
+                 education_level, skills, roadmap) = row[:len(CATALOG_COLUMNS)]
+                career_id = next_career_id
+                next_career_id += 1
+
+                career_rows.append((career_id, title, field_ids[field], description,
+                                    salary, growth_rate, education_level))
+
+                # Careers with a blank trait are left out of trait matching
+                traits = row[len(CATALOG_COLUMNS):]
+                if traits and all(trait is not None for trait in traits):
+                    trait_rows.append((career_id, *traits))
+
+                # Higher importance for earlier skills
+                for i, skill in enumerate((skills or "").split(",")):
+                    if skill.strip():
+                        skill_rows.append((career_id, skill.strip(), 10 - i))
+
+                for i, step in enumerate(json.loads(roadmap) if roadmap else []):
+                    step_id = next_step_id
+                    next_step_id += 1
+                    step_rows.append((step_id, career_id, i + 1, step["title"],
+                                      step["description"], step["duration"]))
+                    for resource in step.get("resources", []):
+                        resource_rows.append((step_id, resource["title"], resource["url"],
+                                              resource["type"], resource["is_free"]))
+
+            cursor.executemany(
+                """
+                INSERT INTO careers (id, title, field_id, description, salary, growth_rate, education_level)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                career_rows
+            )
+            cursor.executemany(
+                "INSERT INTO career_skills (career_id, skill, importance) VALUES (?, ?, ?)",
+                skill_rows
+            )
+            cursor.executemany(
+                """
+                INSERT INTO roadmap_steps (id, career_id, step_order, title, description, duration)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                step_rows
+            )
+            cursor.executemany(
+                """
+                INSERT INTO learning_resources (step_id, title, url, resource_type, is_free)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                resource_rows
+            )
+            cursor.executemany(
+                f"""
+                INSERT INTO career_traits (career_id, {", ".join(TRAIT_COLUMNS)})
+                VALUES (?, {", ".join("?" * len(TRAIT_COLUMNS))})
+                """,
+                trait_rows
+            )
+
+            counts["careers"] += len(career_rows)
+            counts["skills"] += len(skill_rows)
+            counts["roadmap_steps"] += len(step_rows)
+            counts["resources"] += len(resource_rows)
+            counts["traits"] += len(trait_rows)
+
+        # Index the new careers in one pass if full-text search is set up
+        has_search_index = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'career_search'"
+        ).fetchone() is not None
+        if has_search_index:
+            cursor.execute("""
+                INSERT INTO career_search (rowid, title, description, field_name, skills)
+                SELECT c.id, c.title, c.description, cf.name,
+                       (SELECT group_concat(cs.skill, ', ') FROM career_skills cs WHERE cs.career_id = c.id)
+                FROM careers c
+                LEFT JOIN career_fields cf ON c.field_id = cf.id
+                WHERE c.id >= ?
+            """, (first_career_id,))
+
+        cursor.execute("UPDATE catalog_version SET version = version + 1 WHERE id = 1")
+
+        for _, sql in triggers:
+            cursor.execute(sql)
+
+        conn.commit()
+    except Exception:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+
+    elapsed = time.perf_counter() - start_time
+    total_rows = sum(counts.values())
+    stats = dict(counts)
+    stats["seconds"] = elapsed
+    stats["rows_per_sec"] = total_rows / elapsed if elapsed > 0 else 0.0
+    stats["careers_per_sec"] = counts["careers"] / elapsed if elapsed > 0 else 0.0
+    return stats
+
+def main() -> None:
+    """Load a catalog CSV into a database and report throughput"""
+    # Add the project root to the path
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from database.career_db import CareerDatabase
+
+    parser = argparse.ArgumentParser(description="Bulk load a career catalog CSV")
+    parser.add_argument("csv_path", help="Catalog CSV to load")
+    parser.add_argument("--db", default="database/career_counselor.db", help="SQLite database path")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="CSV rows per chunk")
+    args = parser.parse_args()
+
+    db = CareerDatabase(args.db, synchronous_writes=True)
+    stats = db.import_catalog(args.csv_path, chunk_size=args.chunk_size)
+    db.close()
+
+    print(f"Loaded {stats['careers']} careers, {stats['skills']} skills, "
+          f"{stats['roadmap_steps']} roadmap steps and {stats['resources']} resources "
+          f"in {stats['seconds']:.2f}s ({stats['rows_per_sec']:,.0f} rows/sec)")
+
+if __name__ == "__main__":
+    main()
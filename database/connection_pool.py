@@ -0,0 +1,138 @@
+import sqlite3
+import queue
+import threading
+import logging
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class ConnectionPool:
+    """
+    Thread-safe SQLite connection manager with a bounded pool of read
+    connections and a single serialized writer.
+
+    The database is switched to WAL journal mode so readers never block the
+    writer and run in parallel with each other.
+    """
+
+    def __init__(self, db_path: str, max_readers: int = 8, busy_timeout_ms: int = 5000,
+                 mmap_size: int = 256 * 1024 * 1024, synchronous: str = "NORMAL"):
+        """
+        Initialize the pool. Connections are opened lazily.
+
+        Args:
+            db_path: Path to the SQLite database file
+            max_readers: Maximum number of concurrent read connections
+            busy_timeout_ms: How long a connection waits on a lock before failing,
+                also used as the timeout for acquiring a pooled reader
+            mmap_size: Bytes of the database file to memory-map (0 disables)
+            synchronous: PRAGMA synchronous level; NORMAL is durable across
+                application crashes in WAL mode
+        """
+        if max_readers < 1:
+            raise ValueError("max_readers must be at least 1")
+
+        self.db_path = db_path
+        self.max_readers = max_readers
+        self.busy_timeout_ms = busy_timeout_ms
+        self.mmap_size = mmap_size
+        self.synchronous = synchronous
+
+        self._idle_readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._all_readers: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        self._reader_slots = threading.BoundedSemaphore(max_readers)
+
+        self._writer: Optional[sqlite3.Connection] = None
+        self._writer_lock = threading.RLock()
+
+    def _connect(self, read_only: bool) -> sqlite3.Connection:
+        """Open and configure a new connection"""
+        # Pooled connections are handed between threads, but only ever used
+        # by one thread at a time
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout_ms / 1000,
+            check_same_thread=False
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+        conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        if read_only:
+            conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    def _get_writer(self) -> sqlite3.Connection:
+        """Get the writer connection, creating it (and enabling WAL) on first use"""
+        if self._writer is None:
+            self._writer = self._connect(read_only=False)
+            mode = self._writer.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+            if mode.lower() != "wal":
+                logger.warning(f"WAL journal mode unavailable for {self.db_path}, using {mode}")
+        return self._writer
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow the writer connection.
+
+        Writers are serialized by a lock. The transaction is committed when the
+        block exits normally and rolled back if it raises.
+        """
+        with self._writer_lock:
+            conn = self._get_writer()
+            try:
+                yield conn
+                if conn.in_transaction:
+                    conn.commit()
+            except Exception:
+                if conn.in_transaction:
+                    conn.rollback()
+                raise
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow a read-only connection from the pool.
+
+        Blocks for up to busy_timeout_ms when all readers are in use.
+        """
+        if not self._reader_slots.acquire(timeout=self.busy_timeout_ms / 1000):
+            raise TimeoutError(f"No database reader available after {self.busy_timeout_ms} ms")
+
+        try:
+            try:
+                conn = self._idle_readers.get_nowait()
+            except queue.Empty:
+                # Make sure the writer has switched the database to WAL first
+                if self._writer is None:
+                    with self._writer_lock:
+                        self._get_writer()
+                conn = self._connect(read_only=True)
+                with self._readers_lock:
+                    self._all_readers.append(conn)
+
+            try:
+                yield conn
+            finally:
+                if conn.in_transaction:
+                    conn.rollback()
+                self._idle_readers.put(conn)
+        finally:
+            self._reader_slots.release()
+
+    def close(self) -> None:
+        """Close every connection owned by the pool"""
+        with self._readers_lock:
+            for conn in self._all_readers:
+                conn.close()
+            self._all_readers = []
+            self._idle_readers = queue.LifoQueue()
+
+        with self._writer_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
@@ -0,0 +1,13 @@
+-- Indexes for foreign-key lookups and per-user history queries
+
+-- Career details (skills ordered by importance, roadmap ordered by step)
+CREATE INDEX IF NOT EXISTS idx_career_skills_career_id ON career_skills (career_id, importance DESC);
+CREATE INDEX IF NOT EXISTS idx_roadmap_steps_career_order ON roadmap_steps (career_id, step_order);
+CREATE INDEX IF NOT EXISTS idx_learning_resources_step_id ON learning_resources (step_id);
+CREATE INDEX IF NOT EXISTS idx_careers_field_id ON careers (field_id);
+
+-- User activity
+CREATE INDEX IF NOT EXISTS idx_chat_history_user_time ON chat_history (user_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_user_sentiment_user_time ON user_sentiment (user_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_user_interests_user_id ON user_interests (user_id);
+CREATE INDEX IF NOT EXISTS idx_user_career_suggestions_user_id ON user_career_suggestions (user_id);
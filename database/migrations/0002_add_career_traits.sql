@@ -0,0 +1,49 @@
+-- Personality trait profile of each career, on the same 1-10 scale as
+-- personality_results, used to match quiz results against the catalog
+
+CREATE TABLE IF NOT EXISTS career_traits (
+    career_id INTEGER PRIMARY KEY,
+    technical REAL NOT NULL,
+    creative REAL NOT NULL,
+    people REAL NOT NULL,
+    analytical REAL NOT NULL,
+    leadership REAL NOT NULL,
+    detail_oriented REAL NOT NULL,
+    FOREIGN KEY (career_id) REFERENCES careers(id)
+);
+
+CREATE TRIGGER IF NOT EXISTS career_traits_insert_catalog_version AFTER INSERT ON career_traits
+BEGIN
+    UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS career_traits_update_catalog_version AFTER UPDATE ON career_traits
+BEGIN
+    UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS career_traits_delete_catalog_version AFTER DELETE ON career_traits
+BEGIN
+    UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+END;
+
+-- Backfill the sample careers of databases created before this migration.
+-- New databases get these values from the trait columns of career_data.csv.
+WITH sample_traits (title, technical, creative, people, analytical, leadership, detail_oriented) AS (
+    VALUES
+        ('Software Developer', 9, 6, 4, 8, 4, 8),
+        ('Data Scientist', 9, 5, 4, 10, 4, 8),
+        ('UX Designer', 6, 9, 7, 6, 4, 7),
+        ('Digital Marketing Specialist', 5, 8, 8, 7, 5, 6),
+        ('Product Manager', 6, 6, 9, 7, 9, 6),
+        ('Cybersecurity Analyst', 9, 4, 4, 9, 4, 9),
+        ('Graphic Designer', 4, 10, 5, 4, 3, 8),
+        ('Financial Analyst', 5, 3, 5, 10, 5, 9),
+        ('Human Resources Manager', 2, 4, 10, 5, 8, 7),
+        ('Healthcare Administrator', 4, 3, 8, 6, 8, 8)
+)
+INSERT OR IGNORE INTO career_traits
+    (career_id, technical, creative, people, analytical, leadership, detail_oriented)
+SELECT c.id, t.technical, t.creative, t.people, t.analytical, t.leadership, t.detail_oriented
+FROM sample_traits t
+JOIN careers c ON c.title = t.title;
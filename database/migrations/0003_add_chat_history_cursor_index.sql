@@ -0,0 +1,4 @@
+-- Index for paging through a user's chat history newest first, using the
+-- message id as the cursor
+
+CREATE INDEX IF NOT EXISTS idx_chat_history_user_id ON chat_history (user_id, id);
@@ -0,0 +1,5 @@
+-- Indexes for listing a user's learning goals by deadline, optionally
+-- filtered by completion status
+
+CREATE INDEX IF NOT EXISTS idx_learning_goals_user_deadline ON learning_goals (user_id, deadline);
+CREATE INDEX IF NOT EXISTS idx_learning_goals_user_status_deadline ON learning_goals (user_id, completed, deadline);
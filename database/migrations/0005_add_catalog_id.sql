@@ -0,0 +1,6 @@
+-- Random identity of this database's catalog. Catalog versions restart at 0
+-- when a database is recreated, so caches keyed by catalog version must also
+-- be keyed by this id.
+
+ALTER TABLE catalog_version ADD COLUMN catalog_id TEXT;
+UPDATE catalog_version SET catalog_id = lower(hex(randomblob(16))) WHERE id = 1;
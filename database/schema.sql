@@ -123,4 +123,88 @@ CREATE TABLE IF NOT EXISTS personality_results (
     detail_oriented_score INTEGER,
     taken_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (user_id) REFERENCES users(id)
-);
\ No newline at end of file
+);
+
+-- Catalog version, bumped on every change to the career catalog so that
+-- in-process caches can detect stale entries
+CREATE TABLE IF NOT EXISTS catalog_version (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO catalog_version (id, version) VALUES (1, 0);
+
+CREATE TRIGGER IF NOT EXISTS career_fields_insert_catalog_version AFTER INSERT ON career_fields
+BEGIN
+    UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS career_fields_update_catalog_version AFTER UPDATE ON career_fields
+BEGIN
+    UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS career_fields_delete_catalog_version AFTER DELETE ON career_fields
+BEGIN
+    UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS careers_insert_catalog_version AFTER INSERT ON careers
+BEGIN
+    UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS careers_update_catalog_version AFTER UPDATE ON careers
+BEGIN
+    UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS careers_delete_catalog_version AFTER DELETE ON careers
+BEGIN
+    UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS career_skills_insert_catalog_version AFTER INSERT ON career_skills
+BEGIN
+    UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS career_skills_update_catalog_version AFTER UPDATE ON career_skills
+BEGIN
+    UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS career_skills_delete_catalog_version AFTER DELETE ON career_skills
+BEGIN
+    UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS roadmap_steps_insert_catalog_version AFTER INSERT ON roadmap_steps
+BEGIN
+    UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS roadmap_steps_update_catalog_version AFTER UPDATE ON roadmap_steps
+BEGIN
+    UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS roadmap_steps_delete_catalog_version AFTER DELETE ON roadmap_steps
+BEGIN
+    UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS learning_resources_insert_catalog_version AFTER INSERT ON learning_resources
+BEGIN
+    UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS learning_resources_update_catalog_version AFTER UPDATE ON learning_resources
+BEGIN
+    UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS learning_resources_delete_catalog_version AFTER DELETE ON learning_resources
+BEGIN
+    UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+END;
@@ -0,0 +1,66 @@
+-- Full-text search index for the career catalog (requires SQLite FTS5)
+
+-- One row per career, rowid = careers.id
+CREATE VIRTUAL TABLE IF NOT EXISTS career_search USING fts5(
+    title,
+    description,
+    field_name,
+    skills,
+    tokenize = 'porter unicode61'
+);
+
+-- Keep career_search in sync with careers
+CREATE TRIGGER IF NOT EXISTS careers_insert_search AFTER INSERT ON careers
+BEGIN
+    INSERT INTO career_search (rowid, title, description, field_name, skills)
+    SELECT NEW.id, NEW.title, NEW.description,
+           (SELECT name FROM career_fields WHERE id = NEW.field_id),
+           (SELECT group_concat(skill, ', ') FROM career_skills WHERE career_id = NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS careers_update_search AFTER UPDATE ON careers
+BEGIN
+    DELETE FROM career_search WHERE rowid = OLD.id;
+    INSERT INTO career_search (rowid, title, description, field_name, skills)
+    SELECT NEW.id, NEW.title, NEW.description,
+           (SELECT name FROM career_fields WHERE id = NEW.field_id),
+           (SELECT group_concat(skill, ', ') FROM career_skills WHERE career_id = NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS careers_delete_search AFTER DELETE ON careers
+BEGIN
+    DELETE FROM career_search WHERE rowid = OLD.id;
+END;
+
+-- Keep the skills column in sync with career_skills
+CREATE TRIGGER IF NOT EXISTS career_skills_insert_search AFTER INSERT ON career_skills
+BEGIN
+    UPDATE career_search
+    SET skills = (SELECT group_concat(skill, ', ') FROM career_skills WHERE career_id = NEW.career_id)
+    WHERE rowid = NEW.career_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS career_skills_update_search AFTER UPDATE ON career_skills
+BEGIN
+    UPDATE career_search
+    SET skills = (SELECT group_concat(skill, ', ') FROM career_skills WHERE career_id = OLD.career_id)
+    WHERE rowid = OLD.career_id;
+    UPDATE career_search
+    SET skills = (SELECT group_concat(skill, ', ') FROM career_skills WHERE career_id = NEW.career_id)
+    WHERE rowid = NEW.career_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS career_skills_delete_search AFTER DELETE ON career_skills
+BEGIN
+    UPDATE career_search
+    SET skills = (SELECT group_concat(skill, ', ') FROM career_skills WHERE career_id = OLD.career_id)
+    WHERE rowid = OLD.career_id;
+END;
+
+-- Keep the field_name column in sync with career_fields
+CREATE TRIGGER IF NOT EXISTS career_fields_update_search AFTER UPDATE OF name ON career_fields
+BEGIN
+    UPDATE career_search
+    SET field_name = NEW.name
+    WHERE rowid IN (SELECT id FROM careers WHERE field_id = NEW.id);
+END;
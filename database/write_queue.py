@@ -0,0 +1,221 @@
+import atexit
+import queue
+import sqlite3
+import threading
+import time
+import logging
+from itertools import groupby
+from typing import Any, Dict, List, Sequence, Tuple
+
+from database.connection_pool import ConnectionPool
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of the queue for the background writer
+_STOP = object()
+
+class WriteBehindQueue:
+    """
+    Background writer that batches INSERT statements into group commits.
+
+    Writes are queued and flushed by a daemon thread every flush_interval
+    seconds, or sooner once batch_size writes are waiting. Each flush runs
+    consecutive writes with the same SQL through one executemany call, all
+    inside a single transaction, so many chat turns share one fsync.
+    """
+
+    def __init__(self, pool: ConnectionPool, max_pending: int = 10000, batch_size: int = 500,
+                 flush_interval: float = 0.5, put_timeout: float = 5.0):
+        """
+        Initialize the queue and start the background writer
+
+        Args:
+            pool: Connection pool whose writer connection is used for flushes
+            max_pending: Maximum number of queued writes; producers block when full
+            batch_size: Maximum number of writes per transaction
+            flush_interval: Seconds to wait for more writes before flushing
+            put_timeout: Seconds a producer waits for queue space before the
+                write is rejected
+        """
+        self._pool = pool
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_pending)
+        self._closed = False
+
+        # Writes are numbered in queue order; flush waits for the number of
+        # the last write queued when it was called to be processed. The lock
+        # also orders submits against close.
+        self._submit_lock = threading.Lock()
+        self._submitted = 0
+        self._processed = 0
+        self._processed_changed = threading.Condition()
+
+        self.batches_written = 0
+        self.rows_written = 0
+        self.rows_failed = 0
+
+        self._thread = threading.Thread(target=self._run, name="db-write-behind", daemon=True)
+        self._thread.start()
+
+        # Make sure queued writes reach the database on interpreter shutdown
+        atexit.register(self.close)
+
+    def submit(self, sql: str, params: Sequence[Any]) -> bool:
+        """
+        Queue a write
+
+        Args:
+            sql: Parameterized SQL statement
+            params: Statement parameters
+
+        Returns:
+            True if the write was queued, False if the queue is closed or
+            stayed full for put_timeout seconds
+        """
+        # Numbering and queueing under one lock keeps the numbers in queue
+        # order, and close() takes the same lock, so no write can be queued
+        # behind the stop marker
+        with self._submit_lock:
+            if self._closed:
+                logger.error("Write rejected: write-behind queue is closed")
+                return False
+            try:
+                sequence = self._submitted + 1
+                self._queue.put((sequence, sql, tuple(params)), timeout=self.put_timeout)
+                self._submitted = sequence
+                return True
+            except queue.Full:
+                logger.error(f"Write rejected: write-behind queue full for {self.put_timeout}s")
+                return False
+
+    def flush(self) -> None:
+        """
+        Block until every write queued before this call has been processed
+
+        Writes queued by other threads after the call are not waited for,
+        so a busy queue cannot hold up the caller indefinitely.
+        """
+        target = self._submitted
+        with self._processed_changed:
+            # Also stop waiting if the writer has died, rather than hang forever
+            while self._processed < target and self._thread.is_alive():
+                self._processed_changed.wait(timeout=self.flush_interval)
+
+    def close(self) -> None:
+        """Flush pending writes and stop the background writer"""
+        with self._submit_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join()
+
+    def pending(self) -> int:
+        """Get the approximate number of writes waiting to be flushed"""
+        return self._queue.qsize()
+
+    def _run(self) -> None:
+        """Background loop: collect a batch, write it, repeat until stopped"""
+        while True:
+            first = self._queue.get()
+            batch = [first]
+            stop = first is _STOP
+
+            # Gather whatever arrives within the flush interval of the first
+            # write, up to batch_size
+            deadline = time.monotonic() + self.flush_interval
+            while not stop and len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(item)
+                stop = item is _STOP
+
+            writes = [item for item in batch if item is not _STOP]
+            try:
+                if writes:
+                    self._write_batch([(sql, params) for _, sql, params in writes])
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+                if writes:
+                    with self._processed_changed:
+                        self._processed = writes[-1][0]
+                        self._processed_changed.notify_all()
+
+            if stop:
+                return
+
+    def _write_batch(self, writes: List[Tuple[str, tuple]]) -> None:
+        """
+        Commit a batch of writes in one transaction.
+
+        Each run of consecutive writes with the same SQL is executed with
+        executemany inside a savepoint. If a run fails (for example on a
+        constraint), it is retried row by row so one bad row does not drop
+        the rest of the batch.
+        """
+        written = 0
+        try:
+            with self._pool.writer() as conn:
+                # Open the transaction explicitly; otherwise releasing the
+                # first savepoint would commit on its own
+                conn.execute("BEGIN")
+                for sql, group in groupby(writes, key=lambda write: write[0]):
+                    rows = [params for _, params in group]
+                    conn.execute("SAVEPOINT write_behind")
+                    try:
+                        conn.executemany(sql, rows)
+                        conn.execute("RELEASE write_behind")
+                        written += len(rows)
+                    except Exception:
+                        conn.execute("ROLLBACK TO write_behind")
+                        conn.execute("RELEASE write_behind")
+                        written += self._write_rows_individually(conn, sql, rows)
+            self.batches_written += 1
+            self.rows_written += written
+            self.rows_failed += len(writes) - written
+        except Exception as e:
+            self.rows_failed += len(writes)
+            logger.error(f"Error flushing {len(writes)} queued writes: {str(e)}")
+
+    def _write_rows_individually(self, conn: sqlite3.Connection, sql: str, rows: List[tuple]) -> int:
+        """
+        Retry a failed run one row at a time, logging and skipping bad rows
+
+        Returns:
+            Number of rows written
+        """
+        written = 0
+        for params in rows:
+            conn.execute("SAVEPOINT write_behind_row")
+            try:
+                conn.execute(sql, params)
+                conn.execute("RELEASE write_behind_row")
+                written += 1
+            except Exception as e:
+                conn.execute("ROLLBACK TO write_behind_row")
+                conn.execute("RELEASE write_behind_row")
+                logger.error(f"Error writing queued row: {str(e)}")
+        return written
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get queue statistics
+
+        Returns:
+            Dictionary with pending writes, batches and row counts
+        """
+        return {
+            'pending': self.pending(),
+            'batches_written': self.batches_written,
+            'rows_written': self.rows_written,
+            'rows_failed': self.rows_failed
+        }
@@ -0,0 +1,48 @@
+import os
+import sys
+import zipfile
+from datetime import date
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.career_db import CareerDatabase
+from utils.cohort_export import MANIFEST_NAME, export_cohort_plans
+
+def _make_database(tmp_path):
+    db = CareerDatabase(str(tmp_path / "cohort.db"))
+    user_id = db.add_user("Ann", "ann@example.com")
+    for score, career_id in enumerate(sorted(db.get_career_titles_by_id())[:2]):
+        assert db.add_career_suggestion(user_id, career_id, 1.0 - score / 10)
+    db.flush_writes()
+    return db
+
+def test_rerun_skips_only_plans_with_the_same_key(tmp_path):
+    db = _make_database(tmp_path)
+    output = str(tmp_path / "plans")
+
+    first = export_cohort_plans(db, output, workers=1, generated_on=date(2030, 1, 1))
+    assert (first["planned"], first["rendered"], first["failed"]) == (2, 2, 0)
+    assert os.path.exists(os.path.join(output, MANIFEST_NAME))
+
+    resumed = export_cohort_plans(db, output, workers=1, generated_on=date(2030, 1, 1))
+    assert (resumed["skipped"], resumed["rendered"]) == (2, 0)
+
+    redated = export_cohort_plans(db, output, workers=1, generated_on=date(2030, 2, 1))
+    assert (redated["skipped"], redated["rendered"]) == (0, 2)
+    db.close()
+
+def test_zip_export_records_its_manifest(tmp_path):
+    db = _make_database(tmp_path)
+    output = str(tmp_path / "plans.zip")
+
+    assert export_cohort_plans(db, output, workers=1, generated_on=date(2030, 1, 1))["rendered"] == 2
+    assert export_cohort_plans(db, output, workers=1, generated_on=date(2030, 1, 1))["skipped"] == 2
+    assert export_cohort_plans(db, output, workers=1, generated_on=date(2030, 2, 1))["rendered"] == 2
+
+    with zipfile.ZipFile(output) as archive:
+        members = archive.namelist()
+    assert MANIFEST_NAME in members
+    assert len([name for name in members if name.endswith(".pdf")]) == 2
+    assert not os.path.exists(output + ".parts")
+    db.close()
@@ -0,0 +1,28 @@
+import os
+import sys
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.career_db import CareerDatabase
+
+def test_goal_changes_are_limited_to_the_owner(tmp_path):
+    db = CareerDatabase(str(tmp_path / "goals.db"))
+    owner = db.add_user("Owner", "owner@example.com")
+    other = db.add_user("Other", "other@example.com")
+    assert db.add_learning_goal(owner, "Learn SQL", "Joins and indexes", "Technical Skill", "2030-01-01")
+    db.flush_writes()
+    goal_id = db.get_learning_goals(owner)[0]['id']
+
+    assert not db.update_learning_goal(other, goal_id, title="Hijacked")
+    assert not db.complete_learning_goal(other, goal_id)
+    assert not db.delete_learning_goal(other, goal_id)
+    goal = db.get_learning_goals(owner)[0]
+    assert goal['title'] == "Learn SQL" and not goal['completed']
+
+    assert db.update_learning_goal(owner, goal_id, title="Learn PostgreSQL")
+    assert db.complete_learning_goal(owner, goal_id)
+    assert db.get_learning_goals(owner, completed=True)[0]['title'] == "Learn PostgreSQL"
+    assert db.delete_learning_goal(owner, goal_id)
+    assert db.get_learning_goals(owner) == []
+    db.close()
@@ -0,0 +1,58 @@
+import os
+import sys
+import threading
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.connection_pool import ConnectionPool
+from database.write_queue import WriteBehindQueue
+
+def _make_queue(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "queue.db"))
+    with pool.writer() as conn:
+        conn.execute("CREATE TABLE events (value INTEGER)")
+    return pool, WriteBehindQueue(pool, flush_interval=0.01)
+
+def _count(pool):
+    with pool.reader() as conn:
+        return conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+def test_flush_commits_queued_writes(tmp_path):
+    pool, write_queue = _make_queue(tmp_path)
+    for value in range(100):
+        assert write_queue.submit("INSERT INTO events (value) VALUES (?)", (value,))
+    write_queue.flush()
+    assert _count(pool) == 100
+    write_queue.close()
+    pool.close()
+
+def test_close_while_submitting_loses_no_accepted_write(tmp_path):
+    pool, write_queue = _make_queue(tmp_path)
+    accepted = []
+    started = threading.Event()
+
+    def produce():
+        for value in range(5000):
+            if not write_queue.submit("INSERT INTO events (value) VALUES (?)", (value,)):
+                return
+            accepted.append(value)
+            started.set()
+
+    producers = [threading.Thread(target=produce) for _ in range(2)]
+    for producer in producers:
+        producer.start()
+    started.wait(timeout=5)
+    write_queue.close()
+    for producer in producers:
+        producer.join(timeout=10)
+
+    # Every write submit accepted reached the database, and flush after
+    # close returns instead of waiting for writes that were never processed
+    flusher = threading.Thread(target=write_queue.flush, daemon=True)
+    flusher.start()
+    flusher.join(timeout=5)
+    assert not flusher.is_alive()
+    assert _count(pool) == len(accepted)
+    assert not write_queue.submit("INSERT INTO events (value) VALUES (?)", (0,))
+    pool.close()
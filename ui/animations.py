@@ -1,29 +1,55 @@
 import streamlit as st
 import streamlit_lottie
-import requests
-import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+
+from utils.asset_cache import AssetCache
+
+LOTTIE_BASE_URL = "https://assets5.lottiefiles.com/packages"
+
+# Dictionary mapping animation types to URLs
+ANIMATION_URLS = {
+    "welcome": f"{LOTTIE_BASE_URL}/lf20_khzniaya.json",
+    "thinking": f"{LOTTIE_BASE_URL}/lf20_yd8fbnml.json",
+    "success": f"{LOTTIE_BASE_URL}/lf20_jvkzwk0t.json",
+    "error": f"{LOTTIE_BASE_URL}/lf20_rbtawnwz.json",
+    "loading": f"{LOTTIE_BASE_URL}/lf20_p8bfn5to.json",
+    "career": f"{LOTTIE_BASE_URL}/lf20_vvmkgfp3.json",
+    "education": f"{LOTTIE_BASE_URL}/lf20_jtbfg2nb.json",
+    "roadmap": f"{LOTTIE_BASE_URL}/lf20_cmaqoazd.json"
+}
+
+# Map career fields to animation URLs
+FIELD_ANIMATION_URLS = {
+    "technology": ANIMATION_URLS["career"],
+    "design": ANIMATION_URLS["education"],
+    "business": ANIMATION_URLS["roadmap"],
+    "healthcare": ANIMATION_URLS["loading"],
+    "education": ANIMATION_URLS["thinking"]
+}
+
+def all_animation_urls() -> List[str]:
+    """Every animation URL the UI can display, without duplicates"""
+    return list(dict.fromkeys(list(ANIMATION_URLS.values()) + list(FIELD_ANIMATION_URLS.values())))
+
+@st.cache_resource
+def get_animation_cache() -> AssetCache:
+    """Get the shared animation cache, prefetching every animation in the background on first use"""
+    cache = AssetCache()
+    cache.prefetch(all_animation_urls())
+    return cache
 
 def load_lottie_animation(url: str) -> Optional[Dict[str, Any]]:
     """
-    Load a Lottie animation from a URL
+    Load a Lottie animation from the animation cache, without waiting for the network
     
     Args:
         url: URL to the Lottie animation JSON
         
     Returns:
-        Dictionary containing the Lottie animation data or None if loading fails
+        Dictionary containing the Lottie animation data or None if it has not
+        been downloaded yet (or cannot be)
     """
-    try:
-        response = requests.get(url)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            st.error(f"Failed to load animation from {url}: HTTP {response.status_code}")
-            return None
-    except Exception as e:
-        st.error(f"Error loading animation: {str(e)}")
-        return None
+    return get_animation_cache().get(url)
 
 def get_animation_url(animation_type: str) -> str:
     """
@@ -35,19 +61,7 @@ def get_animation_url(animation_type: str) -> str:
     Returns:
         URL to the Lottie animation JSON
     """
-    # Dictionary mapping animation types to URLs
-    animation_urls = {
-        "welcome": "https://assets5.lottiefiles.com/packages/lf20_khzniaya.json",
-        "thinking": "https://assets5.lottiefiles.com/packages/lf20_yd8fbnml.json",
-        "success": "https://assets5.lottiefiles.com/packages/lf20_jvkzwk0t.json",
-        "error": "https://assets5.lottiefiles.com/packages/lf20_rbtawnwz.json",
-        "loading": "https://assets5.lottiefiles.com/packages/lf20_p8bfn5to.json",
-        "career": "https://assets5.lottiefiles.com/packages/lf20_vvmkgfp3.json",
-        "education": "https://assets5.lottiefiles.com/packages/lf20_jtbfg2nb.json",
-        "roadmap": "https://assets5.lottiefiles.com/packages/lf20_cmaqoazd.json"
-    }
-    
-    return animation_urls.get(animation_type, animation_urls["welcome"])
+    return ANIMATION_URLS.get(animation_type, ANIMATION_URLS["welcome"])
 
 def display_career_animation(career_field: str) -> None:
     """
@@ -56,22 +70,10 @@ def display_career_animation(career_field: str) -> None:
     Args:
         career_field: The career field to display an animation for
     """
-    # Map career fields to animation types
-    field_to_animation = {
-        "technology": "https://assets5.lottiefiles.com/packages/lf20_vvmkgfp3.json",
-        "design": "https://assets5.lottiefiles.com/packages/lf20_jtbfg2nb.json",
-        "business": "https://assets5.lottiefiles.com/packages/lf20_cmaqoazd.json",
-        "healthcare": "https://assets5.lottiefiles.com/packages/lf20_p8bfn5to.json",
-        "education": "https://assets5.lottiefiles.com/packages/lf20_yd8fbnml.json"
-    }
-    
     # Get the animation URL for the career field
-    animation_url = field_to_animation.get(
-        career_field.lower(), 
-        "https://assets5.lottiefiles.com/packages/lf20_khzniaya.json"  # Default animation
-    )
+    animation_url = FIELD_ANIMATION_URLS.get(career_field.lower(), ANIMATION_URLS["welcome"])
     
     # Load and display the animation
     animation_data = load_lottie_animation(animation_url)
     if animation_data:
-        streamlit_lottie.st_lottie(animation_data, height=200)
\ No newline at end of file
+        streamlit_lottie.st_lottie(animation_data, height=200)
@@ -1,7 +1,6 @@
 import streamlit as st
 import pandas as pd
 import time
-from datetime import datetime
 import json
 import sys
 import os
@@ -10,14 +9,89 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import project modules
-from database.career_db import CareerDatabase
+from database.career_db import get_default_database
+from utils.personality import CareerTraitMatcher, score_quiz, submit_quiz_result
+from utils.pdf_generator import PDFGenerationError
+from utils.pdf_cache import CareerPlanCache
+
+def get_career_database():
+    """Get the career database shared across sessions, so its caches survive reruns"""
+    return get_default_database()
+
+@st.cache_resource
+def get_trait_matcher():
+    """Get the career trait matcher shared across sessions"""
+    return CareerTraitMatcher(get_career_database())
+
+@st.cache_resource
+def get_career_plan_cache():
+    """Get the on-disk cache of rendered career plan PDFs"""
+    return CareerPlanCache()
+
+def get_session_user_id():
+    """Get the database user for this session, creating a guest user on first use"""
+    if st.session_state.get('user_id') is None:
+        name = st.session_state.get('user_profile', {}).get('name') or "Guest"
+        st.session_state.user_id = get_career_database().add_user(name, None)
+    return st.session_state.user_id
+
+# Number of recent chat messages kept in session state and rendered on every
+# rerun; older messages stay in the database and are loaded a page at a time
+CHAT_WINDOW_SIZE = 20
+CHAT_PAGE_SIZE = 20
+
+def reset_chat_pages():
+    """Forget the older chat pages loaded into this session"""
+    st.session_state.chat_older_messages = []
+    st.session_state.chat_history_cursor = None
+    st.session_state.chat_history_exhausted = False
+
+def add_chat_turn(role, content, **details):
+    """
+    Persist a chat message and append it to the recent message window
+    
+    Args:
+        role: 'user' or 'assistant'
+        content: Message text
+        **details: Extra fields kept with the message in session state (e.g. latency)
+    """
+    persisted = get_career_database().add_chat_message(get_session_user_id(), content, role)
+    
+    messages = st.session_state.messages
+    messages.append({"role": role, "content": content, "persisted": persisted, **details})
+    if len(messages) > CHAT_WINDOW_SIZE:
+        del messages[:len(messages) - CHAT_WINDOW_SIZE]
+        st.session_state.chat_has_older = True
+    
+    # Loaded pages end where the window started, so they are dropped each turn
+    reset_chat_pages()
+
+def load_older_chat_page():
+    """Load the next page of chat messages older than those shown into session state"""
+    db = get_career_database()
+    cursor = st.session_state.get('chat_history_cursor')
+    if cursor is None:
+        # The first page starts just before the window, whose messages may still be queued
+        db.flush_writes()
+        skip = sum(1 for message in st.session_state.messages if message.get("persisted"))
+    else:
+        skip = 0
+    
+    page, next_cursor = db.get_chat_history_page(get_session_user_id(), cursor, CHAT_PAGE_SIZE, skip)
+    st.session_state.chat_older_messages = page + st.session_state.get('chat_older_messages', [])
+    st.session_state.chat_history_cursor = next_cursor
+    st.session_state.chat_history_exhausted = next_cursor is None
 
 def render_chat_interface():
-    """Render the chat interface with message history and input box"""
+    """Render the chat interface with the recent message window and older pages on demand"""
     st.header("💬 Chat with AI Career Counselor")
     
-    # Display chat messages from history
-    for message in st.session_state.messages:
+    if st.session_state.get('chat_has_older') and not st.session_state.get('chat_history_exhausted'):
+        if st.button("Load earlier messages", key="load_earlier_messages"):
+            load_older_chat_page()
+    
+    # Older pages the user asked for, then the recent window
+    for message in st.session_state.get('chat_older_messages', []) + st.session_state.messages:
         with st.chat_message(message["role"]):
             st.markdown(message["content"])
     
@@ -27,13 +101,10 @@ def render_career_cards(careers, on_view_roadmap=None, on_download_pdf=None):
     st.header("🎯 Recommended Careers")
     
     # Get career database
-    db = CareerDatabase()
+    db = get_career_database()
     
-    for career_title in careers:
-        career = db.get_career_by_title(career_title)
-        if not career:
-            continue
-            
+    # Fetch all suggested careers in one batch
+    for career in db.get_careers_by_titles(careers):
         with st.expander(f"**{career['title']}**", expanded=True):
             st.markdown(f"**Average Salary:** ${career['salary']:,}/year")
             st.markdown("**Required Skills:**")
@@ -50,6 +121,27 @@ def render_career_cards(careers, on_view_roadmap=None, on_download_pdf=None):
                     if st.button(f"Download Plan (PDF)", key=f"pdf_{career['title']}"):
                         on_download_pdf(career['title'])
 
+def render_career_plan_download(career_title, user_profile):
+    """Render a download button for a career plan PDF, served from the PDF cache when possible"""
+    career = get_career_database().get_career_by_title(career_title)
+    if not career:
+        st.error(f"Could not find career details for '{career_title}'.")
+        return
+    
+    try:
+        pdf_bytes = get_career_plan_cache().get_or_render(career, user_profile)
+    except PDFGenerationError as e:
+        st.error(str(e))
+        return
+    
+    st.download_button(
+        label="Download Career Plan",
+        data=pdf_bytes,
+        file_name=f"{career_title.replace(' ', '_')}_career_plan.pdf",
+        mime="application/pdf",
+        key=f"download_{career_title}"
+    )
+
 def render_roadmap(career):
     """Render a career roadmap with steps"""
     st.header(f"🗺️ Career Roadmap: {career['title']}")
@@ -144,41 +236,49 @@ def render_personality_quiz():
         if submitted:
             st.success("Quiz completed! Based on your responses, here are your recommended career paths:")
 
-            # This would normally use a more sophisticated algorithm
-            # For now, we'll use a simple mapping based on highest skills
-            skills = {
-                "technical": technical_skills,
-                "creative": creative_skills,
-                "people": people_skills
-            }
+            traits = score_quiz(
+                [work_style, problem_solving, work_environment, *career_values],
+                technical_skills, creative_skills, people_skills
+            )
 
-            top_skill = max(skills, key=skills.get)
+            # Rank every career against the trait vector and store the result
+            user_id = get_session_user_id()
+            if user_id is not None:
+                ranked = submit_quiz_result(get_career_database(), get_trait_matcher(), user_id, traits)
+            else:
+                ranked = get_trait_matcher().rank(traits)
 
-            if top_skill == "technical":
-                careers = ["Data Scientist", "Software Engineer", "Systems Analyst"]
-            elif top_skill == "creative":
-                careers = ["UX Designer", "Content Creator", "Digital Marketing Specialist"]
-            else:  # people skills
-                careers = ["Human Resources Manager", "Sales Executive", "Customer Success Manager"]
+            for _, title, score in ranked:
+                st.markdown(f"- **{title}**: {score:.0%} match")
 
             # Update session state with suggested careers
-            st.session_state.user_profile['suggested_careers'] = careers
+            st.session_state.user_profile['suggested_careers'] = [title for _, title, _ in ranked]
 
     # Display career cards outside of the form if there are suggested careers
     if st.session_state.user_profile.get('suggested_careers'):
         render_career_cards(
             st.session_state.user_profile['suggested_careers'],
             on_view_roadmap=lambda career: st.session_state.update({"selected_career": career, "current_view": "chat"}),
-            on_download_pdf=lambda career: st.write(f"Download PDF for {career} (functionality to be implemented)")
+            on_download_pdf=lambda career: render_career_plan_download(career, st.session_state.user_profile)
         )
 
+def _toggle_learning_goal(goal_id):
+    """Checkbox callback: save the completion status of one of the session user's goals"""
+    completed = st.session_state[f"goal_done_{goal_id}"]
+    if not get_career_database().complete_learning_goal(get_session_user_id(), goal_id, completed):
+        st.error("Could not update the goal. Please try again.")
+
+def _delete_learning_goal(goal_id):
+    """Button callback: delete one of the session user's goals"""
+    if not get_career_database().delete_learning_goal(get_session_user_id(), goal_id):
+        st.error("Could not delete the goal. Please try again.")
+
 def render_weekly_tracker():
-    """Render the weekly learning goal tracker"""
+    """Render the weekly learning goal tracker, backed by the learning_goals table"""
     st.header("📅 Weekly Learning Tracker")
     
-    # Initialize weekly goals in session state if not present
-    if 'weekly_goals' not in st.session_state:
-        st.session_state.weekly_goals = []
+    db = get_career_database()
+    user_id = get_session_user_id()
     
     # Form to add new goals
     with st.form("add_goal"):
@@ -193,49 +293,45 @@ def render_weekly_tracker():
         
         submitted = st.form_submit_button("Add Goal")
         if submitted and goal_title:
-            # Add new goal to the list
-            st.session_state.weekly_goals.append({
-                "title": goal_title,
-                "description": goal_description,
-                "deadline": goal_deadline.strftime("%Y-%m-%d"),
-                "category": goal_category,
-                "completed": False,
-                "created_at": datetime.now().strftime("%Y-%m-%d")
-            })
-            st.success(f"Goal '{goal_title}' added successfully!")
+            if db.add_learning_goal(user_id, goal_title, goal_description, goal_category,
+                                    goal_deadline.strftime("%Y-%m-%d")):
+                # Make the queued insert visible to the goal list below
+                db.flush_writes()
+                st.success(f"Goal '{goal_title}' added successfully!")
+            else:
+                st.error("Could not save the goal. Please try again.")
+    
+    # Filter options
+    filter_status = st.radio("Filter by status:", ["All", "Completed", "In Progress"], horizontal=True)
+    status = {"All": None, "Completed": True, "In Progress": False}[filter_status]
+    goals = db.get_learning_goals(user_id, completed=status)
     
     # Display existing goals
-    if st.session_state.weekly_goals:
+    if goals:
         st.subheader("Your Learning Goals")
         
-        # Filter options
-        filter_status = st.radio("Filter by status:", ["All", "Completed", "In Progress"], horizontal=True)
-        
-        # Apply filters
-        filtered_goals = st.session_state.weekly_goals
-        if filter_status == "Completed":
-            filtered_goals = [g for g in filtered_goals if g["completed"]]
-        elif filter_status == "In Progress":
-            filtered_goals = [g for g in filtered_goals if not g["completed"]]
-        
-        # Display goals
-        for i, goal in enumerate(filtered_goals):
+        # Widgets are keyed by goal id and save through callbacks, so each
+        # toggle or delete writes one row during Streamlit's normal rerun
+        for goal in goals:
             with st.expander(f"{goal['title']} ({goal['category']})", expanded=True):
                 st.write(f"**Description:** {goal['description']}")
                 st.write(f"**Deadline:** {goal['deadline']}")
                 
-                # Toggle completion status
-                completed = st.checkbox("Mark as completed", value=goal["completed"], key=f"goal_{i}")
-                
-                # Update the goal's completion status
-                if completed != goal["completed"]:
-                    st.session_state.weekly_goals[i]["completed"] = completed
-                    st.experimental_rerun()
-                
-                # Delete goal
-                if st.button("Delete Goal", key=f"delete_{i}"):
-                    st.session_state.weekly_goals.pop(i)
-                    st.experimental_rerun()
+                st.checkbox(
+                    "Mark as completed",
+                    value=goal["completed"],
+                    key=f"goal_done_{goal['id']}",
+                    on_change=_toggle_learning_goal,
+                    args=(goal['id'],)
+                )
+                st.button(
+                    "Delete Goal",
+                    key=f"delete_goal_{goal['id']}",
+                    on_click=_delete_learning_goal,
+                    args=(goal['id'],)
+                )
+    elif filter_status != "All":
+        st.info(f"No goals with status '{filter_status}'.")
     else:
         st.info("You haven't added any learning goals yet. Use the form above to add your first goal!")
 
@@ -0,0 +1,209 @@
+import os
+import json
+import time
+import hashlib
+import tempfile
+import threading
+import logging
+from typing import Any, Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Animations shipped with the app, named by the last part of their URL
+# (e.g. lf20_khzniaya.json); checked before the download cache
+BUNDLED_ASSET_DIR = os.path.join(_PROJECT_ROOT, "ui", "assets", "lottie")
+
+# Downloaded animations, kept across restarts
+DEFAULT_ASSET_CACHE_DIR = os.path.join(_PROJECT_ROOT, "database", "cache", "lottie")
+
+# Set to 1 to never download assets (bundled and cached files only)
+OFFLINE_ASSETS_ENV_VAR = "CAREER_COUNSELOR_OFFLINE_ASSETS"
+
+# Seconds before a failed download is tried again
+DEFAULT_RETRY_AFTER = 300.0
+
+class AssetCache:
+    """
+    Two-level (memory and disk) cache of JSON assets such as Lottie animations.
+
+    Lookups never touch the network: an asset is served from memory, the
+    bundled asset directory or the download cache, and a missing asset is
+    fetched on a background thread so it is available on a later lookup.
+    prefetch downloads a list of assets in the background at startup.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_ASSET_CACHE_DIR, bundled_dir: Optional[str] = BUNDLED_ASSET_DIR,
+                 timeout: float = 5.0, retry_after: float = DEFAULT_RETRY_AFTER, offline: Optional[bool] = None):
+        """
+        Initialize the cache
+
+        Args:
+            cache_dir: Directory for downloaded assets
+            bundled_dir: Directory of assets shipped with the app, or None
+            timeout: Connect and read timeout of a download, in seconds
+            retry_after: Seconds before a failed download is retried
+            offline: Never download (defaults to CAREER_COUNSELOR_OFFLINE_ASSETS)
+        """
+        if offline is None:
+            offline = os.environ.get(OFFLINE_ASSETS_ENV_VAR, "").strip().lower() in ("1", "true", "yes")
+
+        self.cache_dir = cache_dir
+        self.bundled_dir = bundled_dir
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self.offline = offline
+
+        self._lock = threading.Lock()
+        self._memory: Dict[str, Any] = {}
+        self._failed_at: Dict[str, float] = {}
+        self._in_flight = set()
+        self._session = requests.Session()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.downloads = 0
+        self.download_failures = 0
+
+    def get(self, url: str) -> Optional[Any]:
+        """
+        Get an asset without waiting for the network
+
+        Args:
+            url: Asset URL
+
+        Returns:
+            Parsed JSON asset, or None if it is not available locally yet (a
+            background download is then started unless offline)
+        """
+        with self._lock:
+            if url in self._memory:
+                self.memory_hits += 1
+                return self._memory[url]
+
+        data = self._load_local(url)
+        with self._lock:
+            if data is not None:
+                self._memory[url] = data
+                self.disk_hits += 1
+                return data
+            self.misses += 1
+
+        self._fetch_in_background([url])
+        return None
+
+    def prefetch(self, urls: Iterable[str]) -> Optional[threading.Thread]:
+        """
+        Download every asset that is not available locally, on a background thread
+
+        Args:
+            urls: Asset URLs
+
+        Returns:
+            The download thread, or None if nothing needs downloading
+        """
+        missing = []
+        for url in dict.fromkeys(urls):
+            data = self._load_local(url)
+            if data is None:
+                missing.append(url)
+            else:
+                with self._lock:
+                    self._memory.setdefault(url, data)
+        return self._fetch_in_background(missing)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with assets in memory, memory and disk hits, misses,
+            downloads and failed downloads
+        """
+        with self._lock:
+            return {
+                'in_memory': len(self._memory),
+                'memory_hits': self.memory_hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'downloads': self.downloads,
+                'download_failures': self.download_failures
+            }
+
+    def _bundled_path(self, url: str) -> Optional[str]:
+        if self.bundled_dir is None:
+            return None
+        return os.path.join(self.bundled_dir, os.path.basename(urlsplit(url).path))
+
+    def _cache_path(self, url: str) -> str:
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()[:12]
+        return os.path.join(self.cache_dir, f"{digest}_{os.path.basename(urlsplit(url).path)}")
+
+    def _load_local(self, url: str) -> Optional[Any]:
+        """Read an asset from the bundled directory or the download cache"""
+        for path in (self._bundled_path(url), self._cache_path(url)):
+            if path is None or not os.path.exists(path):
+                continue
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable asset {path}: {str(e)}")
+        return None
+
+    def _fetch_in_background(self, urls: Iterable[str]) -> Optional[threading.Thread]:
+        """Start a daemon thread downloading the URLs not already in flight or recently failed"""
+        if self.offline:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            urls = [url for url in urls if url not in self._in_flight
+                    and now - self._failed_at.get(url, -self.retry_after) >= self.retry_after]
+            self._in_flight.update(urls)
+        if not urls:
+            return None
+
+        thread = threading.Thread(target=self._fetch_all, args=(urls,), name="asset-prefetch", daemon=True)
+        thread.start()
+        return thread
+
+    def _fetch_all(self, urls: Iterable[str]) -> None:
+        for url in urls:
+            try:
+                data = self._download(url)
+            except Exception as e:
+                logger.warning(f"Could not download asset {url}: {str(e)}")
+                with self._lock:
+                    self.download_failures += 1
+                    self._failed_at[url] = time.monotonic()
+                    self._in_flight.discard(url)
+                continue
+
+            with self._lock:
+                self._memory[url] = data
+                self.downloads += 1
+                self._failed_at.pop(url, None)
+                self._in_flight.discard(url)
+
+    def _download(self, url: str) -> Any:
+        """Download an asset and atomically store it in the download cache"""
+        response = self._session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        data = response.json()
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self._cache_path(url))
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+        return data
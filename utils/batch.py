@@ -0,0 +1,87 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+# Default number of items sent to a worker process at a time
+DEFAULT_CHUNK_SIZE = 256
+
+def _apply_to_chunk(func: Callable[[Any], Any], chunk: List[Any]) -> List[Any]:
+    """Apply func to every item of a chunk inside a worker process"""
+    return [func(item) for item in chunk]
+
+def _chunks(items: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """Split an iterable into lists of at most chunk_size items"""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def imap_in_processes(func: Callable[[Any], Any], items: Iterable[Any], workers: Optional[int] = None,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Lazily apply a picklable, module-level function to every item using a process pool.
+
+    Items are consumed lazily in chunks and at most two chunks per worker are
+    in flight, so arbitrarily long iterables do not need to fit in memory
+    before work starts. Results are yielded in input order as soon as their
+    chunk is done, so callers can report progress or write results out as
+    they arrive. With a single worker, or when everything fits in one chunk,
+    the work runs inline and no pool is started.
+
+    Args:
+        func: Function to apply; must be importable by worker processes
+        items: Iterable of inputs
+        workers: Number of worker processes (defaults to the CPU count)
+        chunk_size: Number of items sent to a worker at a time
+
+    Yields:
+        One result per input item, in input order
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    workers = workers or os.cpu_count() or 1
+
+    chunks = _chunks(items, chunk_size)
+    first = next(chunks, None)
+    if first is None:
+        return
+    second = next(chunks, None)
+    if workers <= 1 or second is None:
+        yield from _apply_to_chunk(func, first)
+        if second is not None:
+            yield from _apply_to_chunk(func, second)
+            for chunk in chunks:
+                yield from _apply_to_chunk(func, chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque([executor.submit(_apply_to_chunk, func, first),
+                         executor.submit(_apply_to_chunk, func, second)])
+        for chunk in chunks:
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+            pending.append(executor.submit(_apply_to_chunk, func, chunk))
+        while pending:
+            yield from pending.popleft().result()
+
+def map_in_processes(func: Callable[[Any], Any], items: Iterable[Any], workers: Optional[int] = None,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Any]:
+    """
+    Apply a picklable, module-level function to every item using a process pool.
+
+    See imap_in_processes for how work is chunked and scheduled.
+
+    Args:
+        func: Function to apply; must be importable by worker processes
+        items: Iterable of inputs
+        workers: Number of worker processes (defaults to the CPU count)
+        chunk_size: Number of items sent to a worker at a time
+
+    Returns:
+        List of results, one per input item
+    """
+    return list(imap_in_processes(func, items, workers=workers, chunk_size=chunk_size))
@@ -0,0 +1,304 @@
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import zipfile
+import argparse
+import tempfile
+import logging
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.batch import imap_in_processes
+from utils.pdf_cache import career_plan_key
+from utils.pdf_generator import PDFGenerationError, render_career_plan_pdf_bytes
+
+logger = logging.getLogger(__name__)
+
+# Plans rendered per worker task; small because each plan takes tens of
+# milliseconds and results should stream back for progress reporting
+EXPORT_CHUNK_SIZE = 4
+
+# Suffix of the directory plans are staged in while exporting to a zip
+STAGING_SUFFIX = ".parts"
+
+# File (or zip member) mapping each exported plan's path to its content key
+MANIFEST_NAME = "manifest.json"
+
+# Plans rendered between manifest checkpoints while exporting
+MANIFEST_SAVE_INTERVAL = 50
+
+class ExportJob(NamedTuple):
+    """One career plan to render"""
+    path: str                   # Output path relative to the export root
+    career: Dict[str, Any]      # Career record
+    name: str                   # Name the plan greets
+
+def _slug(text: Optional[str]) -> str:
+    """File-name-safe version of a name or title"""
+    return re.sub(r"\W+", "_", text or "").strip("_") or "unnamed"
+
+def plan_path(user_id: int, name: Optional[str], title: str) -> str:
+    """
+    Relative path of a user's plan for a career in the export
+
+    Args:
+        user_id: User ID
+        name: User's name
+        title: Career title
+
+    Returns:
+        Path of the form user_000042_Ann/Software_Developer.pdf
+    """
+    return f"user_{user_id:06d}_{_slug(name)}/{_slug(title)}.pdf"
+
+def build_export_jobs(db, user_ids: Optional[List[int]] = None, per_user: int = 3) -> List[ExportJob]:
+    """
+    List the plans to export for a cohort
+
+    Args:
+        db: CareerDatabase to read users, suggestions and careers from
+        user_ids: Users to export (defaults to every user with suggestions)
+        per_user: Maximum number of plans per user, best suggestions first
+
+    Returns:
+        List of export jobs, grouped by user in user id order
+    """
+    users = db.get_user_career_suggestions(user_ids, per_user)
+    career_ids = sorted({career_id for user in users for career_id in user["career_ids"]})
+    careers = {career["id"]: career for career in db.get_careers_by_ids(career_ids)}
+
+    jobs = []
+    for user in users:
+        for career_id in user["career_ids"]:
+            career = careers.get(career_id)
+            if career is None:
+                logger.warning(f"Skipping missing career {career_id} suggested to user {user['user_id']}")
+                continue
+            jobs.append(ExportJob(plan_path(user["user_id"], user["name"], career["title"]),
+                                  career, user["name"] or "there"))
+    return jobs
+
+def _render_job(task: Tuple[ExportJob, date]) -> Tuple[str, Optional[bytes], Optional[str]]:
+    """Render one plan in a worker process, returning (path, PDF or None, error or None)"""
+    job, generated_on = task
+    try:
+        return job.path, render_career_plan_pdf_bytes(job.career, {'name': job.name}, generated_on), None
+    except PDFGenerationError as e:
+        return job.path, None, str(e)
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """Write a file via a temporary file and rename, so it only ever exists complete"""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+def _existing_plans(root: str) -> Set[str]:
+    """Relative paths of the finished PDFs under a directory"""
+    found = set()
+    for directory, _, filenames in os.walk(root):
+        for filename in filenames:
+            if filename.endswith(".pdf"):
+                relative = os.path.relpath(os.path.join(directory, filename), root)
+                found.add(relative.replace(os.sep, "/"))
+    return found
+
+def _parse_manifest(text: bytes, source: str) -> Dict[str, str]:
+    """Plan keys by path from a manifest's JSON, or an empty dict if it is unreadable"""
+    try:
+        manifest = json.loads(text)
+    except ValueError as e:
+        logger.warning(f"Ignoring unreadable export manifest {source}: {str(e)}")
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+def _read_manifest(root: str) -> Dict[str, str]:
+    """Plan keys by path of the finished PDFs recorded in a directory's manifest"""
+    path = os.path.join(root, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {}
+    with open(path, "rb") as f:
+        manifest = _parse_manifest(f.read(), path)
+    existing = _existing_plans(root)
+    return {plan: key for plan, key in manifest.items() if plan in existing}
+
+def _write_manifest(root: str, manifest: Dict[str, str]) -> None:
+    """Atomically save a directory's manifest"""
+    _write_atomic(os.path.join(root, MANIFEST_NAME), json.dumps(manifest, indent=1, sort_keys=True).encode("utf-8"))
+
+def _zip_manifest(zip_path: str) -> Dict[str, str]:
+    """Plan keys by path of the PDFs in an existing export zip"""
+    if not os.path.exists(zip_path):
+        return {}
+    with zipfile.ZipFile(zip_path) as archive:
+        members = set(archive.namelist())
+        if MANIFEST_NAME not in members:
+            return {}
+        manifest = _parse_manifest(archive.read(MANIFEST_NAME), f"{zip_path}:{MANIFEST_NAME}")
+    return {plan: key for plan, key in manifest.items() if plan in members}
+
+def _pack_zip(zip_path: str, staging_dir: str, archived: Dict[str, str], staged: Dict[str, str]) -> None:
+    """
+    Atomically replace the export zip with the archived plans still current plus
+    the staged PDFs and their manifest, then remove the staging directory
+
+    Args:
+        zip_path: Path of the export zip
+        staging_dir: Directory the new PDFs were rendered to
+        archived: Plan keys of the members of the old zip to keep
+        staged: Plan keys of the finished PDFs in the staging directory
+    """
+    manifest = {**archived, **staged}
+    directory = os.path.dirname(os.path.abspath(zip_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".zip.tmp")
+    os.close(fd)
+    try:
+        # PDFs are already compressed, so they are stored as they are
+        with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_STORED) as archive:
+            if os.path.exists(zip_path):
+                with zipfile.ZipFile(zip_path) as previous:
+                    for info in previous.infolist():
+                        if info.filename in archived and info.filename not in staged:
+                            archive.writestr(info, previous.read(info))
+            for name in sorted(staged):
+                archive.write(os.path.join(staging_dir, name), name)
+            archive.writestr(MANIFEST_NAME, json.dumps(manifest, indent=1, sort_keys=True))
+        os.replace(tmp_path, zip_path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+    shutil.rmtree(staging_dir)
+
+def export_cohort_plans(db, output: str, user_ids: Optional[List[int]] = None, per_user: int = 3,
+                        workers: Optional[int] = None, generated_on: Optional[date] = None,
+                        progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+    """
+    Render the career plans of a cohort across a process pool.
+
+    Plans are written to a directory, or to a zip file if output ends in
+    .zip. Each PDF is written atomically as soon as it is rendered (zip
+    exports are staged in output + ".parts" and packed at the end). A
+    manifest.json next to the PDFs records the content key of every
+    finished plan, which covers the career record, the name and the date
+    printed on it; plans whose key is unchanged are skipped, so an
+    interrupted export resumes where it stopped when run again, while a
+    rerun with another date or after a career changed renders them anew.
+
+    Args:
+        db: CareerDatabase to read users, suggestions and careers from
+        output: Output directory, or path of a .zip file
+        user_ids: Users to export (defaults to every user with suggestions)
+        per_user: Maximum number of plans per user, best suggestions first
+        workers: Number of worker processes (defaults to the CPU count)
+        generated_on: Date printed on the plans (defaults to today)
+        progress: Called with (plans finished, plans to render) after each plan
+
+    Returns:
+        Dictionary with counts of planned, skipped, rendered and failed
+        plans, the failures as (path, error) pairs, elapsed seconds and
+        plans rendered per second
+    """
+    generated_on = generated_on or date.today()
+    as_zip = output.lower().endswith(".zip")
+    root = output + STAGING_SUFFIX if as_zip else output
+    os.makedirs(root, exist_ok=True)
+
+    # Zip exports keep the plans of earlier runs in the zip and new ones in
+    # the staging directory until they are packed
+    manifest = _read_manifest(root)
+    archived = _zip_manifest(output) if as_zip else {}
+
+    jobs = build_export_jobs(db, user_ids, per_user)
+    keys = {job.path: career_plan_key(job.career, job.name, generated_on) for job in jobs}
+    pending = [job for job in jobs if manifest.get(job.path, archived.get(job.path)) != keys[job.path]]
+
+    # Forget the plans about to be rendered before overwriting any of them,
+    # so an interrupted run never leaves a stale PDF recorded as current
+    for job in pending:
+        manifest.pop(job.path, None)
+        archived.pop(job.path, None)
+    _write_manifest(root, manifest)
+
+    failures: List[Tuple[str, str]] = []
+    rendered = 0
+
+    start_time = time.perf_counter()
+    tasks = ((job, generated_on) for job in pending)
+    try:
+        for finished, (path, data, error) in enumerate(
+                imap_in_processes(_render_job, tasks, workers=workers, chunk_size=EXPORT_CHUNK_SIZE), 1):
+            target = os.path.join(root, path)
+            if data is None:
+                logger.error(f"Error exporting {path}: {error}")
+                failures.append((path, error))
+                # Do not leave the outdated plan behind in place of the new one
+                if os.path.exists(target):
+                    os.unlink(target)
+            else:
+                _write_atomic(target, data)
+                manifest[path] = keys[path]
+                rendered += 1
+                if rendered % MANIFEST_SAVE_INTERVAL == 0:
+                    _write_manifest(root, manifest)
+            if progress:
+                progress(finished, len(pending))
+    finally:
+        _write_manifest(root, manifest)
+    elapsed = time.perf_counter() - start_time
+
+    if as_zip:
+        _pack_zip(output, root, archived, manifest)
+
+    return {
+        "planned": len(jobs),
+        "skipped": len(jobs) - len(pending),
+        "rendered": rendered,
+        "failed": len(failures),
+        "failures": failures,
+        "seconds": elapsed,
+        "plans_per_sec": rendered / elapsed if elapsed > 0 else 0.0
+    }
+
+def main() -> None:
+    """Export the career plans of a cohort and report progress and throughput"""
+    from database.career_db import CareerDatabase
+
+    parser = argparse.ArgumentParser(description="Export career plan PDFs for every user's suggested careers")
+    parser.add_argument("output", help="Output directory, or a .zip file")
+    parser.add_argument("--db", default="database/career_counselor.db", help="SQLite database path")
+    parser.add_argument("--users", type=lambda value: [int(user_id) for user_id in value.split(",")],
+                        help="Comma-separated user IDs (defaults to every user with suggestions)")
+    parser.add_argument("--per-user", type=int, default=3, help="Plans per user")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (defaults to the CPU count)")
+    parser.add_argument("--date", type=lambda value: datetime.strptime(value, "%Y-%m-%d").date(),
+                        default=None, help="Date printed on the plans, YYYY-MM-DD (defaults to today)")
+    args = parser.parse_args()
+
+    def report_progress(finished: int, total: int) -> None:
+        print(f"\r{finished}/{total} plans", end="\n" if finished == total else "", file=sys.stderr, flush=True)
+
+    db = CareerDatabase(args.db)
+    stats = export_cohort_plans(db, args.output, args.users, args.per_user, args.workers, args.date,
+                                progress=report_progress)
+    db.close()
+
+    print(f"Rendered {stats['rendered']} of {stats['planned']} plans ({stats['skipped']} already exported, "
+          f"{stats['failed']} failed) in {stats['seconds']:.2f}s ({stats['plans_per_sec']:.1f} plans/sec) "
+          f"to {args.output}")
+    if stats["failed"]:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
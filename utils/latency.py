@@ -0,0 +1,104 @@
+import time
+import threading
+import logging
+from collections import deque
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Number of recent turns kept for the latency summary
+DEFAULT_LATENCY_WINDOW = 1000
+
+class TurnTimer:
+    """Times one chat turn from the user's message to the last response chunk"""
+
+    def __init__(self, recorder: "LatencyRecorder"):
+        """
+        Start timing a turn
+
+        Args:
+            recorder: Recorder the finished turn is reported to
+        """
+        self._recorder = recorder
+        self._started = time.perf_counter()
+        self._first_chunk: Optional[float] = None
+        self.chunks = 0
+
+    def mark_chunk(self) -> None:
+        """Note that a response chunk was rendered"""
+        if self._first_chunk is None:
+            self._first_chunk = time.perf_counter()
+        self.chunks += 1
+
+    def finish(self) -> Dict[str, Any]:
+        """
+        Stop timing and report the turn to the recorder
+
+        Returns:
+            Dictionary with first_chunk_ms, total_ms and chunks; a turn with no
+            chunks counts its total time as time to first chunk
+        """
+        finished = time.perf_counter()
+        first_chunk = self._first_chunk if self._first_chunk is not None else finished
+        latency = {
+            'first_chunk_ms': (first_chunk - self._started) * 1000,
+            'total_ms': (finished - self._started) * 1000,
+            'chunks': self.chunks
+        }
+        self._recorder.record(latency['first_chunk_ms'], latency['total_ms'])
+        return latency
+
+class LatencyRecorder:
+    """Thread-safe record of recent chat turn latencies"""
+
+    def __init__(self, window: int = DEFAULT_LATENCY_WINDOW):
+        """
+        Initialize the recorder
+
+        Args:
+            window: Number of recent turns kept for percentiles
+        """
+        self._lock = threading.Lock()
+        self._first_chunk_ms: "deque[float]" = deque(maxlen=window)
+        self._total_ms: "deque[float]" = deque(maxlen=window)
+        self.turns = 0
+
+    def start_turn(self) -> TurnTimer:
+        """Start timing a chat turn"""
+        return TurnTimer(self)
+
+    def record(self, first_chunk_ms: float, total_ms: float) -> None:
+        """
+        Record a finished turn
+
+        Args:
+            first_chunk_ms: Milliseconds until the first response chunk
+            total_ms: Milliseconds until the response was complete
+        """
+        with self._lock:
+            self._first_chunk_ms.append(first_chunk_ms)
+            self._total_ms.append(total_ms)
+            self.turns += 1
+        logger.info(f"Chat turn: first chunk {first_chunk_ms:.1f} ms, total {total_ms:.1f} ms")
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Get latency percentiles over the recent window
+
+        Returns:
+            Dictionary with the total turn count and p50/p95 of time to first
+            chunk and total turn time in milliseconds (None before any turn)
+        """
+        with self._lock:
+            first_chunk = np.array(self._first_chunk_ms)
+            total = np.array(self._total_ms)
+            turns = self.turns
+
+        summary: Dict[str, Any] = {'turns': turns}
+        for name, values in (('first_chunk', first_chunk), ('total', total)):
+            for percentile in (50, 95):
+                summary[f'{name}_p{percentile}_ms'] = (
+                    float(np.percentile(values, percentile)) if len(values) else None)
+        return summary
@@ -0,0 +1,68 @@
+import os
+import sys
+import logging
+from typing import Any, Dict, Iterable, List
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.nlp_utils import detect_intent, extract_keywords, get_career_recommendations
+from utils.sentiment import adjust_response
+
+logger = logging.getLogger(__name__)
+
+# Replies per intent, taken from the Rasa domain's utter_*_response texts
+INTENT_RESPONSES = {
+    'tech_interest': "I can see you have a passion for technology! Here are some careers that could be "
+                     "great fits for your interests. Would you like more details about any of them?",
+    'creative_mind': "You have a creative spirit! Here are some careers that could be excellent matches. "
+                     "Would you like to explore any of these options further?",
+    'business_interest': "Your business acumen is evident! Here are some careers that could be great matches "
+                         "for your interests. Would you like to learn more about any of these paths?",
+    'healthcare_interest': "Your interest in healthcare is clear! Here are some careers that might be "
+                           "excellent fits. Would you like to learn more about these paths?",
+    'education_interest': "Your passion for education is evident! Here are some careers that could be great "
+                          "matches. Would you like to learn more about these paths?",
+    'confused_state': "It's completely normal to feel uncertain about career choices. Let's break this down "
+                      "step by step. First, could you tell me about activities or subjects that you enjoy, "
+                      "even if they don't seem career-related?",
+    'dream_job': "It's wonderful that you have a dream career in mind! To help you work toward that goal, "
+                 "could you tell me more about what specifically attracts you to this field?",
+    'goal_oriented': "I appreciate your focus on clear career goals. Let's create a structured plan to help "
+                     "you achieve them. First, could you share what specific milestones you hope to reach "
+                     "in the next 1-2 years?",
+    'general': "Tell me about your interests or skills that you enjoy using, and I'll suggest career paths "
+               "that might suit you."
+}
+
+def local_responses(message_text: str, sentiment: str, interests: Iterable[str] = ()) -> List[Dict[str, Any]]:
+    """
+    Answer a message without Rasa, for when the Rasa server is unavailable
+
+    Args:
+        message_text: User's message
+        sentiment: Detected sentiment (positive, neutral, negative)
+        interests: Interests already known for the user, kept in the payload
+
+    Returns:
+        Bot responses in Rasa's shape: a text reply, followed by a custom
+        payload with suggested careers and interests when keywords matched
+    """
+    intent = detect_intent(message_text)
+    keywords = extract_keywords(message_text)
+    responses: List[Dict[str, Any]] = [
+        {"text": adjust_response(INTENT_RESPONSES.get(intent, INTENT_RESPONSES['general']), sentiment)}
+    ]
+
+    if keywords['all']:
+        try:
+            careers = get_career_recommendations(keywords, sentiment)
+        except Exception as e:
+            logger.error(f"Error recommending careers locally: {str(e)}")
+            careers = []
+        custom: Dict[str, Any] = {"interests": list(dict.fromkeys(list(interests) + keywords['all']))}
+        if careers:
+            custom["careers"] = careers
+        responses.append({"custom": custom})
+
+    return responses
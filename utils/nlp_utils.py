@@ -1,23 +1,148 @@
 import re
+import os
+import sys
 import string
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
-from typing import List, Dict, Any, Set
-
-# Download required NLTK resources
-try:
-    nltk.data.find('tokenizers/punkt')
-    nltk.data.find('corpora/stopwords')
-    nltk.data.find('corpora/wordnet')
-except LookupError:
-    nltk.download('punkt')
-    nltk.download('stopwords')
-    nltk.download('wordnet')
-
-# Initialize lemmatizer
-lemmatizer = WordNetLemmatizer()
+import logging
+import threading
+from functools import lru_cache
+from typing import List, Dict, Any, Set, Tuple, NamedTuple, Iterable, Optional, Callable, FrozenSet, Pattern
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.batch import map_in_processes, DEFAULT_CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+# NLTK resources are loaded lazily on first use and never downloaded. They are
+# looked up in the directory named by this environment variable, then in a
+# vendored nltk_data/ directory at the project root, then in NLTK's defaults.
+NLTK_DATA_ENV_VAR = "CAREER_COUNSELOR_NLTK_DATA"
+VENDORED_NLTK_DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "nltk_data")
+
+# Used when the NLTK stopwords corpus is not installed (NLTK's English list)
+FALLBACK_STOPWORDS = frozenset("""
+i me my myself we our ours ourselves you you're you've you'll you'd your yours
+yourself yourselves he him his himself she she's her hers herself it it's its
+itself they them their theirs themselves what which who whom this that that'll
+these those am is are was were be been being have has had having do does did
+doing a an the and but if or because as until while of at by for with about
+against between into through during before after above below to from up down
+in out on off over under again further then once here there when where why how
+all any both each few more most other some such no nor not only own same so
+than too very s t can will just don don't should should've now d ll m o re ve
+y ain aren aren't couldn couldn't didn didn't doesn doesn't hadn hadn't hasn
+hasn't haven haven't isn isn't ma mightn mightn't mustn mustn't needn needn't
+shan shan't shouldn shouldn't wasn wasn't weren weren't won won't wouldn wouldn't
+""".split())
+
+# Bounded memo of token -> lemma; chat vocabulary repeats heavily
+LEMMA_CACHE_SIZE = 50000
+
+# Messages up to this many characters skip punkt and use the regex tokenizer
+FAST_TOKENIZE_MAX_CHARS = 280
+
+# Words (keeping inner apostrophes, as in "don't") or single punctuation marks
+_FAST_TOKEN_PATTERN = re.compile(r"\w+(?:'\w+)*|[^\w\s]")
+
+_nltk_lock = threading.Lock()
+_nltk_resources: Dict[str, Any] = {}
+
+def _configure_nltk_data_path() -> None:
+    """Put the configured and vendored NLTK data directories first on the search path"""
+    import nltk
+    for path in (VENDORED_NLTK_DATA, os.environ.get(NLTK_DATA_ENV_VAR)):
+        if path and os.path.isdir(path) and path not in nltk.data.path:
+            nltk.data.path.insert(0, path)
+
+def _load_nltk_resource(name: str, loader: Callable[[], Any]) -> Any:
+    """
+    Load an NLTK resource once per process.
+    
+    Args:
+        name: Resource name used as the cache key and in log messages
+        loader: Function returning the resource; may raise LookupError when
+            the data is not installed
+        
+    Returns:
+        The loaded resource, or None if it is unavailable
+    """
+    try:
+        return _nltk_resources[name]
+    except KeyError:
+        pass
+    
+    with _nltk_lock:
+        if name not in _nltk_resources:
+            try:
+                _configure_nltk_data_path()
+                _nltk_resources[name] = loader()
+            except (ImportError, LookupError, OSError) as e:
+                # NLTK's LookupError messages are long banners; log the gist
+                lines = [line.strip() for line in str(e).splitlines() if line.strip("* \t")]
+                reason = lines[0] if lines else type(e).__name__
+                logger.warning(f"NLTK {name} unavailable, using fallback: {reason}")
+                _nltk_resources[name] = None
+        return _nltk_resources[name]
+
+def _load_stopwords() -> FrozenSet[str]:
+    """Load NLTK's English stopwords as a frozen set"""
+    from nltk.corpus import stopwords
+    return frozenset(stopwords.words('english'))
+
+def _load_word_tokenizer() -> Callable[[str], List[str]]:
+    """Load NLTK's punkt-based word tokenizer"""
+    from nltk.tokenize import word_tokenize
+    # Fail now rather than on the first real message if punkt is missing
+    word_tokenize("probe")
+    return word_tokenize
+
+def _load_lemmatizer() -> Callable[[str], str]:
+    """Load the WordNet lemmatizer"""
+    from nltk.stem import WordNetLemmatizer
+    lemmatizer = WordNetLemmatizer()
+    lemmatizer.lemmatize("probes")
+    return lemmatizer.lemmatize
+
+def get_stopwords() -> FrozenSet[str]:
+    """Get the English stopword set (NLTK's corpus, or a built-in copy)"""
+    return _load_nltk_resource("stopwords", _load_stopwords) or FALLBACK_STOPWORDS
+
+def fast_tokenize(text: str) -> List[str]:
+    """Tokenize text with a single regex; no sentence splitting or punkt model"""
+    return _FAST_TOKEN_PATTERN.findall(text)
+
+def word_tokenize(text: str) -> List[str]:
+    """Tokenize text with NLTK's punkt tokenizer, or the regex tokenizer if punkt is missing"""
+    tokenizer = _load_nltk_resource("punkt", _load_word_tokenizer)
+    if tokenizer is None:
+        return fast_tokenize(text)
+    return tokenizer(text)
+
+@lru_cache(maxsize=LEMMA_CACHE_SIZE)
+def lemmatize(token: str) -> str:
+    """Lemmatize a token with WordNet (memoized), or return it unchanged if WordNet is missing"""
+    lemmatizer = _load_nltk_resource("wordnet", _load_lemmatizer)
+    if lemmatizer is None:
+        return token
+    return lemmatizer(token)
+
+def get_lemma_cache_stats() -> Dict[str, Any]:
+    """
+    Get statistics for the lemma cache
+    
+    Returns:
+        Dictionary with size, hits, misses and hit rate
+    """
+    info = lemmatize.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        'size': info.currsize,
+        'max_size': info.maxsize,
+        'hits': info.hits,
+        'misses': info.misses,
+        'hit_rate': info.hits / lookups if lookups else 0.0
+    }
 
 # Career-related keyword sets
 TECH_KEYWORDS = {
@@ -58,6 +183,142 @@ EDUCATION_KEYWORDS = {
 # Combine all keywords
 ALL_CAREER_KEYWORDS = TECH_KEYWORDS | CREATIVE_KEYWORDS | BUSINESS_KEYWORDS | HEALTHCARE_KEYWORDS | EDUCATION_KEYWORDS
 
+# Intent indicator phrases, checked in this order of precedence by detect_intent
+CONFUSION_INDICATORS = ['confused', 'not sure', 'dont know', 'uncertain', 'help me', 'lost', 'guidance']
+GOAL_INDICATORS = ['want to become', 'goal', 'goals', 'plan', 'plans', 'planning', 'roadmap', 'steps',
+                   'how to', 'achieve', 'career path']
+DREAM_INDICATORS = ['dream job', 'always wanted', 'passion', 'passionate', 'love to', 'aspire', 'ideal career']
+
+# Bit assigned to each keyword category and intent indicator group
+CATEGORY_BITS = {
+    'tech': 1 << 0,
+    'creative': 1 << 1,
+    'business': 1 << 2,
+    'healthcare': 1 << 3,
+    'education': 1 << 4
+}
+INTENT_BITS = {
+    'confused_state': 1 << 5,
+    'goal_oriented': 1 << 6,
+    'dream_job': 1 << 7
+}
+
+# Catalog field terms added to recommendation queries for each matched category
+CATEGORY_QUERY_TERMS = {
+    'tech': 'technology',
+    'creative': 'design',
+    'business': 'business',
+    'healthcare': 'healthcare',
+    'education': 'education'
+}
+
+class PhraseMatcher:
+    """
+    Token trie mapping multi-word phrases to category bitmasks.
+    
+    Built once at import; match() finds every phrase occurrence in a token
+    list in a single left-to-right pass.
+    """
+    
+    def __init__(self):
+        # Each node is a dict of token -> child node; the None key holds
+        # (phrase, bitmask) when a phrase ends at that node
+        self._root: Dict[Any, Any] = {}
+    
+    def add(self, phrase: str, bit: int, label: Optional[str] = None) -> None:
+        """
+        Register a phrase under a category bit
+        
+        Args:
+            phrase: Space-separated phrase, as preprocess_text tokenizes it
+            bit: Category bit to OR into the phrase's mask
+            label: Text reported for matches (defaults to the phrase)
+        """
+        node = self._root
+        for token in phrase.split():
+            node = node.setdefault(token, {})
+        label, mask = node.get(None, (label or phrase, 0))
+        node[None] = (label, mask | bit)
+    
+    def match(self, tokens: List[str], alternates: List[str] = None) -> List[Tuple[str, int, int]]:
+        """
+        Find all phrase occurrences, including overlapping ones
+        
+        Args:
+            tokens: Tokens to scan
+            alternates: Optional second form per token (e.g. its lemma) that
+                may also match
+            
+        Returns:
+            List of (phrase, bitmask, start index) tuples in text order
+        """
+        matches = []
+        n = len(tokens)
+        for start in range(n):
+            nodes = [self._root]
+            i = start
+            while nodes and i < n:
+                forms = {tokens[i]}
+                if alternates is not None:
+                    forms.add(alternates[i])
+                next_nodes = []
+                for node in nodes:
+                    for form in forms:
+                        child = node.get(form)
+                        if child is not None:
+                            next_nodes.append(child)
+                for node in next_nodes:
+                    if None in node:
+                        phrase, mask = node[None]
+                        matches.append((phrase, mask, start))
+                nodes = next_nodes
+                i += 1
+        return matches
+
+def _category_keywords() -> Dict[str, Set[str]]:
+    """Keyword set of each category"""
+    return {
+        'tech': TECH_KEYWORDS,
+        'creative': CREATIVE_KEYWORDS,
+        'business': BUSINESS_KEYWORDS,
+        'healthcare': HEALTHCARE_KEYWORDS,
+        'education': EDUCATION_KEYWORDS
+    }
+
+def _is_symbol_keyword(keyword: str) -> bool:
+    """
+    Whether a keyword loses its meaning in preprocess_text, leaving a
+    single-letter token ('c++' becomes 'c'); such keywords are matched on
+    the raw text instead
+    """
+    normalized = preprocess_text(keyword)
+    return normalized != keyword and any(len(token) < 2 for token in normalized.split())
+
+def _build_keyword_matcher() -> PhraseMatcher:
+    """Build the matcher for all career keywords and intent indicators"""
+    matcher = PhraseMatcher()
+    for category, keywords in _category_keywords().items():
+        for keyword in keywords:
+            if not _is_symbol_keyword(keyword):
+                # Keywords with punctuation ('e-learning') match their
+                # normalized form but are reported as written
+                matcher.add(preprocess_text(keyword), CATEGORY_BITS[category], label=keyword)
+    
+    intent_lists = {
+        'confused_state': CONFUSION_INDICATORS,
+        'goal_oriented': GOAL_INDICATORS,
+        'dream_job': DREAM_INDICATORS
+    }
+    for intent, indicators in intent_lists.items():
+        for indicator in indicators:
+            matcher.add(indicator, INTENT_BITS[intent])
+    return matcher
+
+class KeywordMatch(NamedTuple):
+    """Result of one matcher pass over a message"""
+    keywords: Dict[str, List[str]]  # category -> matched keywords, plus 'all'
+    intent_mask: int                # OR of INTENT_BITS for indicators found
+
 def preprocess_text(text: str) -> str:
     """
     Preprocess text by converting to lowercase, removing punctuation,
@@ -83,56 +344,87 @@ def preprocess_text(text: str) -> str:
     
     return text
 
-def tokenize_text(text: str) -> List[str]:
+def _build_symbol_keyword_patterns() -> List[Tuple[str, int, Pattern[str]]]:
+    """Build (keyword, category mask, pattern) for keywords matched on the raw text"""
+    masks: Dict[str, int] = {}
+    for category, keywords in _category_keywords().items():
+        for keyword in keywords:
+            if _is_symbol_keyword(keyword):
+                masks[keyword] = masks.get(keyword, 0) | CATEGORY_BITS[category]
+    return [
+        (keyword, mask, re.compile(r"(?<!\w)" + re.escape(keyword) + r"(?![\w+#])"))
+        for keyword, mask in sorted(masks.items())
+    ]
+
+# Precompiled matchers shared by extract_keywords and detect_intent
+KEYWORD_MATCHER = _build_keyword_matcher()
+SYMBOL_KEYWORD_PATTERNS = _build_symbol_keyword_patterns()
+
+def tokenize_text(text: str, fast: Optional[bool] = None) -> List[str]:
     """
     Tokenize text into words, remove stopwords, and lemmatize.
     
     Args:
         text: Input text to tokenize
+        fast: Use the regex tokenizer instead of punkt. By default it is used
+            for messages of up to FAST_TOKENIZE_MAX_CHARS characters.
         
     Returns:
         List of processed tokens
     """
+    if fast is None:
+        fast = len(text) <= FAST_TOKENIZE_MAX_CHARS
+    
     # Tokenize
-    tokens = word_tokenize(text)
+    tokens = fast_tokenize(text) if fast else word_tokenize(text)
     
     # Remove stopwords
-    stop_words = set(stopwords.words('english'))
+    stop_words = get_stopwords()
     tokens = [token for token in tokens if token not in stop_words]
     
     # Lemmatize
-    tokens = [lemmatizer.lemmatize(token) for token in tokens]
+    tokens = [lemmatize(token) for token in tokens]
     
     return tokens
 
-def extract_keywords(text: str) -> Dict[str, List[str]]:
+def match_keywords(text: str) -> KeywordMatch:
     """
-    Extract career-related keywords from text and categorize them.
+    Find career keywords and intent indicators in one pass over the message.
+    
+    Keywords match on a token or its lemma, but never start on a stopword
+    (so 'it' in "I like it" is not read as IT). Intent indicators match
+    whole words anywhere, stopwords included ("not sure", "how to").
     
     Args:
         text: Input text to analyze
         
     Returns:
-        Dictionary with categorized keywords
+        KeywordMatch with categorized keywords and the intent bitmask
     """
-    # Preprocess and tokenize
-    processed_text = preprocess_text(text)
-    tokens = tokenize_text(processed_text)
+    tokens = preprocess_text(text).split()
+    stop_words = get_stopwords()
+    lemmas = [lemmatize(token) for token in tokens]
     
-    # Check for bigrams (two-word phrases)
-    bigrams = [' '.join(tokens[i:i+2]) for i in range(len(tokens)-1)]
+    intent_mask = 0
+    hits = []
+    for phrase, mask, start in KEYWORD_MATCHER.match(tokens, lemmas):
+        intent_mask |= mask
+        if tokens[start] not in stop_words:
+            hits.append((start, phrase, mask))
     
-    # Combine tokens and bigrams
-    all_terms = tokens + bigrams
+    # Keywords such as 'c++' are found in the raw text and placed at the
+    # token position where they start
+    lowered = text.lower() if text else ""
+    for keyword, mask, pattern in SYMBOL_KEYWORD_PATTERNS:
+        for found in pattern.finditer(lowered):
+            hits.append((len(preprocess_text(lowered[:found.start()]).split()), keyword, mask))
+    hits.sort(key=lambda hit: hit[0])
     
-    # Extract keywords by category
-    found_keywords = {
-        'tech': [kw for kw in all_terms if kw in TECH_KEYWORDS],
-        'creative': [kw for kw in all_terms if kw in CREATIVE_KEYWORDS],
-        'business': [kw for kw in all_terms if kw in BUSINESS_KEYWORDS],
-        'healthcare': [kw for kw in all_terms if kw in HEALTHCARE_KEYWORDS],
-        'education': [kw for kw in all_terms if kw in EDUCATION_KEYWORDS]
-    }
+    found_keywords = {category: [] for category in CATEGORY_BITS}
+    for _, phrase, mask in hits:
+        for category, bit in CATEGORY_BITS.items():
+            if mask & bit:
+                found_keywords[category].append(phrase)
     
     # Add general category with all found keywords
     all_found = []
@@ -140,7 +432,19 @@ def extract_keywords(text: str) -> Dict[str, List[str]]:
         all_found.extend(category_keywords)
     found_keywords['all'] = all_found
     
-    return found_keywords
+    return KeywordMatch(found_keywords, intent_mask)
+
+def extract_keywords(text: str) -> Dict[str, List[str]]:
+    """
+    Extract career-related keywords from text and categorize them.
+    
+    Args:
+        text: Input text to analyze
+        
+    Returns:
+        Dictionary with categorized keywords
+    """
+    return match_keywords(text).keywords
 
 def detect_intent(text: str) -> str:
     """
@@ -152,25 +456,14 @@ def detect_intent(text: str) -> str:
     Returns:
         Intent category: tech_interest, creative_mind, dream_job, confused_state, goal_oriented, or general
     """
-    processed_text = preprocess_text(text)
-    
-    # Check for confusion or uncertainty
-    confusion_indicators = ['confused', 'not sure', 'dont know', 'uncertain', 'help me', 'lost', 'guidance']
-    if any(indicator in processed_text for indicator in confusion_indicators):
-        return 'confused_state'
+    result = match_keywords(text)
     
-    # Check for goal-oriented language
-    goal_indicators = ['want to become', 'goal', 'plan', 'roadmap', 'steps', 'how to', 'achieve', 'career path']
-    if any(indicator in processed_text for indicator in goal_indicators):
-        return 'goal_oriented'
+    # Indicator intents take precedence in this order
+    for intent in ('confused_state', 'goal_oriented', 'dream_job'):
+        if result.intent_mask & INTENT_BITS[intent]:
+            return intent
     
-    # Check for dream job language
-    dream_indicators = ['dream job', 'always wanted', 'passion', 'love to', 'aspire', 'ideal career']
-    if any(indicator in processed_text for indicator in dream_indicators):
-        return 'dream_job'
-    
-    # Extract keywords to determine interest area
-    keywords = extract_keywords(text)
+    keywords = result.keywords
     
     # Determine primary interest area based on keyword count
     category_counts = {
@@ -189,51 +482,64 @@ def detect_intent(text: str) -> str:
     # Default to general if no specific intent is detected
     return 'general'
 
-def get_career_recommendations(keywords: Dict[str, List[str]], sentiment: str, limit: int = 3) -> List[str]:
+def extract_keywords_batch(texts: Iterable[str], workers: Optional[int] = None,
+                           chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Dict[str, List[str]]]:
+    """
+    Extract keywords from many messages using a process pool.
+    
+    Args:
+        texts: Messages to analyze
+        workers: Number of worker processes (defaults to the CPU count)
+        chunk_size: Number of messages sent to a worker at a time
+        
+    Returns:
+        List of extract_keywords results, in input order
+    """
+    return map_in_processes(extract_keywords, texts, workers=workers, chunk_size=chunk_size)
+
+def detect_intent_batch(texts: Iterable[str], workers: Optional[int] = None,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[str]:
+    """
+    Detect the intent of many messages using a process pool.
+    
+    Args:
+        texts: Messages to analyze
+        workers: Number of worker processes (defaults to the CPU count)
+        chunk_size: Number of messages sent to a worker at a time
+        
+    Returns:
+        List of detect_intent results, in input order
+    """
+    return map_in_processes(detect_intent, texts, workers=workers, chunk_size=chunk_size)
+
+def get_career_recommendations(keywords: Dict[str, List[str]], sentiment: str, limit: int = 3,
+                               recommender=None) -> List[str]:
     """
     Get career recommendations based on extracted keywords and sentiment.
-    This is a simplified version - in production, this would query the database.
+    
+    The keywords, plus a field term for each matched category, are ranked
+    against the career catalog with the TF-IDF recommender.
     
     Args:
         keywords: Dictionary of extracted keywords by category
         sentiment: Detected sentiment (positive, neutral, negative)
         limit: Maximum number of recommendations to return
+        recommender: CareerRecommender to use (defaults to one over the
+            default career database)
         
     Returns:
-        List of recommended career titles
-    """
-    # This is a simplified mapping - in production, this would use the database
-    career_matches = {
-        'tech': ['Software Developer', 'Data Scientist', 'Cybersecurity Analyst'],
-        'creative': ['UX Designer', 'Graphic Designer', 'Content Creator'],
-        'business': ['Product Manager', 'Digital Marketing Specialist', 'Financial Analyst'],
-        'healthcare': ['Healthcare Administrator', 'Medical Researcher', 'Health Informatics Specialist'],
-        'education': ['Instructional Designer', 'Education Technology Specialist', 'Curriculum Developer']
-    }
+        List of recommended career titles, best match first. Fewer than
+        limit titles are returned if fewer careers match.
+    """
+    # Imported lazily so the NLP helpers do not pull in scikit-learn
+    from utils.recommender import get_default_recommender
     
-    # Count keywords in each category
-    category_counts = {
-        category: len(kws) for category, kws in keywords.items() 
-        if category != 'all'  # Exclude the 'all' category
-    }
+    if recommender is None:
+        recommender = get_default_recommender()
+    
+    query = list(keywords.get('all', []))
+    for category, kws in keywords.items():
+        if category != 'all' and kws and category in CATEGORY_QUERY_TERMS:
+            query.append(CATEGORY_QUERY_TERMS[category])
     
-    # Sort categories by keyword count (descending)
-    sorted_categories = sorted(category_counts.keys(), key=lambda k: category_counts[k], reverse=True)
-    
-    # Get recommendations from top categories
-    recommendations = []
-    for category in sorted_categories:
-        if category in career_matches and len(recommendations) < limit:
-            # Add careers from this category that aren't already in recommendations
-            for career in career_matches[category]:
-                if career not in recommendations and len(recommendations) < limit:
-                    recommendations.append(career)
-    
-    # If we still don't have enough recommendations, add from other categories
-    if len(recommendations) < limit:
-        all_careers = [career for careers in career_matches.values() for career in careers]
-        for career in all_careers:
-            if career not in recommendations and len(recommendations) < limit:
-                recommendations.append(career)
-    
-    return recommendations[:limit]
\ No newline at end of file
+    return recommender.recommend_titles(query, limit)
\ No newline at end of file
@@ -0,0 +1,236 @@
+import os
+import sys
+import json
+import hashlib
+import tempfile
+import threading
+import logging
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Dict, Optional
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.pdf_generator import career_plan_display_name, render_career_plan_pdf_bytes
+
+logger = logging.getLogger(__name__)
+
+# Directory for cached career plan PDFs, one file per content key
+DEFAULT_PDF_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                     "database", "cache", "pdf")
+
+# Total size of cached PDFs kept before the least recently used are evicted
+DEFAULT_PDF_CACHE_BYTES = 256 * 1024 * 1024
+
+# Bump when the career plan layout changes so older PDFs are never served
+PDF_LAYOUT_VERSION = 1
+
+PDF_SUFFIX = ".pdf"
+
+def career_plan_key(career: Dict[str, Any], name: str, generated_on: date) -> str:
+    """
+    Content key of a career plan PDF
+
+    A plan is a pure function of the career record, the name it greets and
+    the date printed on it, so the key hashes all three. Hashing the record
+    itself, rather than its id and the catalog version, keeps keys unique
+    even across databases recreated at the same path.
+
+    Args:
+        career: Career data dictionary the plan is rendered from
+        name: Display name printed on the plan
+        generated_on: Date printed on the plan
+
+    Returns:
+        Hex SHA-256 digest identifying the PDF
+    """
+    material = json.dumps([PDF_LAYOUT_VERSION, career, name, generated_on.isoformat()],
+                          ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+class CareerPlanCache:
+    """
+    Size-bounded on-disk cache of rendered career plan PDFs.
+
+    Files are named by their content key and written atomically, so
+    concurrent readers never see a partial PDF. Recency is kept in file
+    modification times, so the least recently used files are evicted first
+    across restarts, once the total size exceeds max_bytes.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_PDF_CACHE_DIR, max_bytes: int = DEFAULT_PDF_CACHE_BYTES):
+        """
+        Initialize the cache. The directory is scanned on first use.
+
+        Args:
+            cache_dir: Directory for the cached PDFs
+            max_bytes: Total size of cached PDFs kept before eviction
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        # Key -> file size, least recently used first
+        self._index: Optional["OrderedDict[str, int]"] = None
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Get a cached PDF and mark it as recently used
+
+        Args:
+            key: Content key from career_plan_key
+
+        Returns:
+            The PDF, or None on a miss
+        """
+        path = self._path(key)
+        with self._lock:
+            self._ensure_index()
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+                os.utime(path)
+            except FileNotFoundError:
+                # Never written, or evicted by another process
+                self._forget(key)
+                self.misses += 1
+                return None
+
+            if key not in self._index:
+                self._index[key] = len(data)
+                self._total_bytes += len(data)
+            self._index.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Atomically store a PDF, evicting the least recently used PDFs if over budget
+
+        Args:
+            key: Content key from career_plan_key
+            data: PDF bytes
+        """
+        with self._lock:
+            self._ensure_index()
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, self._path(key))
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+
+            self._forget(key)
+            self._index[key] = len(data)
+            self._total_bytes += len(data)
+            self.writes += 1
+            self._evict()
+
+    def get_or_render(self, career: Dict[str, Any], user_profile: Dict[str, Any],
+                      generated_on: Optional[date] = None) -> bytes:
+        """
+        Get a career plan PDF from the cache, rendering and storing it on a miss
+
+        Args:
+            career: Career data dictionary
+            user_profile: User profile dictionary
+            generated_on: Date printed on the plan (defaults to today)
+
+        Returns:
+            The PDF
+
+        Raises:
+            PDFGenerationError: If the PDF could not be generated
+        """
+        generated_on = generated_on or date.today()
+        key = career_plan_key(career, career_plan_display_name(user_profile), generated_on)
+
+        data = self.get(key)
+        if data is None:
+            data = render_career_plan_pdf_bytes(career, user_profile, generated_on)
+            try:
+                self.put(key, data)
+            except OSError as e:
+                logger.warning(f"Could not write career plan cache {self._path(key)}: {str(e)}")
+        return data
+
+    def clear(self) -> None:
+        """Delete all cached PDFs (counters are kept)"""
+        with self._lock:
+            self._ensure_index()
+            for key in list(self._index):
+                self._remove(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with entry count, size, hits, misses, writes, evictions
+            and hit rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._index) if self._index is not None else 0,
+                'size_bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'writes': self.writes,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + PDF_SUFFIX)
+
+    def _ensure_index(self) -> None:
+        """Build the recency index from the files on disk, oldest first"""
+        if self._index is not None:
+            return
+
+        entries = []
+        if os.path.isdir(self.cache_dir):
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith(PDF_SUFFIX) and entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.name[:-len(PDF_SUFFIX)], stat.st_size))
+        entries.sort()
+
+        self._index = OrderedDict((key, size) for _, key, size in entries)
+        self._total_bytes = sum(size for _, _, size in entries)
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used PDFs until the cache fits in max_bytes"""
+        while self._total_bytes > self.max_bytes and self._index:
+            key = next(iter(self._index))
+            self._remove(key)
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        """Delete a cached PDF and drop it from the index"""
+        self._forget(key)
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _forget(self, key: str) -> None:
+        """Drop a key from the index without touching the file"""
+        size = self._index.pop(key, None)
+        if size is not None:
+            self._total_bytes -= size
@@ -1,8 +1,182 @@
 from fpdf import FPDF
+import fpdf.fpdf
+import fpdf.ttfonts
+from fpdf.ttfonts import TTFontFile
 import os
+import sys
+import struct
 import tempfile
-from datetime import datetime
-from typing import Dict, Any, List
+import threading
+import logging
+from datetime import date
+from typing import Dict, Any, List, Optional, Tuple
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# Fonts registered on every CareerPlanPDF, as (family, style, TTF path)
+FONT_DIR = '/usr/share/fonts/truetype/dejavu'
+PDF_FONTS = (
+    ('DejaVu', '', os.path.join(FONT_DIR, 'DejaVuSans.ttf')),
+    ('DejaVu', 'B', os.path.join(FONT_DIR, 'DejaVuSans-Bold.ttf'))
+)
+
+# fpdf release whose internals the font caching below is written against
+# (pinned in requirements.txt)
+SUPPORTED_FPDF_VERSION = '1.7.2'
+
+# Embedded font subsets and width tables kept per process; career plans
+# share most of their characters, so a few entries cover most documents
+FONT_SUBSET_CACHE_SIZE = 128
+
+class FontCache:
+    """
+    Process-wide cache of font data shared by all CareerPlanPDF instances.
+    
+    Holds the parsed metrics of each font in PDF_FONTS, the parsed Unicode
+    cmap of each TTF file, and the embedded subsets and width tables written
+    for each set of characters used, so fonts are read and parsed from disk
+    once per process instead of once per document.
+    """
+    
+    def __init__(self):
+        self._fonts_lock = threading.Lock()
+        self._cmaps_lock = threading.Lock()
+        self._fonts = None
+        self._cmaps: Dict[Tuple[str, int], Tuple[Dict[int, int], Dict[int, List[int]], int]] = {}
+        self.subsets = LRUCache(FONT_SUBSET_CACHE_SIZE)
+        self.widths = LRUCache(FONT_SUBSET_CACHE_SIZE)
+    
+    def registered_fonts(self) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """
+        Get the fpdf font entries for PDF_FONTS, loading them on first use
+        
+        Returns:
+            Tuple of (fonts, font_files) dictionaries in FPDF's layout. They
+            are shared and must be copied before a document modifies them.
+        """
+        with self._fonts_lock:
+            if self._fonts is None:
+                prototype = FPDF()
+                for family, style, path in PDF_FONTS:
+                    prototype.add_font(family, style, path, uni=True)
+                self._fonts = (prototype.fonts, prototype.font_files)
+            return self._fonts
+    
+    def cmap(self, filename: str, offset: int, parse) -> Tuple[Dict[int, int], Dict[int, List[int]], int]:
+        """
+        Get a TTF file's parsed Unicode cmap, parsing it on first use
+        
+        Args:
+            filename: TTF file path
+            offset: Offset of the cmap subtable in the file
+            parse: Function filling (glyph_to_char, char_to_glyph) dictionaries
+                and returning the highest character code
+            
+        Returns:
+            Tuple of (char_to_glyph, glyph_to_char, max_char); shared, not to be modified
+        """
+        key = (filename, offset)
+        cached = self._cmaps.get(key)
+        if cached is None:
+            glyph_to_char: Dict[int, List[int]] = {}
+            char_to_glyph: Dict[int, int] = {}
+            max_char = parse(glyph_to_char, char_to_glyph)
+            cached = (char_to_glyph, glyph_to_char, max_char)
+            with self._cmaps_lock:
+                self._cmaps[key] = cached
+        return cached
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+        
+        Returns:
+            Dictionary with the number of parsed cmaps and the subset and
+            width cache statistics
+        """
+        return {
+            'fonts_loaded': self._fonts is not None,
+            'cmaps': len(self._cmaps),
+            'subsets': self.subsets.stats(),
+            'widths': self.widths.stats()
+        }
+
+FONT_CACHE = FontCache()
+
+class CachingTTFontFile(TTFontFile):
+    """
+    TTFontFile that takes parsed cmaps and finished subsets from FONT_CACHE.
+    
+    Output is byte-for-byte what TTFontFile produces. fpdf creates font
+    files through its module-level TTFontFile name, so this class is
+    installed there for the whole process.
+    """
+    
+    def getCMAP4(self, unicode_cmap_offset, glyphToChar, charToGlyph):
+        def parse(glyph_to_char, char_to_glyph):
+            TTFontFile.getCMAP4(self, unicode_cmap_offset, glyph_to_char, char_to_glyph)
+            return self.maxUniChar
+        
+        char_to_glyph, glyph_to_char, self.maxUniChar = FONT_CACHE.cmap(self.filename, unicode_cmap_offset, parse)
+        charToGlyph.update(char_to_glyph)
+        glyphToChar.update((glyph, list(chars)) for glyph, chars in glyph_to_char.items())
+    
+    def makeSubset(self, file, subset):
+        key = (file, os.path.getmtime(file), tuple(subset))
+        cached = FONT_CACHE.subsets.get(key)
+        if cached is None:
+            stream = super().makeSubset(file, subset)
+            cached = (stream, self.codeToGlyph, self.maxUni)
+            FONT_CACHE.subsets.put(key, cached)
+        stream, codeToGlyph, self.maxUni = cached
+        self.codeToGlyph = dict(codeToGlyph)
+        return stream
+
+def font_checksum(data: bytes) -> Tuple[int, int]:
+    """
+    TrueType table checksum, as fpdf.ttfonts.calcChecksum computes it
+    
+    The checksum is the sum of the table's big-endian 32-bit words modulo
+    2**32; fpdf adds them 16 bits at a time in a Python loop, which
+    dominated the cost of embedding a font subset.
+    
+    Args:
+        data: Table data, zero-padded to a multiple of 4 bytes if needed
+        
+    Returns:
+        Tuple of the high and low 16 bits of the checksum
+    """
+    if len(data) % 4:
+        data += b"\0" * (4 - len(data) % 4)
+    total = sum(struct.unpack(f">{len(data) // 4}L", data)) & 0xFFFFFFFF
+    return total >> 16, total & 0xFFFF
+
+def install_font_caching() -> bool:
+    """
+    Route fpdf's TrueType handling through CachingTTFontFile and font_checksum
+    
+    This replaces fpdf module globals for the whole process and relies on
+    the internals of one fpdf release, so it is skipped on any other version
+    (CareerPlanPDF then embeds fonts the usual, slower way).
+    
+    Returns:
+        True if the font caching was installed
+    """
+    version = getattr(fpdf, 'FPDF_VERSION', None)
+    if version != SUPPORTED_FPDF_VERSION:
+        logger.warning(f"Font caching disabled: fpdf {version} is installed, "
+                       f"but it only supports fpdf {SUPPORTED_FPDF_VERSION}")
+        return False
+    fpdf.fpdf.TTFontFile = CachingTTFontFile
+    fpdf.ttfonts.calcChecksum = font_checksum
+    return True
+
+FONT_CACHING_ENABLED = install_font_caching()
 
 class CareerPlanPDF(FPDF):
     """Custom PDF class for generating career plans"""
@@ -10,8 +184,35 @@ class CareerPlanPDF(FPDF):
     def __init__(self):
         super().__init__()
         self.set_auto_page_break(auto=True, margin=15)
-        self.add_font('DejaVu', '', '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', uni=True)
-        self.add_font('DejaVu', 'B', '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf', uni=True)
+        
+        if not FONT_CACHING_ENABLED:
+            for family, style, path in PDF_FONTS:
+                self.add_font(family, style, path, uni=True)
+            return
+        
+        # Register the fonts from the process-wide cache instead of add_font,
+        # which would re-read their metrics for every document
+        fonts, font_files = FONT_CACHE.registered_fonts()
+        for fontkey, font in fonts.items():
+            self.fonts[fontkey] = dict(font, i=len(self.fonts) + 1, subset=list(font['subset']))
+        for name, info in font_files.items():
+            self.font_files[name] = dict(info)
+        
+    def _putTTfontwidths(self, font, maxUni):
+        # The width table depends only on the font and, above code 255, on
+        # the characters used, so it is reused across documents
+        if not FONT_CACHING_ENABLED:
+            super()._putTTfontwidths(font, maxUni)
+            return
+        key = (font['ttffile'], maxUni, tuple(sorted(cid for cid in font['subset'] if cid > 255)))
+        widths = FONT_CACHE.widths.get(key)
+        if widths is None:
+            start = len(self.buffer)
+            super()._putTTfontwidths(font, maxUni)
+            widths = self.buffer[start:]
+            FONT_CACHE.widths.put(key, widths)
+        else:
+            self.buffer += widths
         
     def header(self):
         # Logo
@@ -84,88 +285,134 @@ class CareerPlanPDF(FPDF):
         self.multi_cell(0, 5, description)
         self.ln(5)
 
-def generate_career_plan_pdf(career: Dict[str, Any], user_profile: Dict[str, Any]) -> str:
+class PDFGenerationError(Exception):
+    """A career plan PDF could not be generated"""
+
+def career_plan_display_name(user_profile: Dict[str, Any]) -> str:
+    """Name a career plan greets the user by"""
+    return user_profile.get('name', 'there')
+
+def build_career_plan_pdf(career: Dict[str, Any], user_profile: Dict[str, Any],
+                          generated_on: Optional[date] = None) -> CareerPlanPDF:
     """
-    Generate a PDF career plan based on career data and user profile.
+    Lay out a career plan document.
     
     Args:
         career: Career data dictionary
         user_profile: User profile dictionary
+        generated_on: Date printed on the plan (defaults to today)
         
     Returns:
-        Path to the generated PDF file
+        CareerPlanPDF with every page laid out, ready for output
     """
-    try:
-        # Create PDF object
-        pdf = CareerPlanPDF()
-        pdf.alias_nb_pages()
-        pdf.add_page()
-        
-        # Add current date
-        pdf.set_font('DejaVu', '', 10)
-        pdf.cell(0, 10, f"Generated on: {datetime.now().strftime('%B %d, %Y')}", 0, 1, 'R')
-        
-        # Add personalized greeting
-        name = user_profile.get('name', 'there')
-        pdf.set_font('DejaVu', '', 12)
-        pdf.cell(0, 10, f"Hello {name},", 0, 1)
-        pdf.multi_cell(0, 5, "Based on your interests and our conversation, I've prepared this personalized career plan for you. This document outlines the key steps and resources to help you pursue a career as a:")
-        
-        # Career title
-        pdf.ln(5)
-        pdf.set_font('DejaVu', 'B', 16)
-        pdf.cell(0, 10, career['title'], 0, 1, 'C')
-        pdf.ln(5)
-        
-        # Career overview
-        pdf.chapter_title("Career Overview")
-        pdf.chapter_body(career['description'])
-        
-        # Key details
-        pdf.chapter_title("Key Details")
-        pdf.set_font('DejaVu', '', 11)
-        pdf.cell(0, 5, f"Average Salary: ${career['salary']:,}/year", 0, 1)
-        pdf.cell(0, 5, f"Growth Rate: {career['growth_rate']*100:.1f}%", 0, 1)
-        pdf.cell(0, 5, f"Typical Education: {career['education_level']}", 0, 1)
-        pdf.cell(0, 5, f"Field: {career['field_name']}", 0, 1)
-        
-        # Required skills
-        pdf.ln(5)
-        pdf.chapter_title("Required Skills")
-        pdf.print_list(career['skills'])
-        
-        # Career roadmap
-        pdf.ln(5)
-        pdf.chapter_title("Your Career Roadmap")
-        pdf.chapter_body("Follow these steps to build your career in this field:")
-        pdf.ln(5)
-        
-        # Add roadmap steps
-        for i, step in enumerate(career['roadmap']):
-            pdf.add_roadmap_step(i+1, step['title'], step['description'], step['duration'])
-        
-        # Next steps
-        pdf.ln(5)
-        pdf.chapter_title("Recommended Next Steps")
-        pdf.chapter_body("To get started on your career journey, I recommend the following actions:")
-        pdf.ln(3)
-        next_steps = [
-            "Research educational programs or courses related to this field",
-            "Connect with professionals in this industry through LinkedIn or professional organizations",
-            "Start building relevant skills through online courses or personal projects",
-            "Update your resume to highlight transferable skills and experiences",
-            "Set specific, measurable goals for the next 3-6 months"
-        ]
-        pdf.print_list(next_steps)
-        
-        # Save PDF to a temporary file
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
-        temp_file.close()
-        pdf.output(temp_file.name)
-        
-        return temp_file.name
+    # Create PDF object
+    pdf = CareerPlanPDF()
+    pdf.alias_nb_pages()
+    pdf.add_page()
+    
+    # Add current date
+    pdf.set_font('DejaVu', '', 10)
+    generated_on = generated_on or date.today()
+    pdf.cell(0, 10, f"Generated on: {generated_on.strftime('%B %d, %Y')}", 0, 1, 'R')
+    
+    # Add personalized greeting
+    name = career_plan_display_name(user_profile)
+    pdf.set_font('DejaVu', '', 12)
+    pdf.cell(0, 10, f"Hello {name},", 0, 1)
+    pdf.multi_cell(0, 5, "Based on your interests and our conversation, I've prepared this personalized career plan for you. This document outlines the key steps and resources to help you pursue a career as a:")
+    
+    # Career title
+    pdf.ln(5)
+    pdf.set_font('DejaVu', 'B', 16)
+    pdf.cell(0, 10, career['title'], 0, 1, 'C')
+    pdf.ln(5)
+    
+    # Career overview
+    pdf.chapter_title("Career Overview")
+    pdf.chapter_body(career['description'])
+    
+    # Key details
+    pdf.chapter_title("Key Details")
+    pdf.set_font('DejaVu', '', 11)
+    pdf.cell(0, 5, f"Average Salary: ${career['salary']:,}/year", 0, 1)
+    pdf.cell(0, 5, f"Growth Rate: {career['growth_rate']*100:.1f}%", 0, 1)
+    pdf.cell(0, 5, f"Typical Education: {career['education_level']}", 0, 1)
+    pdf.cell(0, 5, f"Field: {career['field_name']}", 0, 1)
+    
+    # Required skills
+    pdf.ln(5)
+    pdf.chapter_title("Required Skills")
+    pdf.print_list(career['skills'])
+    
+    # Career roadmap
+    pdf.ln(5)
+    pdf.chapter_title("Your Career Roadmap")
+    pdf.chapter_body("Follow these steps to build your career in this field:")
+    pdf.ln(5)
+    
+    # Add roadmap steps
+    for i, step in enumerate(career['roadmap']):
+        pdf.add_roadmap_step(i+1, step['title'], step['description'], step['duration'])
+    
+    # Next steps
+    pdf.ln(5)
+    pdf.chapter_title("Recommended Next Steps")
+    pdf.chapter_body("To get started on your career journey, I recommend the following actions:")
+    pdf.ln(3)
+    next_steps = [
+        "Research educational programs or courses related to this field",
+        "Connect with professionals in this industry through LinkedIn or professional organizations",
+        "Start building relevant skills through online courses or personal projects",
+        "Update your resume to highlight transferable skills and experiences",
+        "Set specific, measurable goals for the next 3-6 months"
+    ]
+    pdf.print_list(next_steps)
+    
+    return pdf
+
+def render_career_plan_pdf_bytes(career: Dict[str, Any], user_profile: Dict[str, Any],
+                                 generated_on: Optional[date] = None) -> bytes:
+    """
+    Generate a PDF career plan in memory.
+    
+    Args:
+        career: Career data dictionary
+        user_profile: User profile dictionary
+        generated_on: Date printed on the plan (defaults to today)
+        
+    Returns:
+        The PDF document
         
+    Raises:
+        PDFGenerationError: If the career record is incomplete or the PDF
+            could not be laid out
+    """
+    try:
+        pdf = build_career_plan_pdf(career, user_profile, generated_on)
+        # fpdf 1.x returns the document as a latin-1 string
+        return pdf.output(dest='S').encode('latin-1')
     except Exception as e:
-        print(f"Error generating PDF: {str(e)}")
-        # Return a dummy path if there's an error
-        return "dummy_career_plan.pdf"
\ No newline at end of file
+        title = career.get('title') if isinstance(career, dict) else None
+        logger.error(f"Error generating PDF for {title!r}: {str(e)}")
+        raise PDFGenerationError(f"Could not generate the career plan PDF: {str(e)}") from e
+
+def generate_career_plan_pdf(career: Dict[str, Any], user_profile: Dict[str, Any]) -> str:
+    """
+    Generate a PDF career plan and write it to a temporary file.
+    
+    Prefer render_career_plan_pdf_bytes when the PDF is not needed on disk.
+    
+    Args:
+        career: Career data dictionary
+        user_profile: User profile dictionary
+        
+    Returns:
+        Path to the generated PDF file; the caller removes it
+        
+    Raises:
+        PDFGenerationError: If the PDF could not be generated
+    """
+    pdf_bytes = render_career_plan_pdf_bytes(career, user_profile)
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
+        temp_file.write(pdf_bytes)
+    return temp_file.name
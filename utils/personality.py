@@ -0,0 +1,186 @@
+import os
+import sys
+import math
+import threading
+import logging
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.catalog_loader import TRAIT_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+# Personality traits, in the column order of career_traits and personality_results
+TRAIT_NAMES = tuple(TRAIT_COLUMNS)
+
+# Trait scores range over 1-10
+MIN_TRAIT_SCORE = 1
+MAX_TRAIT_SCORE = 10
+
+# Largest possible distance between two trait vectors, used to turn a
+# distance into a 0-1 match score
+MAX_TRAIT_DISTANCE = (MAX_TRAIT_SCORE - MIN_TRAIT_SCORE) * math.sqrt(len(TRAIT_NAMES))
+
+# Trait adjustments for each personality quiz answer
+QUIZ_ANSWER_TRAITS: Dict[str, Dict[str, int]] = {
+    # Work style
+    "Independently with focus on personal tasks": {'detail_oriented': 1, 'people': -1},
+    "Collaboratively in a team environment": {'people': 2},
+    "Mix of both independent and team work": {'people': 1},
+    "Leading and directing others": {'leadership': 3, 'people': 1},
+    # Problem solving
+    "Analyze data and facts methodically": {'analytical': 2, 'detail_oriented': 1},
+    "Brainstorm creative solutions": {'creative': 2},
+    "Seek input from others before deciding": {'people': 2},
+    "Trust your intuition and experience": {'leadership': 1, 'analytical': -1},
+    # Work environment
+    "Structured with clear rules and processes": {'detail_oriented': 2},
+    "Creative and flexible": {'creative': 2},
+    "Fast-paced with changing priorities": {'leadership': 1, 'detail_oriented': -1},
+    "Stable and predictable": {'detail_oriented': 1},
+    # Career values
+    "Financial security": {'analytical': 1},
+    "Making a difference": {'people': 1},
+    "Recognition and prestige": {'leadership': 1},
+    "Continuous learning": {'technical': 1},
+    "Creativity and innovation": {'creative': 1},
+    "Leadership opportunities": {'leadership': 2},
+    "Independence and autonomy": {'people': -1}
+}
+
+def score_quiz(answers: Iterable[str], technical_skills: int, creative_skills: int,
+               people_skills: int) -> Dict[str, int]:
+    """
+    Turn personality quiz responses into a trait vector.
+
+    The skill ratings set the starting technical, analytical, creative and
+    people scores; leadership and detail orientation start in the middle.
+    Each answer then adjusts the traits it says something about.
+
+    Args:
+        answers: Selected answers to the multiple-choice questions
+        technical_skills: Self-rated technical/analytical skills (1-10)
+        creative_skills: Self-rated creative/artistic skills (1-10)
+        people_skills: Self-rated interpersonal skills (1-10)
+
+    Returns:
+        Dictionary mapping each trait in TRAIT_NAMES to a 1-10 score
+    """
+    traits = {
+        'technical': technical_skills,
+        'creative': creative_skills,
+        'people': people_skills,
+        'analytical': technical_skills,
+        'leadership': 5,
+        'detail_oriented': 5
+    }
+    for answer in answers:
+        for trait, adjustment in QUIZ_ANSWER_TRAITS.get(answer, {}).items():
+            traits[trait] += adjustment
+
+    return {trait: int(min(MAX_TRAIT_SCORE, max(MIN_TRAIT_SCORE, traits[trait])))
+            for trait in TRAIT_NAMES}
+
+class CareerTraitMatcher:
+    """
+    Nearest-neighbour matching of trait vectors against the career catalog.
+
+    Career trait profiles are held in an (n_careers x n_traits) NumPy array,
+    reloaded when the catalog version changes, and a user's vector is ranked
+    against all of them with one vectorized distance computation.
+    """
+
+    def __init__(self, db):
+        """
+        Initialize the matcher. Trait profiles are loaded on first use.
+
+        Args:
+            db: CareerDatabase to read career trait profiles from
+        """
+        self.db = db
+
+        self._lock = threading.Lock()
+        self._catalog_version: Optional[int] = None
+        self._matrix = np.zeros((0, len(TRAIT_NAMES)), dtype=np.float32)
+        self._squared_norms = np.zeros(0, dtype=np.float32)
+        self._career_ids = np.zeros(0, dtype=np.int64)
+        self._career_titles: List[str] = []
+
+    def rank(self, traits: Mapping[str, float], limit: int = 3) -> List[Tuple[int, str, float]]:
+        """
+        Rank careers by how closely their trait profile matches a user's
+
+        Args:
+            traits: Mapping of every trait in TRAIT_NAMES to a 1-10 score
+            limit: Maximum number of careers to return
+
+        Returns:
+            List of (career_id, title, match score) tuples, best match first,
+            where the score is 1.0 for an identical profile and 0.0 for the
+            most distant one possible
+        """
+        self._ensure_matrix()
+        matrix = self._matrix
+        limit = min(limit, len(matrix))
+        if limit < 1:
+            return []
+
+        # Squared distances to every career from one matrix-vector product:
+        # |c - u|^2 = |c|^2 - 2 c.u + |u|^2, with |c|^2 precomputed
+        user = np.array([traits[trait] for trait in TRAIT_NAMES], dtype=np.float32)
+        squared = self._squared_norms - 2.0 * (matrix @ user) + user @ user
+
+        top = np.argpartition(squared, limit - 1)[:limit]
+        top = top[np.argsort(squared[top], kind="stable")]
+        distances = np.sqrt(np.maximum(squared[top], 0.0))
+
+        return [(int(self._career_ids[i]), self._career_titles[i],
+                 float(1.0 - distance / MAX_TRAIT_DISTANCE)) for i, distance in zip(top, distances)]
+
+    def _ensure_matrix(self) -> None:
+        """Reload the trait matrix if the catalog changed since it was loaded"""
+        catalog_version = self.db.get_catalog_version()
+        if catalog_version == self._catalog_version:
+            return
+
+        with self._lock:
+            if catalog_version == self._catalog_version:
+                return
+
+            catalog_version, profiles = self.db.get_career_traits()
+            self._career_ids = np.array([profile[0] for profile in profiles], dtype=np.int64)
+            self._career_titles = [profile[1] for profile in profiles]
+            self._matrix = np.array([profile[2:] for profile in profiles], dtype=np.float32).reshape(
+                len(profiles), len(TRAIT_NAMES))
+            self._squared_norms = np.einsum("ij,ij->i", self._matrix, self._matrix)
+            self._catalog_version = catalog_version
+            logger.info(f"Loaded trait profiles for {len(profiles)} careers")
+
+def submit_quiz_result(db, matcher: CareerTraitMatcher, user_id: int, traits: Mapping[str, int],
+                       limit: int = 3) -> List[Tuple[int, str, float]]:
+    """
+    Store a user's quiz result and rank careers against it
+
+    The trait scores are saved with add_personality_result and each ranked
+    career with add_career_suggestion, using its match score as relevance.
+
+    Args:
+        db: CareerDatabase to write to
+        matcher: Matcher over the same database
+        user_id: User ID
+        traits: Mapping of every trait in TRAIT_NAMES to a 1-10 score
+        limit: Maximum number of careers to return
+
+    Returns:
+        List of (career_id, title, match score) tuples, best match first
+    """
+    db.add_personality_result(user_id, *(traits[trait] for trait in TRAIT_NAMES))
+
+    ranked = matcher.rank(traits, limit)
+    for career_id, _, score in ranked:
+        db.add_career_suggestion(user_id, career_id, score)
+    return ranked
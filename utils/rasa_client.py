@@ -0,0 +1,431 @@
+import os
+import json
+import time
+import random
+import asyncio
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Environment variable overriding the Rasa server base URL
+RASA_URL_ENV_VAR = "CAREER_COUNSELOR_RASA_URL"
+DEFAULT_RASA_URL = "http://localhost:5005"
+
+# REST channel webhook path on the Rasa server
+WEBHOOK_PATH = "/webhooks/rest/webhook"
+
+# Responses worth retrying: the server or a proxy in front of it is
+# temporarily unable to answer
+RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+
+class RasaClientError(Exception):
+    """Base class for Rasa client errors"""
+
+class RasaUnavailableError(RasaClientError):
+    """Rasa could not be reached, timed out, or the circuit breaker is open"""
+
+class RasaResponseError(RasaClientError):
+    """Rasa answered with an unexpected status code or body"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker.
+
+    After failure_threshold consecutive failures the circuit opens and calls
+    fail fast for reset_timeout seconds. The next call after that is let
+    through as a trial: success closes the circuit, failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize the breaker in the closed state
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a trial call
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half-open once the timeout has passed"""
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._state = self.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """
+        Check whether a call may proceed
+
+        Returns:
+            True if the circuit is closed, or half-open with no trial call running
+        """
+        state = self.state
+        with self._lock:
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Close the circuit and reset the failure count"""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def release(self) -> None:
+        """End a call that was abandoned (e.g. cancelled) without an outcome, so another trial can run"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit at the threshold or after a failed trial"""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    logger.warning(f"Rasa circuit breaker opened after {self._failures} failures")
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+class RasaClient:
+    """
+    Client for the Rasa REST webhook.
+
+    Requests go through a keep-alive connection pool with separate connect
+    and read timeouts. Connection errors, timeouts and 502/503/504 responses
+    are retried a bounded number of times with jittered exponential backoff,
+    and a circuit breaker makes calls fail fast while Rasa is down. Replies
+    can be read whole with send_message or as they arrive with stream_message.
+    """
+
+    def __init__(self, base_url: Optional[str] = None, connect_timeout: float = 2.0,
+                 read_timeout: float = 10.0, max_retries: int = 2, backoff_base: float = 0.1,
+                 backoff_max: float = 1.0, pool_size: int = 10, failure_threshold: int = 5,
+                 reset_timeout: float = 30.0):
+        """
+        Initialize the client
+
+        Args:
+            base_url: Rasa server URL (defaults to CAREER_COUNSELOR_RASA_URL or
+                http://localhost:5005)
+            connect_timeout: Seconds to wait for a TCP connection
+            read_timeout: Seconds to wait for the response after connecting
+            max_retries: Retries after the first attempt for retryable failures
+            backoff_base: Upper bound of the first retry delay, doubled per retry
+            backoff_max: Cap on the retry delay
+            pool_size: Keep-alive connections kept open to the server
+            failure_threshold: Consecutive failed calls that open the circuit
+            reset_timeout: Seconds the circuit stays open before a trial call
+        """
+        base_url = base_url or os.environ.get(RASA_URL_ENV_VAR, DEFAULT_RASA_URL)
+        self.webhook_url = base_url.rstrip("/") + WEBHOOK_PATH
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+
+        # Retries are handled here, not by urllib3, so they share the breaker
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        self._stats_lock = threading.Lock()
+        self.requests_sent = 0
+        self.retries = 0
+        self.failures = 0
+        self.rejected = 0
+
+    def send_message(self, message: str, sender: str = "user") -> List[Dict[str, Any]]:
+        """
+        Send a user message to Rasa
+
+        Args:
+            message: Message text
+            sender: Conversation ID for Rasa's tracker
+
+        Returns:
+            List of bot response dictionaries (text, custom, ...)
+
+        Raises:
+            RasaUnavailableError: If Rasa is unreachable, timed out on every
+                attempt, or the circuit breaker is open
+            RasaResponseError: If Rasa answered with an error status or invalid JSON
+        """
+        payload = {"sender": sender, "message": message}
+        self._check_breaker()
+        responses = self._with_retries(self._attempt, payload)
+        self.breaker.record_success()
+        return responses
+
+    def stream_message(self, message: str, sender: str = "user") -> Iterator[Dict[str, Any]]:
+        """
+        Send a user message to Rasa and yield bot responses as they arrive
+
+        Uses the REST channel's streaming mode, in which Rasa writes each bot
+        message as a line of JSON as soon as it is produced. Only opening the
+        stream is retried; once the first response has been read, a failure
+        is raised to the caller.
+
+        Args:
+            message: Message text
+            sender: Conversation ID for Rasa's tracker
+
+        Yields:
+            Bot response dictionaries (text, custom, ...)
+
+        Raises:
+            RasaUnavailableError: If Rasa is unreachable, timed out, dropped the
+                stream, or the circuit breaker is open
+            RasaResponseError: If Rasa answered with an error status or invalid JSON
+        """
+        payload = {"sender": sender, "message": message}
+        self._check_breaker()
+        response = self._with_retries(self._open_stream, payload)
+        self.breaker.record_success()
+
+        try:
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError as e:
+                    self._record_failure()
+                    raise RasaResponseError(f"Rasa streamed invalid JSON: {e}", response.status_code)
+        except requests.RequestException as e:
+            self._record_failure()
+            raise RasaUnavailableError(f"Rasa stream from {self.webhook_url} was interrupted: {e}") from e
+        finally:
+            response.close()
+
+    def close(self) -> None:
+        """Close pooled connections"""
+        self._session.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get client statistics
+
+        Returns:
+            Dictionary with request, retry, failure and rejection counts and
+            the circuit breaker state
+        """
+        with self._stats_lock:
+            return {
+                'requests_sent': self.requests_sent,
+                'retries': self.retries,
+                'failures': self.failures,
+                'rejected': self.rejected,
+                'circuit': self.breaker.state
+            }
+
+    def _check_breaker(self) -> None:
+        """Raise immediately if the circuit breaker is rejecting calls"""
+        if not self.breaker.allow():
+            self._count("rejected")
+            raise RasaUnavailableError("Rasa circuit breaker is open; not sending request")
+
+    def _record_failure(self) -> None:
+        """Count a failed call and report it to the breaker"""
+        self._count("failures")
+        self.breaker.record_failure()
+
+    def _with_retries(self, attempt_fn: Callable[[Dict[str, Any]], Any], payload: Dict[str, Any]) -> Any:
+        """
+        Run an attempt function, retrying retryable failures with backoff
+
+        The breaker is told about a call that finally fails, but not about
+        success, which is left to the caller.
+
+        Raises:
+            RasaUnavailableError: If every attempt failed with a retryable error
+            RasaResponseError: On a non-retryable failure
+        """
+        attempt = 0
+        while True:
+            try:
+                return attempt_fn(payload)
+            except _RetryableError as e:
+                if attempt >= self.max_retries:
+                    self._record_failure()
+                    raise RasaUnavailableError(str(e)) from e.cause
+                time.sleep(self._backoff_delay(attempt))
+                attempt += 1
+                self._count("retries")
+            except Exception:
+                self._record_failure()
+                raise
+            except BaseException:
+                # Interrupted without an outcome: free the half-open trial slot
+                self.breaker.release()
+                raise
+
+    def _attempt(self, payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Make one HTTP request
+
+        Raises:
+            _RetryableError: On connection errors, timeouts and retryable statuses
+            RasaResponseError: On any other error status or an invalid body
+        """
+        self._count("requests_sent")
+        try:
+            response = self._session.post(self.webhook_url, json=payload, timeout=self.timeout)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            raise _RetryableError(f"Could not reach Rasa at {self.webhook_url}: {e}", e)
+
+        if response.status_code in RETRYABLE_STATUS_CODES:
+            raise _RetryableError(f"Rasa returned status {response.status_code}", None)
+        if response.status_code != 200:
+            raise RasaResponseError(f"Rasa returned status {response.status_code}", response.status_code)
+
+        try:
+            responses = response.json()
+        except ValueError as e:
+            raise RasaResponseError(f"Rasa returned invalid JSON: {e}", response.status_code)
+        return responses or []
+
+    def _open_stream(self, payload: Dict[str, Any]) -> requests.Response:
+        """
+        Open one streaming request and check its status
+
+        Raises:
+            _RetryableError: On connection errors, timeouts and retryable statuses
+            RasaResponseError: On any other error status
+        """
+        self._count("requests_sent")
+        try:
+            response = self._session.post(self.webhook_url, params={"stream": "true"}, json=payload,
+                                          timeout=self.timeout, stream=True)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            raise _RetryableError(f"Could not reach Rasa at {self.webhook_url}: {e}", e)
+
+        if response.status_code != 200:
+            response.close()
+            if response.status_code in RETRYABLE_STATUS_CODES:
+                raise _RetryableError(f"Rasa returned status {response.status_code}", None)
+            raise RasaResponseError(f"Rasa returned status {response.status_code}", response.status_code)
+        return response
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff delay for a retry"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _count(self, counter: str) -> None:
+        """Increment a statistics counter"""
+        with self._stats_lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+class AsyncRasaClient:
+    """
+    asyncio wrapper around RasaClient.
+
+    Each HTTP attempt runs on a small thread pool over the shared keep-alive
+    session, and retry backoff uses asyncio.sleep, so the event loop is never
+    blocked. Retry, timeout and circuit breaker behaviour is the same as
+    RasaClient.
+    """
+
+    def __init__(self, client: Optional[RasaClient] = None, max_workers: int = 10, **client_kwargs):
+        """
+        Initialize the async client
+
+        Args:
+            client: Synchronous client to share (a new one is created from
+                client_kwargs if omitted)
+            max_workers: Maximum concurrent HTTP requests
+        """
+        self.client = client or RasaClient(pool_size=max_workers, **client_kwargs)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rasa-client")
+
+    async def send_message(self, message: str, sender: str = "user") -> List[Dict[str, Any]]:
+        """
+        Send a user message to Rasa without blocking the event loop
+
+        Args:
+            message: Message text
+            sender: Conversation ID for Rasa's tracker
+
+        Returns:
+            List of bot response dictionaries
+
+        Raises:
+            RasaUnavailableError: See RasaClient.send_message
+            RasaResponseError: See RasaClient.send_message
+        """
+        client = self.client
+        payload = {"sender": sender, "message": message}
+        client._check_breaker()
+        loop = asyncio.get_running_loop()
+
+        attempt = 0
+        settled = False
+        try:
+            while True:
+                try:
+                    responses = await loop.run_in_executor(self._executor, client._attempt, payload)
+                except _RetryableError as e:
+                    if attempt >= client.max_retries:
+                        settled = True
+                        client._record_failure()
+                        raise RasaUnavailableError(str(e)) from e.cause
+                    await asyncio.sleep(client._backoff_delay(attempt))
+                    attempt += 1
+                    client._count("retries")
+                    continue
+                except Exception:
+                    settled = True
+                    client._record_failure()
+                    raise
+                settled = True
+                client.breaker.record_success()
+                return responses
+        finally:
+            # Cancelled mid-call: free the half-open trial slot, or the
+            # breaker would reject every later call
+            if not settled:
+                client.breaker.release()
+
+    def close(self) -> None:
+        """Shut down the worker threads and close pooled connections"""
+        self._executor.shutdown(wait=True)
+        self.client.close()
+
+class _RetryableError(Exception):
+    """Internal marker for a failed attempt that may be retried"""
+
+    def __init__(self, message: str, cause: Optional[BaseException]):
+        super().__init__(message)
+        self.cause = cause
@@ -0,0 +1,282 @@
+import os
+import sys
+import pickle
+import hashlib
+import tempfile
+import threading
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import CountVectorizer, TfidfTransformer
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logger = logging.getLogger(__name__)
+
+# Directory for the cached TF-IDF model, one file per database and catalog version
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                 "database", "cache")
+
+# Bump when the model layout or weighting changes so stale cache files are ignored
+MODEL_FORMAT_VERSION = 1
+
+# Term weights of each part of a career document. Skills are additionally
+# scaled by their importance (1-10) divided by 10.
+DESCRIPTION_WEIGHT = 1.0
+FIELD_WEIGHT = 2.0
+SKILL_WEIGHT = 3.0
+
+class CareerRecommender:
+    """
+    TF-IDF career recommender over the career catalog.
+
+    Each career is a weighted bag of words built from its description, field
+    name and skills. The TF-IDF matrix is stored transposed (terms x careers),
+    so scoring a query reads only the rows of the query's terms, and the top
+    results are picked with argpartition. The model is cached to disk
+    keyed by database path, catalog id and catalog version, and rebuilt when the catalog changes.
+    """
+
+    def __init__(self, db, cache_dir: Optional[str] = DEFAULT_CACHE_DIR):
+        """
+        Initialize the recommender. The model is loaded on first use.
+
+        Args:
+            db: CareerDatabase to read the catalog from
+            cache_dir: Directory for the cached model, or None to disable the disk cache
+        """
+        self.db = db
+        self.cache_dir = cache_dir
+
+        self._lock = threading.Lock()
+        self._catalog_version: Optional[int] = None
+        self._vectorizer: Optional[CountVectorizer] = None
+        self._analyzer = None
+        self._idf: Optional[np.ndarray] = None
+        self._term_matrix: Optional[sp.csr_matrix] = None
+        self._career_ids = np.zeros(0, dtype=np.int64)
+        self._career_titles: List[str] = []
+
+    def recommend(self, query: Any, limit: int = 3) -> List[Tuple[int, str, float]]:
+        """
+        Get the careers most similar to a query
+
+        Args:
+            query: Free text, or an iterable of keywords
+            limit: Maximum number of results to return
+
+        Returns:
+            List of (career_id, title, cosine similarity) tuples, best match
+            first, containing only careers that share at least one term with
+            the query
+        """
+        self._ensure_model()
+
+        text = query if isinstance(query, str) else " ".join(query)
+        if not text.strip() or limit < 1 or not self._career_titles:
+            return []
+
+        # Term ids straight from the analyzer; cheaper than a sparse transform
+        # for a single short query
+        vocabulary = self._vectorizer.vocabulary_
+        term_ids = [vocabulary[term] for term in self._analyzer(text) if term in vocabulary]
+        if not term_ids:
+            return []
+        terms, counts = np.unique(np.array(term_ids, dtype=np.int64), return_counts=True)
+        weights = counts * self._idf[terms]
+        weights /= np.sqrt(weights @ weights)
+
+        # Cosine product of the query with every career, reading only the
+        # query terms' rows of the terms x careers matrix
+        matrix = self._term_matrix
+        starts, ends = matrix.indptr[terms], matrix.indptr[terms + 1]
+        columns = np.concatenate([matrix.indices[start:end] for start, end in zip(starts, ends)])
+        values = np.concatenate([matrix.data[start:end] * weight
+                                 for start, end, weight in zip(starts, ends, weights)])
+        scores = np.bincount(columns, weights=values, minlength=matrix.shape[1])
+
+        limit = min(limit, len(scores))
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        return [(int(self._career_ids[i]), self._career_titles[i], float(scores[i]))
+                for i in top if scores[i] > 0]
+
+    def recommend_titles(self, query: Any, limit: int = 3) -> List[str]:
+        """
+        Get the titles of the careers most similar to a query
+
+        Args:
+            query: Free text, or an iterable of keywords
+            limit: Maximum number of titles to return
+
+        Returns:
+            List of career titles, best match first
+        """
+        return [title for _, title, _ in self.recommend(query, limit)]
+
+    def _ensure_model(self) -> None:
+        """Load or build the model if the catalog changed since it was built"""
+        catalog_version = self.db.get_catalog_version()
+        if catalog_version == self._catalog_version:
+            return
+
+        with self._lock:
+            if catalog_version == self._catalog_version:
+                return
+            if not self._load_cached_model(catalog_version):
+                self._build_model()
+
+    def _cache_path(self, catalog_version: int) -> Optional[str]:
+        """Path of the cache file for a catalog version of this database"""
+        if self.cache_dir is None:
+            return None
+        # The catalog id tells apart databases recreated at the same path,
+        # whose catalog versions start again from 0
+        db_key = hashlib.sha1(os.path.abspath(self.db.db_path).encode("utf-8")).hexdigest()[:12]
+        catalog_key = self.db.get_catalog_id()[:12] or "none"
+        return os.path.join(self.cache_dir,
+                            f"recommender_{db_key}_{catalog_key}_v{catalog_version}_f{MODEL_FORMAT_VERSION}.pkl")
+
+    def _load_cached_model(self, catalog_version: int) -> bool:
+        """
+        Load the model for a catalog version from the disk cache
+
+        Returns:
+            True if a cached model was loaded
+        """
+        path = self._cache_path(catalog_version)
+        if path is None or not os.path.exists(path):
+            return False
+
+        try:
+            with open(path, "rb") as f:
+                model = pickle.load(f)
+
+            # Never serve careers that are not in this catalog
+            titles = self.db.get_career_titles_by_id()
+            if any(titles.get(int(career_id)) != title
+                   for career_id, title in zip(model["career_ids"], model["career_titles"])):
+                logger.warning(f"Ignoring recommender cache {path}: its careers do not match the catalog")
+                return False
+
+            self._set_model(catalog_version, model)
+            logger.info(f"Loaded career recommender for catalog version {catalog_version} from cache")
+            return True
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable recommender cache {path}: {str(e)}")
+            return False
+
+    def _build_model(self) -> None:
+        """Build the TF-IDF model from the catalog and write it to the disk cache"""
+        catalog_version, documents = self.db.get_catalog_documents()
+        model = build_model(documents)
+        self._set_model(catalog_version, model)
+        logger.info(f"Built career recommender over {len(documents)} careers "
+                    f"for catalog version {catalog_version}")
+
+        path = self._cache_path(catalog_version)
+        if path is not None:
+            try:
+                self._write_cache(path, model)
+            except Exception as e:
+                logger.warning(f"Could not write recommender cache {path}: {str(e)}")
+
+    def _write_cache(self, path: str, model: Dict[str, Any]) -> None:
+        """Atomically write a model file and remove the other model files for this database path"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(model, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+        # Older versions, and models of an earlier database at the same path
+        prefix = "_".join(os.path.basename(path).split("_")[:2]) + "_"
+        for filename in os.listdir(self.cache_dir):
+            if filename.startswith(prefix) and filename != os.path.basename(path):
+                os.unlink(os.path.join(self.cache_dir, filename))
+
+    def _set_model(self, catalog_version: int, model: Dict[str, Any]) -> None:
+        """Install a loaded or freshly built model"""
+        self._vectorizer = model["vectorizer"]
+        self._analyzer = self._vectorizer.build_analyzer()
+        self._idf = model["idf"]
+        self._term_matrix = model["term_matrix"]
+        self._career_ids = model["career_ids"]
+        self._career_titles = model["career_titles"]
+        self._catalog_version = catalog_version
+
+def _new_vectorizer() -> CountVectorizer:
+    """Vectorizer shared by career documents and queries"""
+    return CountVectorizer(stop_words="english", ngram_range=(1, 2), lowercase=True,
+                           token_pattern=r"(?u)\b\w[\w+#]*\b", dtype=np.float32)
+
+def build_model(documents: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build the TF-IDF model for a list of career documents
+
+    Args:
+        documents: Career dictionaries from CareerDatabase.get_catalog_documents
+
+    Returns:
+        Dictionary with the fitted vectorizer, idf weights, the L2-normalized
+        terms x careers matrix, and the career ids and titles in column order
+    """
+    vectorizer = _new_vectorizer()
+    career_ids = np.array([document["id"] for document in documents], dtype=np.int64)
+    career_titles = [document["title"] for document in documents]
+    if not documents:
+        return {"vectorizer": vectorizer, "idf": np.zeros(0, dtype=np.float32),
+                "term_matrix": sp.csr_matrix((0, 0), dtype=np.float32),
+                "career_ids": career_ids, "career_titles": career_titles}
+
+    descriptions = [f"{document['title']} {document['description'] or ''}" for document in documents]
+    fields = [document["field_name"] or "" for document in documents]
+    skill_owners: List[int] = []
+    skill_weights: List[float] = []
+    skills: List[str] = []
+    for row, document in enumerate(documents):
+        for skill, importance in document["skills"]:
+            skill_owners.append(row)
+            skill_weights.append(max(importance or 0, 1) / 10)
+            skills.append(skill)
+
+    vectorizer.fit(descriptions + fields + skills)
+    counts = DESCRIPTION_WEIGHT * vectorizer.transform(descriptions)
+    counts = counts + FIELD_WEIGHT * vectorizer.transform(fields)
+    if skills:
+        # Sum each career's skill rows, scaled by importance, with one sparse product
+        owners = sp.csr_matrix((np.array(skill_weights, dtype=np.float32),
+                                (skill_owners, np.arange(len(skills)))),
+                               shape=(len(documents), len(skills)))
+        counts = counts + SKILL_WEIGHT * (owners @ vectorizer.transform(skills))
+
+    transformer = TfidfTransformer()
+    tfidf = transformer.fit_transform(counts).astype(np.float32)
+
+    return {
+        "vectorizer": vectorizer,
+        "idf": transformer.idf_.astype(np.float32),
+        "term_matrix": tfidf.T.tocsr(),
+        "career_ids": career_ids,
+        "career_titles": career_titles
+    }
+
+_default_recommender: Optional[CareerRecommender] = None
+_default_lock = threading.Lock()
+
+def get_default_recommender() -> CareerRecommender:
+    """Get a process-wide recommender over the default career database"""
+    global _default_recommender
+    with _default_lock:
+        if _default_recommender is None:
+            from database.career_db import get_default_database
+            _default_recommender = CareerRecommender(get_default_database())
+        return _default_recommender
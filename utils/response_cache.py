@@ -0,0 +1,144 @@
+import re
+import json
+import threading
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Tuple
+
+from utils.cache import TTLCache
+
+DEFAULT_RESPONSE_CACHE_SIZE = 1024
+DEFAULT_RESPONSE_CACHE_TTL = 600.0
+
+# Messages that fill slots or answer the previous bot turn change Rasa's
+# tracker, so their replies must come from Rasa itself. The REST channel does
+# not return the predicted intent, so they are recognised locally from the
+# preprocessed text; a false positive only costs a cache bypass.
+STATEFUL_INTENT_PATTERNS = {
+    'provide_name': r"\b(?:my name|call me|i am called|im called|this is)\b",
+    'provide_interest': r"\b(?:i like|i love|i enjoy|im interested|i am interested|my interests?|my hobby|my hobbies)\b",
+    'provide_experience': r"\b(?:\d+ (?:years?|months?)|i worked|i have worked|ive worked|my experience)\b",
+    'provide_education': r"\b(?:i studied|i graduated|i have a|i hold|im studying|i am studying|my degree|my major)\b",
+    'provide_skills': r"\b(?:i know|i can|my skills?|im good at|i am good at)\b",
+    'provide_goals': r"\b(?:my goals?|my plan)\b",
+    'provide_personality': r"\b(?:im an? |i am an? |im very|i am very)\b",
+    'provide_feedback': r"\b(?:that was|this was|that is|this is) (?:helpful|useful|not helpful|useless)\b",
+    'affirm': r"^(?:y|yes|yeah|yep|yup|sure|ok|okay|of course|definitely|absolutely|please do)$",
+    'deny': r"^(?:n|no|nope|nah|not really|no thanks|never mind)$",
+    'restart': r"^(?:restart|start over|reset)$"
+}
+STATEFUL_INTENTS = frozenset(STATEFUL_INTENT_PATTERNS)
+
+_STATEFUL_INTENT_REGEX = re.compile(
+    "|".join(f"(?P<{intent}>{pattern})" for intent, pattern in STATEFUL_INTENT_PATTERNS.items()))
+
+def detect_stateful_intent(processed_text: str) -> Optional[str]:
+    """
+    Check whether a message looks like one of the stateful intents
+
+    Args:
+        processed_text: Message normalized by preprocess_text
+
+    Returns:
+        Name of the first stateful intent matched, or None
+    """
+    match = _STATEFUL_INTENT_REGEX.search(processed_text)
+    return match.lastgroup if match else None
+
+def conversation_state(user_profile: Mapping[str, Any]) -> Tuple[bool, Tuple[str, ...]]:
+    """
+    Get the parts of the conversation state that change Rasa's reply
+
+    Rasa greets a user differently once it knows their name, and its
+    suggestions depend on the interests collected so far.
+
+    Args:
+        user_profile: Session user profile
+
+    Returns:
+        Hashable state: whether a name is known, and the sorted interests
+    """
+    return bool(user_profile.get('name')), tuple(sorted(user_profile.get('interests') or []))
+
+def custom_payload(response: Mapping[str, Any]) -> Dict[str, Any]:
+    """Decode a bot response's custom payload, which may be a JSON string"""
+    custom = response.get("custom")
+    if isinstance(custom, str):
+        try:
+            custom = json.loads(custom)
+        except ValueError:
+            return {}
+    return custom if isinstance(custom, dict) else {}
+
+class ResponseCache:
+    """
+    TTL + LRU cache of Rasa replies to repeated messages.
+
+    Keyed by the preprocessed message text and the conversation state.
+    Messages matching a stateful intent are never served from or stored in
+    the cache, and neither are replies that carry a user's name.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_RESPONSE_CACHE_SIZE, ttl: float = DEFAULT_RESPONSE_CACHE_TTL):
+        """
+        Initialize the cache
+
+        Args:
+            max_size: Maximum number of cached replies
+            ttl: Seconds a reply stays valid after it is stored
+        """
+        self._cache = TTLCache(max_size, ttl)
+        self._lock = threading.Lock()
+        self.bypassed = 0
+
+    def get(self, processed_text: str, state: Hashable) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get the cached reply to a message
+
+        Args:
+            processed_text: Message normalized by preprocess_text
+            state: Conversation state from conversation_state
+
+        Returns:
+            List of bot response dictionaries, or None on a miss or for a
+            stateful message. Cached replies are shared and must not be mutated.
+        """
+        if not processed_text or detect_stateful_intent(processed_text):
+            with self._lock:
+                self.bypassed += 1
+            return None
+        return self._cache.get((processed_text, state))
+
+    def put(self, processed_text: str, state: Hashable, responses: List[Dict[str, Any]]) -> bool:
+        """
+        Store the reply to a message if it is cacheable
+
+        Args:
+            processed_text: Message normalized by preprocess_text
+            state: Conversation state the reply was produced in
+            responses: Bot response dictionaries from Rasa
+
+        Returns:
+            True if the reply was stored
+        """
+        if not processed_text or not responses or detect_stateful_intent(processed_text):
+            return False
+        if any("name" in custom_payload(response) for response in responses):
+            return False
+        self._cache.put((processed_text, state), list(responses))
+        return True
+
+    def clear(self) -> None:
+        """Drop all cached replies (counters are kept)"""
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with TTLCache statistics plus the number of stateful
+            messages that bypassed the cache
+        """
+        stats = self._cache.stats()
+        with self._lock:
+            stats['bypassed'] = self.bypassed
+        return stats
@@ -1,6 +1,25 @@
-from textblob import TextBlob
 import re
-from typing import Dict, Any, Tuple
+import os
+import sys
+import logging
+from functools import lru_cache, partial
+from typing import Dict, Any, Tuple, Iterable, List, NamedTuple, Optional
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.batch import map_in_processes, DEFAULT_CHUNK_SIZE
+from utils.sentiment_lexicon import lexicon_polarity, lexicon_polarity_batch
+
+logger = logging.getLogger(__name__)
+
+# Environment variable selecting the polarity backend
+SENTIMENT_BACKEND_ENV_VAR = "CAREER_COUNSELOR_SENTIMENT_BACKEND"
+
+# Available polarity backends: TextBlob's pattern analyzer, or the compact
+# word lexicon in utils.sentiment_lexicon
+SENTIMENT_BACKENDS = ('textblob', 'lexicon')
+DEFAULT_SENTIMENT_BACKEND = 'textblob'
 
 # Emotion indicators
 POSITIVE_EMOTIONS = [
@@ -21,34 +40,108 @@ NEUTRAL_EMOTIONS = [
     'understanding', 'seeking', 'looking', 'searching', 'trying'
 ]
 
-def analyze_sentiment(text: str) -> str:
+# Number of distinct messages whose emotion counts and sentiment are memoized
+EMOTION_CACHE_SIZE = 4096
+
+# Indicator word -> emotion category
+_EMOTION_CATEGORIES = {
+    **{word: 'neutral' for word in NEUTRAL_EMOTIONS},
+    **{word: 'negative' for word in NEGATIVE_EMOTIONS},
+    **{word: 'positive' for word in POSITIVE_EMOTIONS}
+}
+
+# Whole-word forms of each indicator, allowing plain -s/-d/-ed endings
+# ("enjoys", "loved"), so words that merely contain an indicator ("glove",
+# "lostness") never match
+_EMOTION_FORMS: Dict[str, str] = {}
+for _word in _EMOTION_CATEGORIES:
+    for _suffix in ('', 's', 'es', 'd', 'ed'):
+        _EMOTION_FORMS.setdefault(_word + _suffix, _word)
+
+_WORD_PATTERN = re.compile(r"[a-z]+")
+
+class EmotionCounts(NamedTuple):
+    """Distinct emotion indicator words found in a message, per category"""
+    positive: int
+    negative: int
+    neutral: int
+
+def get_sentiment_backend() -> str:
     """
-    Analyze the sentiment of the given text.
+    Get the configured polarity backend
+    
+    Returns:
+        Backend name from CAREER_COUNSELOR_SENTIMENT_BACKEND, or the default
+        if it is unset or unknown
+    """
+    backend = os.environ.get(SENTIMENT_BACKEND_ENV_VAR, DEFAULT_SENTIMENT_BACKEND).strip().lower()
+    if backend not in SENTIMENT_BACKENDS:
+        logger.warning(f"Unknown sentiment backend '{backend}', using {DEFAULT_SENTIMENT_BACKEND}")
+        return DEFAULT_SENTIMENT_BACKEND
+    return backend
+
+def _resolve_backend(backend: Optional[str]) -> str:
+    """Validate an explicit backend name, or fall back to the configured one"""
+    if backend is None:
+        return get_sentiment_backend()
+    if backend not in SENTIMENT_BACKENDS:
+        raise ValueError(f"Unknown sentiment backend '{backend}', expected one of {SENTIMENT_BACKENDS}")
+    return backend
+
+def textblob_polarity(text: str) -> float:
+    """Get the polarity of a text from TextBlob's pattern analyzer"""
+    # Imported lazily so the lexicon backend never loads TextBlob
+    from textblob import TextBlob
+    return TextBlob(text).sentiment.polarity
+
+def get_polarity(text: str, backend: Optional[str] = None) -> float:
+    """
+    Get the raw polarity of a text.
     
     Args:
-        text: The text to analyze
+        text: The text to score
+        backend: 'textblob' or 'lexicon' (defaults to the configured backend)
         
     Returns:
-        Sentiment category: 'positive', 'negative', or 'neutral'
+        Polarity between -1.0 and 1.0
     """
-    if not text:
-        return 'neutral'
-    
-    # Use TextBlob for sentiment analysis
-    blob = TextBlob(text)
-    polarity = blob.sentiment.polarity
+    if _resolve_backend(backend) == 'lexicon':
+        return lexicon_polarity(text)
+    return textblob_polarity(text)
+
+@lru_cache(maxsize=EMOTION_CACHE_SIZE)
+def count_emotions(text: str) -> EmotionCounts:
+    """
+    Count the emotion indicator words in a message in a single pass.
     
-    # Check for explicit emotion words
-    text_lower = text.lower()
+    Results are memoized per message, so analyze_sentiment and
+    extract_emotion_indicators share one scan of the same text.
     
-    # Count emotion indicators
-    positive_count = sum(1 for word in POSITIVE_EMOTIONS if word in text_lower)
-    negative_count = sum(1 for word in NEGATIVE_EMOTIONS if word in text_lower)
+    Args:
+        text: Message to scan
+        
+    Returns:
+        EmotionCounts with the number of distinct indicator words per category
+    """
+    counts = {'positive': 0, 'negative': 0, 'neutral': 0}
+    words = _EMOTION_FORMS.keys() & set(_WORD_PATTERN.findall(text.lower()))
+    for indicator in {_EMOTION_FORMS[word] for word in words}:
+        counts[_EMOTION_CATEGORIES[indicator]] += 1
+    return EmotionCounts(**counts)
+
+def clear_sentiment_cache() -> None:
+    """Forget all memoized emotion counts and sentiment results"""
+    count_emotions.cache_clear()
+    _analyze_sentiment_cached.cache_clear()
+
+def _categorize(text: str, polarity: float) -> str:
+    """Adjust a polarity for explicit emotion words and map it to a category"""
+    emotions = count_emotions(text)
     
     # Adjust polarity based on explicit emotion words
-    if positive_count > negative_count:
+    if emotions.positive > emotions.negative:
         polarity += 0.2
-    elif negative_count > positive_count:
+    elif emotions.negative > emotions.positive:
         polarity -= 0.2
     
     # Determine sentiment category
@@ -59,6 +152,56 @@ def analyze_sentiment(text: str) -> str:
     else:
         return 'neutral'
 
+def analyze_sentiment(text: str, backend: Optional[str] = None) -> str:
+    """
+    Analyze the sentiment of the given text.
+    
+    Args:
+        text: The text to analyze
+        backend: 'textblob' or 'lexicon' (defaults to the configured backend)
+        
+    Returns:
+        Sentiment category: 'positive', 'negative', or 'neutral'
+    """
+    if not text:
+        return 'neutral'
+    
+    return _analyze_sentiment_cached(text, _resolve_backend(backend))
+
+@lru_cache(maxsize=EMOTION_CACHE_SIZE)
+def _analyze_sentiment_cached(text: str, backend: str) -> str:
+    """Memoized sentiment of a message for a resolved backend"""
+    return _categorize(text, get_polarity(text, backend))
+
+def analyze_sentiment_batch(texts: Iterable[str], workers: Optional[int] = None,
+                            chunk_size: int = DEFAULT_CHUNK_SIZE,
+                            backend: Optional[str] = None) -> List[str]:
+    """
+    Analyze the sentiment of many messages.
+    
+    The TextBlob backend fans out to a process pool. The lexicon backend is
+    cheap enough to score the whole batch in-process with array arithmetic,
+    so workers and chunk_size are ignored for it.
+    
+    Args:
+        texts: Messages to analyze
+        workers: Number of worker processes (defaults to the CPU count)
+        chunk_size: Number of messages sent to a worker at a time
+        backend: 'textblob' or 'lexicon' (defaults to the configured backend)
+        
+    Returns:
+        List of analyze_sentiment results, in input order
+    """
+    backend = _resolve_backend(backend)
+    if backend == 'lexicon':
+        texts = list(texts)
+        polarities = lexicon_polarity_batch(texts)
+        return [_categorize(text, float(polarity)) if text else 'neutral'
+                for text, polarity in zip(texts, polarities)]
+    
+    return map_in_processes(partial(analyze_sentiment, backend=backend), texts,
+                            workers=workers, chunk_size=chunk_size)
+
 def get_response_tone(sentiment: str) -> Dict[str, Any]:
     """
     Get appropriate response tone based on detected sentiment.
@@ -158,15 +301,10 @@ def extract_emotion_indicators(text: str) -> Dict[str, float]:
     Returns:
         Dictionary with emotion scores
     """
-    text_lower = text.lower()
-    
-    # Count emotion indicators
-    positive_count = sum(1 for word in POSITIVE_EMOTIONS if word in text_lower)
-    negative_count = sum(1 for word in NEGATIVE_EMOTIONS if word in text_lower)
-    neutral_count = sum(1 for word in NEUTRAL_EMOTIONS if word in text_lower)
+    emotions = count_emotions(text)
     
     # Calculate total and percentages
-    total = positive_count + negative_count + neutral_count
+    total = sum(emotions)
     if total == 0:
         return {
             'positive': 0.33,
@@ -175,7 +313,7 @@ def extract_emotion_indicators(text: str) -> Dict[str, float]:
         }
     
     return {
-        'positive': positive_count / total,
-        'negative': negative_count / total,
-        'neutral': neutral_count / total
+        'positive': emotions.positive / total,
+        'negative': emotions.negative / total,
+        'neutral': emotions.neutral / total
     }
\ No newline at end of file
@@ -0,0 +1,153 @@
+import re
+from typing import Dict, FrozenSet, List, Sequence
+
+import numpy as np
+
+# Polarity of sentiment-bearing words, on TextBlob's -1.0 to 1.0 scale and
+# tuned to the vocabulary of career conversations
+POLARITY_LEXICON: Dict[str, float] = {
+    # Positive
+    'good': 0.7, 'great': 0.8, 'excellent': 1.0, 'amazing': 0.6, 'awesome': 1.0,
+    'wonderful': 1.0, 'fantastic': 0.4, 'perfect': 1.0, 'best': 1.0, 'better': 0.5,
+    'nice': 0.6, 'fine': 0.4, 'cool': 0.35, 'fun': 0.3, 'brilliant': 0.9,
+    'happy': 0.8, 'glad': 0.5, 'excited': 0.4, 'exciting': 0.3, 'enthusiastic': 0.5,
+    'passionate': 0.5, 'passion': 0.4, 'love': 0.5, 'loved': 0.7, 'loving': 0.6,
+    'like': 0.2, 'enjoy': 0.4, 'enjoyed': 0.4, 'enjoying': 0.4, 'interested': 0.25,
+    'interesting': 0.5, 'curious': 0.2, 'fascinated': 0.5, 'fascinating': 0.6,
+    'confident': 0.5, 'optimistic': 0.5, 'hopeful': 0.4, 'motivated': 0.4,
+    'inspired': 0.5, 'inspiring': 0.5, 'eager': 0.4, 'determined': 0.3,
+    'thrilled': 0.6, 'delighted': 0.7, 'pleased': 0.5, 'grateful': 0.6,
+    'thankful': 0.5, 'thanks': 0.2, 'helpful': 0.5, 'useful': 0.3, 'valuable': 0.4,
+    'successful': 0.75, 'success': 0.4, 'rewarding': 0.6, 'satisfying': 0.5,
+    'satisfied': 0.5, 'fulfilling': 0.5, 'proud': 0.8, 'ready': 0.2, 'sure': 0.5,
+    'clear': 0.1, 'easy': 0.4, 'stable': 0.3, 'secure': 0.3, 'promising': 0.5,
+    'strong': 0.4, 'talented': 0.6, 'skilled': 0.5, 'creative': 0.5, 'smart': 0.2,
+    'dream': 0.3, 'ideal': 0.5, 'favorite': 0.5, 'favourite': 0.5, 'right': 0.3,
+    'well': 0.3, 'lucky': 0.5, 'positive': 0.3, 'impressive': 0.8, 'beautiful': 0.85,
+    'incredible': 0.9, 'superb': 1.0, 'outstanding': 0.8, 'remarkable': 0.75,
+    'high': 0.16, 'top': 0.5, 'growing': 0.2, 'flexible': 0.3, 'free': 0.4,
+    # Negative
+    'bad': -0.7, 'terrible': -1.0, 'awful': -1.0, 'horrible': -1.0, 'worst': -1.0,
+    'worse': -0.4, 'poor': -0.4, 'boring': -1.0, 'bored': -0.5, 'hate': -0.8,
+    'hated': -0.9, 'dislike': -0.4, 'sad': -0.5, 'unhappy': -0.6, 'depressed': -0.6,
+    'depressing': -0.6, 'miserable': -0.8, 'confused': -0.4, 'confusing': -0.4,
+    'uncertain': -0.2, 'unsure': -0.3, 'lost': -0.3, 'worried': -0.4, 'worry': -0.3,
+    'anxious': -0.3, 'nervous': -0.3, 'stressed': -0.5, 'stressful': -0.5,
+    'stress': -0.3, 'overwhelmed': -0.5, 'overwhelming': -0.4, 'frustrated': -0.7,
+    'frustrating': -0.6, 'disappointed': -0.75, 'disappointing': -0.6,
+    'discouraged': -0.5, 'afraid': -0.6, 'scared': -0.5, 'scary': -0.5,
+    'fear': -0.4, 'concerned': -0.2, 'doubtful': -0.3, 'hesitant': -0.2,
+    'stuck': -0.4, 'hopeless': -0.8, 'useless': -0.5, 'difficult': -0.5,
+    'hard': -0.3, 'tough': -0.4, 'impossible': -0.67, 'wrong': -0.5, 'fail': -0.5,
+    'failed': -0.5, 'failing': -0.5, 'failure': -0.6, 'tired': -0.4, 'exhausted': -0.5,
+    'burnout': -0.6, 'low': -0.2, 'unemployed': -0.4, 'rejected': -0.5,
+    'stupid': -0.8, 'annoying': -0.6, 'angry': -0.5, 'upset': -0.6, 'lonely': -0.5,
+    'weak': -0.4, 'unstable': -0.4, 'pointless': -0.5, 'dead': -0.2, 'sick': -0.7,
+    'struggle': -0.4, 'struggling': -0.4, 'problem': -0.2, 'problems': -0.2,
+    'negative': -0.3, 'unfortunately': -0.5, 'sorry': -0.5
+}
+
+# Words that flip the polarity of the next few sentiment words
+NEGATIONS: FrozenSet[str] = frozenset({
+    'not', 'no', 'never', 'nothing', 'nobody', 'none', 'neither', 'nor',
+    'cannot', 'without', 'hardly', 'barely'
+})
+
+# Multipliers applied to the next sentiment word
+INTENSIFIERS: Dict[str, float] = {
+    'very': 1.3, 'really': 1.3, 'so': 1.3, 'extremely': 1.5, 'super': 1.4,
+    'incredibly': 1.5, 'totally': 1.3, 'completely': 1.4, 'absolutely': 1.5,
+    'truly': 1.3, 'highly': 1.3, 'deeply': 1.3, 'too': 1.2, 'quite': 1.1,
+    'pretty': 1.1, 'more': 1.1, 'most': 1.3,
+    'somewhat': 0.7, 'slightly': 0.5, 'little': 0.6, 'bit': 0.6, 'kinda': 0.7,
+    'kind': 0.8, 'sort': 0.8, 'less': 0.6
+}
+
+# Number of tokens after a negation that it applies to
+NEGATION_SCOPE = 3
+
+# Negated words keep half their strength with the opposite sign
+NEGATION_FACTOR = -0.5
+
+# Words (with contractions kept whole) and clause-ending punctuation, which
+# closes a negation scope
+_TOKEN_PATTERN = re.compile(r"[a-z]+(?:'[a-z]+)?|[.,;:!?]")
+_CLAUSE_BREAKS = frozenset('.,;:!?')
+
+def score_terms(text: str) -> List[float]:
+    """
+    Score each sentiment-bearing word of a text.
+
+    Intensifiers scale the next sentiment word, and a negation flips the
+    sentiment words within NEGATION_SCOPE tokens of it, up to the end of
+    the clause.
+
+    Args:
+        text: Text to score
+
+    Returns:
+        List of adjusted word polarities, empty if the text has none
+    """
+    scores = []
+    multiplier = 1.0
+    negated_until = -1
+    for i, token in enumerate(_TOKEN_PATTERN.findall(text.lower())):
+        if token in _CLAUSE_BREAKS:
+            multiplier = 1.0
+            negated_until = -1
+        elif token in NEGATIONS or token.endswith("n't"):
+            negated_until = i + NEGATION_SCOPE
+        elif token in INTENSIFIERS:
+            multiplier *= INTENSIFIERS[token]
+        else:
+            polarity = POLARITY_LEXICON.get(token)
+            if polarity is not None:
+                score = polarity * multiplier
+                if i <= negated_until:
+                    score *= NEGATION_FACTOR
+                scores.append(score)
+                multiplier = 1.0
+    return scores
+
+def lexicon_polarity(text: str) -> float:
+    """
+    Get the polarity of a text from the lexicon.
+
+    Args:
+        text: Text to score
+
+    Returns:
+        Mean adjusted word polarity clipped to [-1.0, 1.0], or 0.0 if the text
+        has no sentiment-bearing words
+    """
+    scores = score_terms(text)
+    if not scores:
+        return 0.0
+    return max(-1.0, min(1.0, sum(scores) / len(scores)))
+
+def lexicon_polarity_batch(texts: Sequence[str]) -> np.ndarray:
+    """
+    Get lexicon polarities for many texts at once.
+
+    Word scores of every text are gathered into one flat array and reduced
+    per text with bincount, so the arithmetic runs once for the whole batch.
+
+    Args:
+        texts: Texts to score
+
+    Returns:
+        Array of polarities, one per text, equal to lexicon_polarity
+    """
+    flat: List[float] = []
+    lengths: List[int] = []
+    for text in texts:
+        scores = score_terms(text)
+        flat.extend(scores)
+        lengths.append(len(scores))
+
+    counts = np.array(lengths, dtype=np.int64)
+    owners = np.repeat(np.arange(len(counts)), counts)
+
+    sums = np.bincount(owners, weights=flat, minlength=len(counts))
+    polarities = np.divide(sums, counts, out=np.zeros(len(counts)), where=counts > 0)
+    return np.clip(polarities, -1.0, 1.0)